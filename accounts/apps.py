@@ -5,3 +5,7 @@ from django.apps import AppConfig
 class AccountsConfig(AppConfig):  # pylint: disable=missing-class-docstring
     default_auto_field = "django.db.models.BigAutoField"
     name = "accounts"
+
+    def ready(self):
+        # register the signal handlers
+        from . import signals  # pylint: disable=import-outside-toplevel,unused-import
@@ -0,0 +1,46 @@
+"""
+Token authentication with the token-to-user lookups cached.
+
+A cache hit authenticates an API request without any query. The entries
+expire after `TOKEN_AUTH_CACHE_TIMEOUT` seconds and are deleted whenever
+a token is deleted (e.g. the `dj_rest_auth` logout), its user is saved
+(e.g. deactivated) or logs out (see `accounts.signals`).
+"""
+import hashlib
+from typing import Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+
+def get_token_cache_key(key: str) -> str:
+    """Returns the cache key of the token `key`, without the token itself"""
+    digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+    return f"accounts:token:{digest}"
+
+
+def invalidate_tokens(keys: Iterable[str]) -> None:
+    """Deletes the cached lookups of the token `keys`"""
+    cache.delete_many([get_token_cache_key(key) for key in keys])
+
+
+def invalidate_user_tokens(user_id: int) -> None:
+    """Deletes the cached lookups of the tokens of the user"""
+    invalidate_tokens(
+        Token.objects.filter(user_id=user_id).values_list("key", flat=True)
+    )
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """`TokenAuthentication` which caches the `(user, token)` of every valid token"""
+
+    def authenticate_credentials(self, key):
+        cache_key = get_token_cache_key(key)
+        credentials = cache.get(cache_key)
+        if credentials is None:
+            # raises `AuthenticationFailed` for unknown tokens or inactive users
+            credentials = super().authenticate_credentials(key)
+            cache.set(cache_key, credentials, settings.TOKEN_AUTH_CACHE_TIMEOUT)
+        return credentials
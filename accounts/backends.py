@@ -0,0 +1,36 @@
+"""
+Authentication backend with the users of the sessions cached.
+
+Together with the `cached_db` sessions, a logged-in request resolves its
+session and `request.user` without any query. A cached user expires after
+`USER_CACHE_TIMEOUT` seconds and is deleted whenever the user is saved
+(e.g. a password change or a deactivation), deleted or logs out
+(see `accounts.signals`).
+"""
+from django.conf import settings
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+
+
+def get_user_cache_key(user_id) -> str:
+    """Returns the cache key of the user"""
+    return f"accounts:user:{user_id}"
+
+
+def invalidate_user(user_id) -> None:
+    """Deletes the cached user"""
+    cache.delete(get_user_cache_key(user_id))
+
+
+class CachedModelBackend(ModelBackend):
+    """`ModelBackend` which loads the users of the sessions from the cache"""
+
+    def get_user(self, user_id):
+        key = get_user_cache_key(user_id)
+        user = cache.get(key)
+        if user is None:
+            # `None` for unknown or inactive users, which aren't cached
+            user = super().get_user(user_id)
+            if user is not None:
+                cache.set(key, user, settings.USER_CACHE_TIMEOUT)
+        return user
@@ -0,0 +1,44 @@
+"""Signal handlers invalidating the cached users and token lookups"""
+from django.contrib.auth import get_user_model
+from django.contrib.auth.signals import user_logged_out
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from .authentication import invalidate_tokens, invalidate_user_tokens
+from .backends import invalidate_user
+
+
+@receiver(post_save, sender=Token)
+@receiver(post_delete, sender=Token)
+def on_token_changed(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """A deleted (e.g. on logout) or changed token isn't authenticated from the cache"""
+    invalidate_tokens([instance.key])
+
+
+@receiver(post_save, sender=get_user_model())
+@receiver(post_delete, sender=get_user_model())
+def on_user_changed(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """A changed (e.g. deactivated) or deleted user is loaded again"""
+    invalidate_user(instance.pk)
+
+
+@receiver(post_save, sender=get_user_model())
+def on_user_saved(
+    sender, instance, created, update_fields, **kwargs
+):  # pylint: disable=unused-argument
+    """
+    The tokens of a changed (e.g. deactivated) user are authenticated again,
+    except when only the `last_login` of the login was updated
+    """
+    if created or update_fields == frozenset(["last_login"]):
+        return
+    invalidate_user_tokens(instance.pk)
+
+
+@receiver(user_logged_out)
+def on_user_logged_out(sender, user, **kwargs):  # pylint: disable=unused-argument
+    """A logged out user is loaded again on the next login or token authentication"""
+    if user is not None:
+        invalidate_user(user.pk)
+        invalidate_user_tokens(user.pk)
@@ -0,0 +1,64 @@
+"""API pagination classes"""
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from movies.pagination import InvalidCursor, paginate_keyset
+
+
+class KeysetCursorPagination(BasePagination):
+    """
+    Cursor pagination over the ordering of the view's queryset
+    (with the `id` as a tie-breaker), without any `COUNT(*)`.
+    Responses look like: `{"next": <url or null>, "results": [...]}`
+    """
+
+    cursor_query_param = "cursor"
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+    def __init__(self):
+        self.request = None
+        self.next_cursor = None
+
+    def get_page_size(self, request) -> int:
+        """Returns the requested page size bounded by `max_page_size`"""
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(page_size, 1), self.max_page_size)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        try:
+            page = paginate_keyset(
+                queryset,
+                cursor=request.query_params.get(self.cursor_query_param),
+                page_size=self.get_page_size(request),
+            )
+        except InvalidCursor as error:
+            raise NotFound("Invalid cursor") from error
+        self.next_cursor = page.next_cursor
+        return page.items
+
+    def get_next_link(self):
+        """Returns the url of the next page if there is one"""
+        if self.next_cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
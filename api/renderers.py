@@ -0,0 +1,38 @@
+"""
+API renderers.
+
+`FastJSONRenderer` encodes with `orjson`, when it's installed, and gives
+the same bytes as the `rest_framework` `JSONRenderer` for the payloads
+of this API. The datetimes and the types `orjson` doesn't know go through
+the `rest_framework` encoder (floats are encoded from `orjson` though).
+"""
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+class FastJSONRenderer(JSONRenderer):  # pylint: disable=missing-class-docstring
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        # only the default compact/unicode output is supported
+        if (
+            orjson is None
+            or data is None
+            or indent is not None
+            or not self.compact
+            or self.ensure_ascii
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        content = orjson.dumps(
+            data,
+            default=self.encoder_class().default,
+            option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+        )
+        # same escaping of the line/paragraph separators as the `JSONRenderer`
+        return content.replace("\u2028".encode(), b"\\u2028").replace(
+            "\u2029".encode(), b"\\u2029"
+        )
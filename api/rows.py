@@ -0,0 +1,87 @@
+"""
+Plain-rows read path of the movies API.
+
+The list/detail `GET` requests select only the columns of the requested
+fields with `values()` and build the `MovieSerializer` payload from the
+rows, without any model instances or field by field serialization.
+"""
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import QuerySet
+
+from movies.models import Movie, Reaction
+
+from .serializers import MovieSerializer
+
+# the `author` is expanded from these joined columns
+AUTHOR_COLUMNS = {"id": "author__id", "username": "author__username"}
+REACTORS = {"likes": Reaction.LIKE, "dislikes": Reaction.DISLIKE}
+
+
+class MovieRows:
+    """
+    Same payload as the `serializer` fields (in the same order),
+    from the plain rows of the movies
+    """
+
+    def __init__(self, serializer: MovieSerializer):
+        self.fields = list(serializer.fields)
+        concrete = {
+            field.name
+            for field in Movie._meta.concrete_fields  # pylint: disable=protected-access
+        }
+        unsupported = set(self.fields) - concrete - {"author", *REACTORS}
+        if unsupported:
+            raise ImproperlyConfigured(
+                f"No plain-rows representation for the fields {sorted(unsupported)}"
+            )
+        # the `id` is needed for the reactors and the pagination cursor
+        self.columns = ["id"] + [
+            name for name in self.fields if name in concrete and name != "id"
+        ]
+        if "author" in self.fields:
+            self.columns += AUTHOR_COLUMNS.values()
+
+    def values(self, queryset: QuerySet) -> QuerySet:
+        """
+        Returns the `queryset` of the movies as the rows of the needed columns,
+        with its annotations (e.g. the `search_rank` of the ordering)
+        """
+        return queryset.values(*self.columns, *queryset.query.annotations)
+
+    def get_reactors(self, movie_ids: List[int]) -> Dict[Tuple[int, int], List[int]]:
+        """
+        Returns the user ids per movie id and reaction value,
+        in the order of the reactions, with a single query
+        """
+        reactors = defaultdict(list)
+        if not set(REACTORS) & set(self.fields):
+            return reactors
+        reactions = (
+            Reaction.objects.filter(movie_id__in=movie_ids)
+            .order_by("id")
+            .values_list("movie_id", "value", "user_id")
+        )
+        for movie_id, value, user_id in reactions:
+            reactors[(movie_id, value)].append(user_id)
+        return reactors
+
+    def to_representation(self, rows: List[dict]) -> List[dict]:
+        """Returns the payload of every row"""
+        reactors = self.get_reactors([row["id"] for row in rows])
+        data = []
+        for row in rows:
+            item = {}
+            for name in self.fields:
+                if name == "author":
+                    item[name] = {
+                        key: row[column] for key, column in AUTHOR_COLUMNS.items()
+                    }
+                elif name in REACTORS:
+                    item[name] = reactors.get((row["id"], REACTORS[name]), [])
+                else:
+                    item[name] = row[name]
+            data.append(item)
+        return data
@@ -0,0 +1,193 @@
+"""
+Precomputed OpenAPI document of the API.
+
+Introspecting all the views and serializers is expensive, so the document
+is generated once per deploy with `./manage.py generate_openapi_schema`
+into `OPENAPI_SCHEMA_PATH`, or else on the first request, and served from
+memory with its content hash as the `ETag`. The `swagger/` and `redoc/`
+pages load it from the `openapi.json` endpoint.
+
+The document is stamped with the hash of what it's generated from (the
+routes, the code of the project, the API settings and the versions of the
+libraries), so a file left over from a previous deploy is generated again
+instead of being served.
+"""
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from importlib import import_module
+from importlib.metadata import version
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional
+
+from django.apps import apps
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+from django.urls import get_resolver
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import condition, require_safe
+from drf_yasg import openapi
+from drf_yasg.codecs import OpenAPICodecJson
+from drf_yasg.generators import OpenAPISchemaGenerator
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_INFO = openapi.Info(
+    title="Movierama API",
+    description="API for movies",
+    default_version="v1",
+    contact=openapi.Contact(email="johnplitharas@gmail.com"),
+    license=openapi.License(name="BSD License"),
+)
+# seconds the clients may use the document before revalidating it
+SCHEMA_MAX_AGE = 5 * 60
+# the key of the document with the hash of its code
+SCHEMA_STAMP_KEY = "x-source-stamp"
+# the libraries and the settings the document is generated with
+SCHEMA_DISTRIBUTIONS = (
+    "Django",
+    "djangorestframework",
+    "drf-yasg",
+    "dj-rest-auth",
+    "django-allauth",
+)
+SCHEMA_SETTINGS = (
+    "REST_FRAMEWORK",
+    "SWAGGER_SETTINGS",
+    "REST_AUTH_SERIALIZERS",
+    "REST_AUTH_REGISTER_SERIALIZERS",
+    "REST_USE_JWT",
+)
+
+
+@dataclass(frozen=True)
+class SchemaDocument:  # pylint: disable=missing-class-docstring
+    content: bytes
+    etag: str
+
+    @classmethod
+    def from_content(cls, content: bytes) -> "SchemaDocument":
+        """Returns the document with the quoted hash of its `content` as `etag`"""
+        digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+        return cls(content=content, etag=f'"{digest}"')
+
+
+_document: Optional[SchemaDocument] = None
+
+
+def _get_routes(patterns: Iterable, prefix: str = "") -> Iterator[str]:
+    """Returns the route and the view of every resolved URL pattern"""
+    for pattern in patterns:
+        route = prefix + str(pattern.pattern)
+        if hasattr(pattern, "url_patterns"):
+            yield from _get_routes(pattern.url_patterns, route)
+        else:
+            yield f"{route} {pattern.lookup_str}"
+
+
+def _get_project_sources() -> List[Path]:
+    """
+    Returns the modules of the project apps, of the `api` and of the URL conf,
+    but the migrations
+    """
+    base_dir = Path(settings.BASE_DIR)
+    roots = {
+        Path(app.path)
+        for app in apps.get_app_configs()
+        if base_dir in Path(app.path).parents
+    }
+    roots.add(Path(__file__).parent)
+    roots.add(Path(import_module(settings.ROOT_URLCONF).__file__).parent)
+    return sorted(
+        source
+        for root in roots
+        for source in root.rglob("*.py")
+        if "migrations" not in source.parts
+    )
+
+
+def get_source_stamp() -> str:
+    """
+    Returns the hash of what the document is generated from: the resolved
+    routes, the modules of the project, the API settings and the versions
+    of the libraries
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for route in _get_routes(get_resolver().url_patterns):
+        digest.update(route.encode())
+    for source in _get_project_sources():
+        digest.update(source.read_bytes())
+    schema_settings = {name: getattr(settings, name, None) for name in SCHEMA_SETTINGS}
+    digest.update(json.dumps(schema_settings, sort_keys=True, default=str).encode())
+    for distribution in SCHEMA_DISTRIBUTIONS:
+        digest.update(f"{distribution}=={version(distribution)}".encode())
+    return digest.hexdigest()
+
+
+def _read_stamp(content: bytes) -> Optional[str]:
+    """Returns the stamp of the document `content`, if any"""
+    try:
+        return json.loads(content).get(SCHEMA_STAMP_KEY)
+    except (ValueError, AttributeError):
+        return None
+
+
+def generate_schema() -> bytes:
+    """
+    Returns the OpenAPI document of all the public endpoints, as JSON,
+    stamped with the hash of its code
+    """
+    generator = OpenAPISchemaGenerator(SCHEMA_INFO)
+    schema = generator.get_schema(request=None, public=True)
+    schema[SCHEMA_STAMP_KEY] = get_source_stamp()
+    return OpenAPICodecJson(validators=[]).encode(schema)
+
+
+def write_schema(path: Path) -> SchemaDocument:
+    """Generates the document into the file `path`"""
+    document = SchemaDocument.from_content(generate_schema())
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(document.content)
+    return document
+
+
+def get_schema_document() -> SchemaDocument:
+    """
+    Returns the document of this process, loaded from `OPENAPI_SCHEMA_PATH`
+    or generated once when there is no such file or it's stale
+    """
+    global _document  # pylint: disable=global-statement
+    if _document is None:
+        path = Path(settings.OPENAPI_SCHEMA_PATH)
+        if not path.is_file():
+            logger.info("No precomputed OpenAPI document at %s, generating it", path)
+        else:
+            content = path.read_bytes()
+            if _read_stamp(content) == get_source_stamp():
+                _document = SchemaDocument.from_content(content)
+            else:
+                logger.warning(
+                    "The precomputed OpenAPI document at %s is stale, generating it",
+                    path,
+                )
+        if _document is None:
+            _document = SchemaDocument.from_content(generate_schema())
+    return _document
+
+
+def _schema_etag(request: HttpRequest) -> str:  # pylint: disable=unused-argument
+    return get_schema_document().etag
+
+
+@require_safe
+@condition(etag_func=_schema_etag)
+def openapi_schema(
+    request: HttpRequest,
+) -> HttpResponse:  # pylint: disable=unused-argument
+    """Serves the precomputed OpenAPI document"""
+    response = HttpResponse(
+        get_schema_document().content, content_type="application/json"
+    )
+    patch_cache_control(response, public=True, max_age=SCHEMA_MAX_AGE)
+    return response
@@ -1,43 +1,174 @@
 """Api serializers"""
+from typing import List, Optional, Set
+
 from django.contrib.auth import get_user_model
-from django.shortcuts import get_object_or_404
-from rest_framework import serializers
+from rest_framework import permissions, serializers
 
-from movies.models import Movie
+from movies.models import Genre, Movie, Reaction
 
 
-class MovieSerializer(  # pylint: disable=missing-class-docstring
+def get_query_list(request, name: str) -> List[str]:
+    """Returns the values of the comma separated `name` query parameter"""
+    if request is None:
+        return []
+    return [value for value in request.query_params.get(name, "").split(",") if value]
+
+
+def include_reactors(request) -> bool:
+    """
+    Returns `True` when the request opted in the full `likes`/`dislikes`
+    user ids lists with `?include=reactors`
+    """
+    return "reactors" in get_query_list(request, "include")
+
+
+def expand_author(request) -> bool:
+    """Returns `True` when the request asked for the author with `?expand=author`"""
+    return "author" in get_query_list(request, "expand")
+
+
+def get_requested_fields(request) -> Optional[Set[str]]:
+    """
+    Returns the fields requested from a read request with `?fields=`,
+    `None` for all the fields
+    """
+    if request is None or request.method not in permissions.SAFE_METHODS:
+        return None
+    return set(get_query_list(request, "fields")) or None
+
+
+class AuthorSerializer(  # pylint: disable=missing-class-docstring
     serializers.ModelSerializer
 ):
     class Meta:
-        model = Movie
-        fields = ["title", "desc", "genre", "year", "likes", "dislikes", "id"]
-        read_only_fields = (
-            "id",
-            "created_date",
-            "updated_date",
-            "likes",
-            "dislikes",
-        )
+        model = get_user_model()
+        fields = ["id", "username"]
+        read_only_fields = fields
 
 
-class MovieAddSerializer(  # pylint: disable=missing-class-docstring
+class MovieSerializer(  # pylint: disable=missing-class-docstring
     serializers.ModelSerializer
 ):
+    # opt-in with `include_reactors`
+    REACTORS_FIELDS = ("likes", "dislikes")
+
+    author = AuthorSerializer(read_only=True)
+    likes = serializers.SerializerMethodField()
+    dislikes = serializers.SerializerMethodField()
+
     class Meta:
         model = Movie
-        fields = ["title", "desc", "genre", "year", "likes", "dislikes", "id"]
+        fields = [
+            "title",
+            "desc",
+            "genre",
+            "year",
+            "likes_count",
+            "dislikes_count",
+            "author",
+            "likes",
+            "dislikes",
+            "id",
+        ]
         read_only_fields = (
             "id",
             "created_date",
             "updated_date",
+            "likes_count",
+            "dislikes_count",
+            "author",
             "likes",
             "dislikes",
         )
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get("request")
+        # fields added on request, regardless of `?fields=`
+        optional = {"author": expand_author(request)}
+        optional.update(
+            (field_name, include_reactors(request))
+            for field_name in self.REACTORS_FIELDS
+        )
+        requested = get_requested_fields(request)
+        for field_name in list(self.fields):
+            if field_name in optional:
+                keep = optional[field_name]
+            else:
+                keep = requested is None or field_name in requested
+            if not keep:
+                self.fields.pop(field_name)
+
+    @staticmethod
+    def _reactors(movie: Movie, value: int) -> List[int]:
+        """
+        Returns the ids of the users with the `value` reaction on the movie,
+        from the prefetched `reactions` when available
+        """
+        return [
+            reaction.user_id
+            for reaction in sorted(movie.reactions.all(), key=lambda r: r.id)
+            if reaction.value == value
+        ]
+
+    def get_likes(self, movie: Movie) -> List[int]:
+        """Returns the ids of the users who liked the movie"""
+        return self._reactors(movie, Reaction.LIKE)
+
+    def get_dislikes(self, movie: Movie) -> List[int]:
+        """Returns the ids of the users who disliked the movie"""
+        return self._reactors(movie, Reaction.DISLIKE)
+
+
+class MovieAddSerializer(MovieSerializer):  # pylint: disable=missing-class-docstring
     def create(self, *args, **kwargs):
-        user_id = self.context.get("user_id")
-        User = get_user_model()  # pylint: disable=invalid-name
-        user = get_object_or_404(User, id=user_id)
-        movie = Movie.objects.create(**self.validated_data, author=user)
+        movie = Movie.objects.create(
+            **self.validated_data, author=self.context["request"].user
+        )
         return movie
+
+
+class GenreSerializer(  # pylint: disable=missing-class-docstring
+    serializers.ModelSerializer
+):
+    class Meta:
+        model = Genre
+        fields = ["name", "slug", "movies_count"]
+        read_only_fields = fields
+
+
+class MovieIdsSerializer(  # pylint: disable=missing-class-docstring
+    serializers.Serializer  # pylint: disable=abstract-method
+):
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), allow_empty=False
+    )
+
+
+class ReactorSerializer(  # pylint: disable=missing-class-docstring
+    serializers.ModelSerializer
+):
+    username = serializers.CharField(source="user.username", read_only=True)
+
+    class Meta:
+        model = Reaction
+        fields = ["user", "username", "created_at"]
+        read_only_fields = fields
+
+
+class MovieReactionSerializer(  # pylint: disable=missing-class-docstring
+    serializers.Serializer  # pylint: disable=abstract-method
+):
+    # the API names of the `Reaction` values
+    REACTIONS = {"like": Reaction.LIKE, "dislike": Reaction.DISLIKE}
+
+    id = serializers.IntegerField(read_only=True)
+    likes_count = serializers.IntegerField(read_only=True)
+    dislikes_count = serializers.IntegerField(read_only=True)
+    reaction = serializers.ChoiceField(choices=list(REACTIONS))
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        names = {value: name for name, value in self.REACTIONS.items()}
+        data["reaction"] = names.get(instance["reaction"])
+        return data
@@ -1,10 +1,47 @@
 """API URLS"""
 from django.urls import path
 
-from .views import MoveAPICreateView, MovieAPIDetailView, MovieListAPIList
+from movies.models import Reaction
+
+from .views import (
+    GenreListAPIView,
+    MoveAPICreateView,
+    MovieAPIDetailView,
+    MovieAutocompleteAPIView,
+    MovieBulkAPIView,
+    MovieChangesAPIView,
+    MovieExportAPIView,
+    MovieListAPIList,
+    MovieReactionAPIView,
+    MovieReactorsAPIList,
+)
 
 urlpatterns = [
     path("movies/v1/", MovieListAPIList.as_view(), name="movies"),
     path("movies/v1/<int:pk>", MovieAPIDetailView.as_view(), name="movies-detail"),
     path("movies/v1/new", MoveAPICreateView.as_view(), name="movies-new"),
+    path("movies/v1/bulk", MovieBulkAPIView.as_view(), name="movies-bulk"),
+    path("movies/v1/export", MovieExportAPIView.as_view(), name="movies-export"),
+    path("movies/v1/changes", MovieChangesAPIView.as_view(), name="movies-changes"),
+    path("movies/v1/genres", GenreListAPIView.as_view(), name="movies-genres"),
+    path(
+        "movies/v1/autocomplete",
+        MovieAutocompleteAPIView.as_view(),
+        name="movies-autocomplete",
+    ),
+    path(
+        "movies/v1/<int:pk>/reaction",
+        MovieReactionAPIView.as_view(),
+        name="movies-reaction",
+    ),
+    path(
+        "movies/v1/<int:pk>/likes",
+        MovieReactorsAPIList.as_view(reaction=Reaction.LIKE),
+        name="movies-likes",
+    ),
+    path(
+        "movies/v1/<int:pk>/dislikes",
+        MovieReactorsAPIList.as_view(reaction=Reaction.DISLIKE),
+        name="movies-dislikes",
+    ),
 ]
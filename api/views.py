@@ -1,14 +1,74 @@
 """API views implementation"""
+import datetime
+from typing import Callable, Iterable, Iterator, List, Optional
 
-from rest_framework import generics
-from rest_framework.permissions import IsAuthenticated
+from django.conf import settings
+from django.db import transaction
+from django.db.models import OuterRef, Subquery
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
+from rest_framework import generics, status
+from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
+from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.response import Response
 
-from movies.models import Movie
+from movies import autocomplete
+from movies.cache import invalidate_catalog
+from movies.changes import get_changes
+from movies.conditional import catalog_last_modified, make_etag, movie_last_modified
+from movies.filters import get_release_year_range
+from movies.genres import get_genre_facets, sync_movie_genres
+from movies.models import Movie, Reaction
+from movies.pagination import InvalidCursor
 from movies.persmissions import IsAuthorOrReadOnly
+from movies.reactions import clear_reaction, set_reaction
 
-from .serializers import MovieAddSerializer, MovieSerializer
+from .pagination import KeysetCursorPagination
+from .renderers import FastJSONRenderer
+from .rows import AUTHOR_COLUMNS, MovieRows
+from .serializers import (
+    GenreSerializer,
+    MovieAddSerializer,
+    MovieIdsSerializer,
+    MovieReactionSerializer,
+    MovieSerializer,
+    ReactorSerializer,
+    get_query_list,
+)
 
 
+def _join_ids(ids: List[int]) -> str:
+    """Returns the comma separated `ids` for the error messages"""
+    return ", ".join(str(movie_id) for movie_id in ids)
+
+
+def _representation_etag(last_modified_func: Callable) -> Callable:
+    """
+    Returns the `etag_func` of a `last_modified_func`, for the requested
+    representation (the query parameters and the negotiated format)
+    """
+
+    def etag_func(request, *args, **kwargs) -> Optional[str]:
+        last_modified = last_modified_func(request, *args, **kwargs)
+        if last_modified is None:
+            return None
+        return make_etag(
+            last_modified, request.get_full_path(), request.META.get("HTTP_ACCEPT")
+        )
+
+    return etag_func
+
+
+@method_decorator(
+    condition(
+        etag_func=_representation_etag(movie_last_modified),
+        last_modified_func=movie_last_modified,
+    ),
+    name="get",
+)
 class MovieAPIDetailView(  # pylint: disable=missing-class-docstring
     generics.RetrieveUpdateDestroyAPIView
 ):
@@ -16,6 +76,21 @@ class MovieAPIDetailView(  # pylint: disable=missing-class-docstring
     serializer_class = MovieSerializer
     permission_classes = (IsAuthorOrReadOnly,)
 
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Returns the movie from its plain row, the read permission
+        doesn't need the model instance
+        """
+        rows = MovieRows(self.get_serializer())
+        row = (
+            rows.values(self.filter_queryset(self.get_queryset()))
+            .filter(pk=self.kwargs["pk"])
+            .first()
+        )
+        if row is None:
+            raise NotFound()
+        return Response(rows.to_representation([row])[0])
+
 
 class MoveAPICreateView(  # pylint: disable=missing-class-docstring
     generics.CreateAPIView
@@ -24,12 +99,381 @@ class MoveAPICreateView(  # pylint: disable=missing-class-docstring
     serializer_class = MovieAddSerializer
     permission_classes = (IsAuthenticated,)
 
-    def get_serializer_context(self):
-        context = super().get_serializer_context()
-        context.update({"user_id": self.request.user.id})
-        return context
 
+class MovieBulkAPIView(  # pylint: disable=missing-class-docstring
+    generics.GenericAPIView
+):
+    serializer_class = MovieAddSerializer
+    permission_classes = (IsAuthenticated,)
+    max_batch_size = 1000
+
+    def post(self, request, *args, **kwargs):
+        """
+        Creates the valid movies of the list with a single `bulk_create`
+        and reports the errors of the invalid ones by their list index
+        """
+        items = request.data
+        if not isinstance(items, list) or not items:
+            raise ValidationError({"detail": "Expected a non-empty list of movies"})
+        if len(items) > self.max_batch_size:
+            raise ValidationError(
+                {"detail": f"Up to {self.max_batch_size} movies per request"}
+            )
+        # one serializer for all the items, without copying its fields per item
+        serializer = self.get_serializer()
+        created, errors = [], []
+        for index, item in enumerate(items):
+            try:
+                validated_data = serializer.run_validation(item)
+            except ValidationError as error:
+                errors.append({"index": index, "errors": error.detail})
+                continue
+            created.append((index, Movie(**validated_data, author=request.user)))
+
+        if created:
+            with transaction.atomic():
+                Movie.objects.bulk_create([movie for _, movie in created])
+                # `bulk_create` doesn't send the `post_save` signals
+                sync_movie_genres({movie.id: movie.genre for _, movie in created})
+                invalidate_catalog()
+        return Response(
+            {
+                "created": [
+                    {"index": index, "id": movie.id} for index, movie in created
+                ],
+                "errors": errors,
+            },
+            status=status.HTTP_201_CREATED if created else status.HTTP_400_BAD_REQUEST,
+        )
+
+    def get_own_movie_ids(self) -> List[int]:
+        """
+        Returns the validated `ids` of the request, after checking with
+        a single query that they all belong to movies of the user
+        """
+        serializer = MovieIdsSerializer(data=self.request.data)
+        serializer.is_valid(raise_exception=True)
+        ids = list(dict.fromkeys(serializer.validated_data["ids"]))
+        if len(ids) > self.max_batch_size:
+            raise ValidationError(
+                {"detail": f"Up to {self.max_batch_size} movies per request"}
+            )
+        authors = dict(Movie.objects.filter(id__in=ids).values_list("id", "author_id"))
+        missing = [movie_id for movie_id in ids if movie_id not in authors]
+        if missing:
+            raise NotFound(f"Movies not found: {_join_ids(missing)}")
+        not_owned = [
+            movie_id for movie_id in ids if authors[movie_id] != self.request.user.id
+        ]
+        if not_owned:
+            raise PermissionDenied(
+                f"Only the author can change the movies: {_join_ids(not_owned)}"
+            )
+        return ids
+
+    def patch(self, request, *args, **kwargs):
+        """
+        Applies the same `changes` to all the `ids` movies of the user
+        with a single `UPDATE`
+        """
+        ids = self.get_own_movie_ids()
+        serializer = self.get_serializer(data=request.data.get("changes"), partial=True)
+        serializer.is_valid(raise_exception=True)
+        if not serializer.validated_data:
+            raise ValidationError({"changes": "No fields to update"})
+        now = timezone.now()
+        with transaction.atomic():
+            Movie.objects.filter(id__in=ids, author=request.user).update(
+                **serializer.validated_data,
+                # `update` doesn't apply `auto_now`
+                updated_date=now,
+                changed_at=now,
+            )
+            # neither sends the `post_save` signal
+            if "genre" in serializer.validated_data:
+                genre = serializer.validated_data["genre"]
+                sync_movie_genres({movie_id: genre for movie_id in ids})
+            invalidate_catalog()
+        return Response({"updated": ids})
 
+    def delete(self, request, *args, **kwargs):
+        """
+        Deletes all the `ids` movies of the user with their reactions,
+        one `DELETE` statement per table
+        """
+        ids = self.get_own_movie_ids()
+        with transaction.atomic():
+            Movie.objects.filter(id__in=ids, author=request.user).delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+@method_decorator(
+    condition(
+        etag_func=_representation_etag(catalog_last_modified),
+        last_modified_func=catalog_last_modified,
+    ),
+    name="get",
+)
 class MovieListAPIList(generics.ListAPIView):  # pylint: disable=missing-class-docstring
+    queryset = Movie.objects.order_by("id")
+    serializer_class = MovieSerializer
+    pagination_class = KeysetCursorPagination
+    # most movies of a `?ids=` batch lookup
+    max_ids = 100
+
+    def get_queryset(self):
+        """
+        Apply the `year_min`, `year_max`, `decade` and `genre` filters
+        and the full-text search `q`, ranked by relevance
+        """
+        try:
+            year_min, year_max = get_release_year_range(self.request.query_params)
+        except ValueError as error:
+            raise ValidationError({"detail": str(error)}) from error
+        movies = super().get_queryset().released_between(year_min, year_max)
+        genre = self.request.query_params.get("genre")
+        if genre:
+            movies = movies.by_genre(genre)
+        query = self.request.query_params.get("q", "").strip()
+        return movies.search(query) if query else movies
+
+    def get_requested_ids(self) -> Optional[List[int]]:
+        """Returns the unique `?ids=` of the request in their order, if any"""
+        if "ids" not in self.request.query_params:
+            return None
+        try:
+            ids = [int(value) for value in get_query_list(self.request, "ids")]
+        except ValueError as error:
+            raise ValidationError({"ids": "Expected comma separated ids"}) from error
+        ids = list(dict.fromkeys(ids))
+        if not ids or len(ids) > self.max_ids:
+            raise ValidationError({"ids": f"Expected 1 up to {self.max_ids} ids"})
+        return ids
+
+    def list(self, request, *args, **kwargs):
+        """
+        Returns the page of the movies from their plain rows,
+        or the `?ids=` movies in the requested order with the missing ids
+        """
+        rows = MovieRows(self.get_serializer())
+        queryset = rows.values(self.filter_queryset(self.get_queryset()))
+        ids = self.get_requested_ids()
+        if ids is None:
+            page = self.paginate_queryset(queryset)
+            return self.get_paginated_response(rows.to_representation(page))
+
+        found = {row["id"]: row for row in queryset.filter(id__in=ids)}
+        return Response(
+            {
+                "next": None,
+                "results": rows.to_representation(
+                    [found[movie_id] for movie_id in ids if movie_id in found]
+                ),
+                "missing": [movie_id for movie_id in ids if movie_id not in found],
+            }
+        )
+
+
+class MovieAutocompleteAPIView(  # pylint: disable=missing-class-docstring
+    generics.GenericAPIView
+):
+    # public and answered from memory, without any session/token lookup
+    authentication_classes = ()
+    permission_classes = (AllowAny,)
+    default_limit = 10
+    max_limit = 50
+
+    def get_limit(self) -> int:
+        """Returns the requested `limit` bounded by `max_limit`"""
+        try:
+            limit = int(self.request.query_params["limit"])
+        except (KeyError, ValueError):
+            return self.default_limit
+        return min(max(limit, 1), self.max_limit)
+
+    def get(self, request, *args, **kwargs):
+        """Returns the most liked movies and authors starting with the prefix `q`"""
+        suggestions = autocomplete.movie_autocomplete.suggest(
+            request.query_params.get("q", ""), limit=self.get_limit()
+        )
+        return Response({"results": suggestions})
+
+
+class GenreListAPIView(generics.ListAPIView):  # pylint: disable=missing-class-docstring
+    serializer_class = GenreSerializer
+    pagination_class = None
+
+    def get_queryset(self):
+        """The genres with movies, the genres with the most movies first"""
+        return get_genre_facets()
+
+
+class MovieChangesAPIView(  # pylint: disable=missing-class-docstring
+    generics.GenericAPIView
+):
     queryset = Movie.objects.all()
     serializer_class = MovieSerializer
+    page_size = 100
+
+    def get(self, request, *args, **kwargs):
+        """
+        Returns the movies changed and the ids of the movies deleted
+        after the `cursor`, with the cursor for the next sync
+        """
+        rows = MovieRows(self.get_serializer())
+        try:
+            page = get_changes(
+                self.get_queryset().values(*rows.columns, "changed_at"),
+                cursor=request.query_params.get("cursor"),
+                page_size=self.page_size,
+            )
+        except InvalidCursor as error:
+            raise NotFound("Invalid cursor") from error
+        return Response(
+            {
+                "changed": rows.to_representation(page.changed),
+                "deleted": page.deleted,
+                "cursor": page.cursor,
+                "has_more": page.has_more,
+            }
+        )
+
+
+class MovieExportAPIView(  # pylint: disable=missing-class-docstring
+    generics.GenericAPIView
+):
+    queryset = Movie.objects.order_by("id")
+    permission_classes = (IsAuthenticated,)
+    columns = (
+        "id",
+        "title",
+        "desc",
+        "genre",
+        "year",
+        "likes_count",
+        "dislikes_count",
+        "author__id",
+        "author__username",
+        "created_date",
+        "updated_date",
+    )
+
+    def get_since(self) -> Optional[datetime.datetime]:
+        """Returns the `since` date/datetime of the request, if any"""
+        value = self.request.query_params.get("since")
+        if not value:
+            return None
+        try:
+            since = parse_datetime(value) or parse_date(value)
+        except ValueError:
+            since = None
+        if since is None:
+            raise ValidationError({"since": "Expected an ISO 8601 date or datetime"})
+        if not isinstance(since, datetime.datetime):
+            since = datetime.datetime.combine(since, datetime.time.min)
+        if timezone.is_naive(since):
+            since = timezone.make_aware(since)
+        return since
+
+    def get_queryset(self):
+        """
+        The movies changed (or reacted to) after the `since` date, when given
+        """
+        queryset = super().get_queryset()
+        since = self.get_since()
+        if since is not None:
+            queryset = queryset.filter(changed_at__gte=since)
+        return queryset.values(*self.columns)
+
+    def get_lines(self, rows: Iterable[dict]) -> Iterator[bytes]:
+        """Returns one JSON line per movie"""
+        renderer = FastJSONRenderer()
+        for row in rows:
+            item = {name: row[name] for name in self.columns if "__" not in name}
+            item["author"] = {
+                key: row[column] for key, column in AUTHOR_COLUMNS.items()
+            }
+            yield renderer.render(item) + b"\n"
+
+    def get(self, request, *args, **kwargs):
+        """
+        Streams all the movies as newline-delimited JSON, read in chunks
+        from a single query (a server-side cursor where supported)
+        """
+        rows = self.get_queryset().iterator(
+            chunk_size=settings.MOVIES_EXPORT_CHUNK_SIZE
+        )
+        return StreamingHttpResponse(
+            self.get_lines(rows), content_type="application/x-ndjson"
+        )
+
+
+class MovieReactorsAPIList(  # pylint: disable=missing-class-docstring
+    generics.ListAPIView
+):
+    serializer_class = ReactorSerializer
+    pagination_class = KeysetCursorPagination
+    # `Reaction.LIKE` or `Reaction.DISLIKE`, set from the url
+    reaction = Reaction.LIKE
+
+    def get_queryset(self):
+        """The reactions of the movie, in the order they were first created"""
+        if not Movie.objects.filter(pk=self.kwargs["pk"]).exists():
+            raise NotFound()
+        return (
+            Reaction.objects.filter(movie_id=self.kwargs["pk"], value=self.reaction)
+            .select_related("user")
+            .only("id", "created_at", "user__id", "user__username")
+            .order_by("id")
+        )
+
+
+class MovieReactionAPIView(  # pylint: disable=missing-class-docstring
+    generics.GenericAPIView
+):
+    serializer_class = MovieReactionSerializer
+    permission_classes = (IsAuthenticated,)
+
+    def get_reaction_state(self) -> dict:
+        """
+        Returns the counters of the movie and the reaction of the user
+        with a single query
+        """
+        user_reaction = Reaction.objects.filter(
+            movie=OuterRef("pk"), user=self.request.user
+        ).values("value")[:1]
+        state = (
+            Movie.objects.filter(pk=self.kwargs["pk"])
+            .annotate(reaction=Subquery(user_reaction))
+            .values("id", "likes_count", "dislikes_count", "reaction")
+            .first()
+        )
+        if state is None:
+            raise NotFound()
+        return state
+
+    def react(self, change: Callable, *args) -> Response:
+        """
+        Applies the reaction `change` of the user on the movie
+        and returns the new reaction state
+        """
+        try:
+            change(self.kwargs["pk"], self.request.user.id, *args)
+        except Movie.DoesNotExist as error:
+            raise NotFound() from error
+        return self.get(self.request)
+
+    def get(self, request, *args, **kwargs):
+        """Returns the reaction state of the movie"""
+        return Response(self.get_serializer(self.get_reaction_state()).data)
+
+    def put(self, request, *args, **kwargs):
+        """Sets the `like`/`dislike` reaction of the user on the movie"""
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        value = MovieReactionSerializer.REACTIONS[serializer.validated_data["reaction"]]
+        return self.react(set_reaction, value)
+
+    def delete(self, request, *args, **kwargs):
+        """Removes any reaction of the user from the movie"""
+        return self.react(clear_reaction)
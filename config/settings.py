@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/4.1/ref/settings/
 """
 import os
 from pathlib import Path
+from typing import List, Tuple
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -52,6 +53,8 @@ INSTALLED_APPS = [
     # "django-allauth",
     "allauth",
     "allauth.account",
+    # the models of the registration, cascade-deleted with the users
+    "allauth.socialaccount",
     "dj_rest_auth.registration",
 ]
 
@@ -112,6 +115,52 @@ DATABASES = {
     }
 }
 
+# Cache
+# https://docs.djangoproject.com/en/4.1/topics/cache/
+#
+# The invalidations of the page generations, the conditional responses
+# validators, the API tokens and the autocomplete index go through the cache,
+# so with more than one worker it has to be shared (e.g. memcached, as in the
+# `docker-compose.yml`). The per-process default is for a single worker only.
+
+CACHES = {
+    "default": {
+        "BACKEND": os.environ.get(
+            "CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.environ.get("CACHE_LOCATION", "movierama"),
+    }
+}
+
+# a per-process cache (the default) isn't shared between the workers,
+# so its invalidations (e.g. a logout) reach only the current worker
+LOCAL_CACHE_BACKENDS = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+
+def get_identity_settings(cache_backend: str) -> Tuple[str, List[str]]:
+    """
+    Returns the `SESSION_ENGINE` and the `AUTHENTICATION_BACKENDS` of the
+    `cache_backend`, which serve the sessions and `request.user` from the cache
+    only when it's shared
+    """
+    if cache_backend in LOCAL_CACHE_BACKENDS:
+        return "django.contrib.sessions.backends.db", [
+            "django.contrib.auth.backends.ModelBackend"
+        ]
+    return "django.contrib.sessions.backends.cached_db", [
+        "accounts.backends.CachedModelBackend"
+    ]
+
+
+SESSION_ENGINE, AUTHENTICATION_BACKENDS = get_identity_settings(
+    CACHES["default"]["BACKEND"]
+)
+# seconds to keep a user of the sessions in the cache
+USER_CACHE_TIMEOUT = 5 * 60
+
 # Password validation
 # https://docs.djangoproject.com/en/4.1/ref/settings/#auth-password-validators
 
@@ -162,13 +211,44 @@ MEDIA_ROOT = str(BASE_DIR / "media")
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# number of movies per home page
+MOVIES_PAGE_SIZE = 20
+# seconds to keep a rendered movie card in the cache
+MOVIE_CARD_CACHE_TIMEOUT = 60 * 60
+# number of genres linked from the home page, the ones with the most movies
+GENRE_FACETS_SIZE = 20
+# seconds before a cached anonymous home page is regenerated
+HOME_PAGE_CACHE_TIMEOUT = 60
+# seconds a worker may hold the lock for regenerating a home page
+HOME_PAGE_CACHE_LOCK_TIMEOUT = 10
+# movies fetched per round trip from the database cursor of the API export
+MOVIES_EXPORT_CHUNK_SIZE = 2000
+# seconds a movie change waits before it's listed in the changes feed
+MOVIES_CHANGES_SETTLE_SECONDS = 2
+# seconds before the in-memory autocomplete index of a worker is built again
+AUTOCOMPLETE_REBUILD_SECONDS = 60 * 60
+# seconds to keep a token-to-user lookup of the API token authentication
+TOKEN_AUTH_CACHE_TIMEOUT = 60
+
+# the OpenAPI document precomputed with `./manage.py generate_openapi_schema`
+# (out of the `STATIC_ROOT`, which `collectstatic --clear` empties)
+OPENAPI_SCHEMA_PATH = BASE_DIR / "var" / "openapi.json"
+SWAGGER_SETTINGS = {"SPEC_URL": "schema-json"}
+REDOC_SETTINGS = {"SPEC_URL": "schema-json"}
+
 REST_FRAMEWORK = {
     # "DEFAULT_PERMISSION_CLASSES": [
     #     "rest_framework.permissions.IsAuthenticated",
     # ],
     "DEFAULT_AUTHENTICATION_CLASSES": [
         "rest_framework.authentication.SessionAuthentication",
-        "rest_framework.authentication.TokenAuthentication",
+        # `TokenAuthentication` with the token-to-user lookups cached
+        "accounts.authentication.CachedTokenAuthentication",
+    ],
+    # same output as the default `JSONRenderer`, encoded with `orjson` if installed
+    "DEFAULT_RENDERER_CLASSES": [
+        "api.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
     ],
 }
 
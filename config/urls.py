@@ -16,20 +16,16 @@ Including another URLconf
 from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import include, path
-from drf_yasg import openapi
 from drf_yasg.views import get_schema_view
 from rest_framework import permissions
 
+from api.schema import SCHEMA_INFO, openapi_schema
+
 from . import settings
 
+# the `swagger/` and `redoc/` pages load the precomputed `openapi.json` document
 schema_view = get_schema_view(  # pylint: disable=invalid-name
-    openapi.Info(
-        title="Movierama API",
-        description="API for movies",
-        default_version="v1",
-        contact=openapi.Contact(email="johnplitharas@gmail.com"),
-        license=openapi.License(name="BSD License"),
-    ),
+    SCHEMA_INFO,
     public=True,
     permission_classes=[permissions.AllowAny],
 )
@@ -49,6 +45,7 @@ urlpatterns = [
     path(
         "api/v1/dj-rest-auth/registration/", include("dj_rest_auth.registration.urls")
     ),
+    path("openapi.json", openapi_schema, name="schema-json"),
     path(
         "swagger/",
         schema_view.with_ui("swagger", cache_timeout=0),
@@ -3,12 +3,21 @@ from typing import Any, List, Tuple
 
 import pytest
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 
 from movies.models import Movie
 
 DEFAULT_ENGINE = "django.db.backends.sqlite3"
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """pytest fixture for starting every test with an empty cache"""
+    cache.clear()
+    yield
+    cache.clear()
+
+
 @pytest.fixture(name="fake_user_with_one_movie")
 def fake_user_with_one_movie_fixture() -> Tuple[Movie, Any]:
     """pytest fixture for creating one user with one movie"""
@@ -22,7 +31,7 @@ def fake_user_with_one_movie_fixture() -> Tuple[Movie, Any]:
         title="Harry Potter and the Deathly Hallows: Part 2",
         desc="A clash between good and evil awaits as young Harry (Daniel Radcliffe)",
         genre="Fantasy",
-        year="2011",
+        year=2011,
     )
     return user, movie
 
@@ -61,7 +70,7 @@ def fake_users_with_movies_fixture(
         " mundane lives. Their perfect partnership frays when Marla (Helena Bonham Carter),"
         " a fellow support group crasher, attracts Tyler's attention.",
         genre="Thriller/Drama",
-        year="1999",
+        year=1999,
     )
 
     return [first_user, second_user], [first_movie, second_movie]
@@ -1,7 +1,7 @@
 """Django admin movie settings """
 from django.contrib import admin
 
-from .models import Movie
+from .models import Genre, Movie
 
 
 @admin.register(Movie)
@@ -19,6 +19,8 @@ class MovieAdmin(admin.ModelAdmin):  # pylint: disable=missing-class-docstring
         "title",
         "genre",
         "year",
+        "likes_count",
+        "dislikes_count",
         "created_date",
         "updated_date",
         "author",
@@ -28,3 +30,9 @@ class MovieAdmin(admin.ModelAdmin):  # pylint: disable=missing-class-docstring
         "created_date",
         "updated_date",
     )
+
+
+@admin.register(Genre)
+class GenreAdmin(admin.ModelAdmin):  # pylint: disable=missing-class-docstring
+    list_display = ("name", "slug", "movies_count")
+    readonly_fields = ("movies_count",)
@@ -0,0 +1,205 @@
+"""
+In-process prefix index for the type-ahead of the movie titles and of the
+usernames of their authors.
+
+Every worker keeps the sorted keys of the titles (from every word on, so
+`pot` finds "Harry Potter") and of the authors in memory and finds the
+matches of a prefix with `bisect`. The movies rank by their likes and the
+authors by the likes of all their movies.
+
+A suggestion without any change of the catalog costs no query, only the
+check of the catalog generation (see `movies.cache`). After a change,
+the next suggestion of every worker reads just the movies created, updated
+or reacted on and the movies deleted since its previous read, the same way
+as the changes feed (`movies.changes`). Renamed authors of unchanged movies
+are picked up by the full rebuild every `AUTOCOMPLETE_REBUILD_SECONDS`.
+"""
+import datetime
+import heapq
+import threading
+import time
+from bisect import bisect_left, insort
+from collections import Counter
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Set, Tuple
+
+from django.conf import settings
+from django.utils import timezone
+
+from .cache import get_catalog_generation
+from .models import Movie, MovieDeletion
+
+MOVIE = "movie"
+AUTHOR = "author"
+COLUMNS = ("id", "title", "likes_count", "author_id", "author__username")
+
+
+def normalize(text: str) -> str:
+    """Returns the `text` case-folded with single spaces between its words"""
+    return " ".join(text.casefold().split())
+
+
+def get_keys(text: str) -> List[str]:
+    """Returns the keys of the `text`, one starting from every word"""
+    words = normalize(text).split(" ")
+    return [" ".join(words[index:]) for index in range(len(words)) if words[index]]
+
+
+class PrefixIndex:
+    """Sorted `(key, kind, id)` entries searched by prefix with `bisect`"""
+
+    def __init__(self, entries: Iterable[Tuple[str, str, int]] = ()):
+        self.entries = sorted(
+            (key, kind, item_id)
+            for text, kind, item_id in entries
+            for key in get_keys(text)
+        )
+
+    def add(self, text: str, kind: str, item_id: int) -> None:
+        """Adds the keys of the `text` for the item"""
+        for key in get_keys(text):
+            insort(self.entries, (key, kind, item_id))
+
+    def remove(self, text: str, kind: str, item_id: int) -> None:
+        """Removes the keys of the `text` of the item"""
+        for key in get_keys(text):
+            entry = (key, kind, item_id)
+            index = bisect_left(self.entries, entry)
+            if index < len(self.entries) and self.entries[index] == entry:
+                del self.entries[index]
+
+    def find(self, prefix: str) -> Set[Tuple[str, int]]:
+        """Returns the `(kind, id)` of the items with a key starting with `prefix`"""
+        prefix = normalize(prefix)
+        if not prefix:
+            return set()
+        start = bisect_left(self.entries, (prefix,))
+        end = bisect_left(self.entries, (prefix + "\U0010ffff",), lo=start)
+        return {(kind, item_id) for _, kind, item_id in self.entries[start:end]}
+
+
+@dataclass()
+class _Movie:  # pylint: disable=missing-class-docstring
+    title: str
+    likes: int
+    author_id: int
+
+
+class MovieAutocomplete:
+    """The prefix index of the catalog, kept up to date with its changes"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.index: Optional[PrefixIndex] = None
+        self.movies = {}
+        self.authors = {}
+        self.author_likes = Counter()
+        self.author_movies = Counter()
+        self.generation: Optional[int] = None
+        # the changes after this date are read on the next refresh
+        self.since: Optional[datetime.datetime] = None
+        self.built_at = 0.0
+
+    def _add_movie(self, row: dict) -> None:
+        self._remove_movie(row["id"])
+        movie = _Movie(row["title"], row["likes_count"], row["author_id"])
+        self.movies[row["id"]] = movie
+        self.index.add(movie.title, MOVIE, row["id"])
+        username = self.authors.get(movie.author_id)
+        if username != row["author__username"]:
+            if username is not None:
+                self.index.remove(username, AUTHOR, movie.author_id)
+            self.authors[movie.author_id] = row["author__username"]
+            self.index.add(row["author__username"], AUTHOR, movie.author_id)
+        self.author_likes[movie.author_id] += movie.likes
+        self.author_movies[movie.author_id] += 1
+
+    def _remove_movie(self, movie_id: int) -> None:
+        movie = self.movies.pop(movie_id, None)
+        if movie is None:
+            return
+        self.index.remove(movie.title, MOVIE, movie_id)
+        self.author_likes[movie.author_id] -= movie.likes
+        self.author_movies[movie.author_id] -= 1
+        # only the authors of some movie are suggested
+        if not self.author_movies[movie.author_id]:
+            self.index.remove(
+                self.authors.pop(movie.author_id), AUTHOR, movie.author_id
+            )
+            del self.author_likes[movie.author_id], self.author_movies[movie.author_id]
+
+    def _next_since(self) -> datetime.datetime:
+        """
+        The changes of the last seconds are read again on the next refresh,
+        in case their transactions commit after this read
+        """
+        return timezone.now() - datetime.timedelta(
+            seconds=settings.MOVIES_CHANGES_SETTLE_SECONDS
+        )
+
+    def _build(self) -> None:
+        since = self._next_since()
+        self.movies, self.authors = {}, {}
+        self.author_likes, self.author_movies = Counter(), Counter()
+        for row in Movie.objects.values(*COLUMNS):
+            self.movies[row["id"]] = _Movie(
+                row["title"], row["likes_count"], row["author_id"]
+            )
+            self.authors[row["author_id"]] = row["author__username"]
+            self.author_likes[row["author_id"]] += row["likes_count"]
+            self.author_movies[row["author_id"]] += 1
+        # sorted once, instead of an insertion per key
+        self.index = PrefixIndex(
+            [(movie.title, MOVIE, movie_id) for movie_id, movie in self.movies.items()]
+            + [
+                (username, AUTHOR, author_id)
+                for author_id, username in self.authors.items()
+            ]
+        )
+        self.since = since
+        self.built_at = time.monotonic()
+
+    def _refresh(self) -> None:
+        since = self._next_since()
+        # a range of the `changed_at` index, the latest update or reaction
+        changed = Movie.objects.filter(changed_at__gt=self.since).values(*COLUMNS)
+        for row in changed:
+            self._add_movie(row)
+        deleted = MovieDeletion.objects.filter(deleted_at__gt=self.since)
+        for movie_id in deleted.values_list("movie_id", flat=True):
+            self._remove_movie(movie_id)
+        self.since = since
+
+    def update(self) -> None:
+        """Brings the index up to date with the catalog, if it has changed"""
+        generation = get_catalog_generation()
+        with self.lock:
+            if (
+                self.index is None
+                or time.monotonic() - self.built_at
+                > settings.AUTOCOMPLETE_REBUILD_SECONDS
+            ):
+                self._build()
+            elif generation != self.generation:
+                self._refresh()
+            self.generation = generation
+
+    def suggest(self, prefix: str, limit: int = 10) -> List[dict]:
+        """Returns the `limit` most liked movies and authors matching the `prefix`"""
+        self.update()
+        with self.lock:
+            suggestions = []
+            for kind, item_id in self.index.find(prefix):
+                if kind == MOVIE:
+                    text, likes = self.movies[item_id].title, self.movies[item_id].likes
+                else:
+                    text, likes = self.authors[item_id], self.author_likes[item_id]
+                suggestions.append(
+                    {"type": kind, "id": item_id, "text": text, "likes": likes}
+                )
+        return heapq.nlargest(
+            limit, suggestions, key=lambda item: (item["likes"], -item["id"])
+        )
+
+
+movie_autocomplete = MovieAutocomplete()
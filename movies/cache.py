@@ -0,0 +1,48 @@
+"""
+Catalog generation counter.
+
+Every change of a movie or of a reaction bumps the generation, so any
+cache entry whose key contains the generation is invalidated at once,
+without having to find and delete the individual keys.
+"""
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+CATALOG_GENERATION_KEY = "movies:catalog-generation"
+
+
+def _initial_generation() -> int:
+    """
+    A fresh counter starts from the current time, so a counter evicted
+    from the cache never hands out a generation which was used before
+    """
+    return time.time_ns() // 1000
+
+
+def get_catalog_generation() -> int:
+    """Returns the current catalog generation"""
+    generation = cache.get(CATALOG_GENERATION_KEY)
+    if generation is None:
+        cache.add(CATALOG_GENERATION_KEY, _initial_generation(), timeout=None)
+        generation = cache.get(CATALOG_GENERATION_KEY)
+    return generation
+
+
+def bump_catalog_generation() -> None:
+    """Moves the catalog to a new generation"""
+    try:
+        cache.incr(CATALOG_GENERATION_KEY)
+    except ValueError:
+        # the counter isn't in the cache (yet/anymore)
+        cache.add(CATALOG_GENERATION_KEY, _initial_generation(), timeout=None)
+
+
+def invalidate_catalog() -> None:
+    """
+    Bumps the catalog generation once the current transaction commits,
+    so no request can cache the data from before the change under the
+    new generation
+    """
+    transaction.on_commit(bump_catalog_generation)
@@ -0,0 +1,116 @@
+"""
+Changes feed (delta sync) of the movies.
+
+A client keeps the cursor of its last sync and asks only for the movies
+created/updated/reacted to after it, plus the ids of the movies deleted
+after it (see `MovieDeletion`). Both streams are keyset paginated, by
+`(changed_at, id)` and `(deleted_at, id)`, in a single opaque cursor.
+
+Only the changes older than `MOVIES_CHANGES_SETTLE_SECONDS` are returned,
+so a transaction which commits a bit after its `changed_at` isn't
+skipped from the clients who synced in between.
+"""
+import datetime
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Sequence, Tuple
+
+from django.conf import settings
+from django.db.models import QuerySet
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .models import MovieDeletion
+from .pagination import (
+    InvalidCursor,
+    decode_cursor,
+    encode_cursor,
+    get_position,
+    keyset_filter,
+)
+
+CHANGED_ORDERING = ("changed_at", "id")
+DELETED_ORDERING = ("deleted_at", "id")
+
+
+@dataclass()
+class ChangesPage:  # pylint: disable=missing-class-docstring
+    changed: List[dict] = field(default_factory=list)
+    deleted: List[int] = field(default_factory=list)
+    cursor: str = ""
+    # `True` when more changes are available right away with the `cursor`
+    has_more: bool = False
+
+
+def _parse_position(cursor: str, values: List[Any]) -> List[Any]:
+    """Returns the `[datetime, id]` position of the cursor values"""
+    date, row_id = values
+    try:
+        date = parse_datetime(date) if isinstance(date, str) else None
+    except ValueError:
+        date = None
+    if date is None or not isinstance(row_id, int):
+        raise InvalidCursor(cursor)
+    return [date, row_id]
+
+
+def _page_after(
+    queryset: QuerySet,
+    ordering: Sequence[str],
+    position: Optional[List[Any]],
+    page_size: int,
+) -> Tuple[List[dict], bool]:
+    """Returns the rows after the `position` and if there are more of them"""
+    queryset = queryset.order_by(*ordering)
+    if position is not None:
+        queryset = queryset.filter(keyset_filter(ordering, position))
+    rows = list(queryset[: page_size + 1])
+    return rows[:page_size], len(rows) > page_size
+
+
+def get_changes(
+    movies: QuerySet, cursor: Optional[str] = None, page_size: int = 100
+) -> ChangesPage:
+    """
+    Returns the `movies` rows (a `values()` queryset, with the `changed_at`)
+    changed and the ids of the movies deleted after the `cursor`.
+    Without a `cursor` all the movies are returned, as a full sync.
+    Raises `InvalidCursor` for an invalid `cursor`.
+    """
+    settled = timezone.now() - datetime.timedelta(
+        seconds=settings.MOVIES_CHANGES_SETTLE_SECONDS
+    )
+    if cursor:
+        values = decode_cursor(cursor, CHANGED_ORDERING + DELETED_ORDERING)
+        changed_position = None
+        if values[:2] != [None, None]:
+            changed_position = _parse_position(cursor, values[:2])
+        deleted_position = _parse_position(cursor, values[2:])
+    else:
+        # nothing was synced, the movies deleted so far are already missing
+        changed_position = None
+        deleted_position = [settled, 0]
+
+    changed, more_changed = _page_after(
+        movies.filter(changed_at__lte=settled),
+        CHANGED_ORDERING,
+        changed_position,
+        page_size,
+    )
+    deletions, more_deleted = _page_after(
+        MovieDeletion.objects.filter(deleted_at__lte=settled).values(
+            "id", "deleted_at", "movie_id"
+        ),
+        DELETED_ORDERING,
+        deleted_position,
+        page_size,
+    )
+    if changed:
+        changed_position = get_position(changed[-1], CHANGED_ORDERING)
+    if deletions:
+        deleted_position = get_position(deletions[-1], DELETED_ORDERING)
+    return ChangesPage(
+        changed=changed,
+        deleted=[deletion["movie_id"] for deletion in deletions],
+        cursor=encode_cursor([*(changed_position or [None, None]), *deleted_position]),
+        has_more=more_changed or more_deleted,
+    )
@@ -0,0 +1,81 @@
+"""
+Validators of the conditional (`ETag`/`Last-Modified`) responses.
+
+The catalog changes whenever a movie is created/updated or reacted on
+(`changed_at`, the latest of both) or deleted (`MovieDeletion`), so the
+latest of these dates validates any listing with two `MAX` queries, each
+read from the end of an index. It's cached under the catalog generation
+(see `movies.cache`), so it's queried once per change.
+
+The dates of the transactions which commit out of order can't tell every
+change apart, so the `ETag` also holds the catalog generation, which is
+bumped once every change commits (see `movies.cache`).
+"""
+import datetime
+import hashlib
+from typing import Any, Optional
+
+from django.core.cache import cache
+from django.db.models import Max
+
+from .cache import get_catalog_generation
+from .models import Movie, MovieDeletion
+
+CATALOG_LAST_MODIFIED_KEY = "movies:catalog-last-modified:{generation}"
+
+
+def _latest(*dates: Optional[datetime.datetime]) -> Optional[datetime.datetime]:
+    """Returns the latest of the `dates`, `None` when there are none"""
+    return max((date for date in dates if date is not None), default=None)
+
+
+def get_catalog_last_modified() -> Optional[datetime.datetime]:
+    """Returns the date of the last change of any movie"""
+    key = CATALOG_LAST_MODIFIED_KEY.format(generation=get_catalog_generation())
+    # wrapped, so an empty catalog (`None`) is cached too
+    cached = cache.get(key)
+    if cached is not None:
+        return cached[0]
+    # a single aggregate per query, so it's read from the end of the index
+    changed = Movie.objects.aggregate(changed=Max("changed_at"))["changed"]
+    deleted = MovieDeletion.objects.aggregate(deleted=Max("deleted_at"))["deleted"]
+    last_modified = _latest(changed, deleted)
+    cache.set(key, (last_modified,))
+    return last_modified
+
+
+def get_movie_last_modified(movie_id: Any) -> Optional[datetime.datetime]:
+    """Returns the date of the last change of the movie, `None` when it's missing"""
+    return (
+        Movie.objects.filter(pk=movie_id).values_list("changed_at", flat=True).first()
+    )
+
+
+def make_etag(last_modified: Optional[datetime.datetime], *parts: Any) -> str:
+    """
+    Returns the quoted `ETag` of the `last_modified` date, the current
+    catalog generation and the `parts` the representation depends on
+    """
+    key = ":".join(
+        str(part)
+        for part in (
+            last_modified.isoformat() if last_modified else "",
+            get_catalog_generation(),
+            *parts,
+        )
+    )
+    return f'"{hashlib.blake2b(key.encode(), digest_size=16).hexdigest()}"'
+
+
+def catalog_last_modified(request, *args, **kwargs) -> Optional[datetime.datetime]:
+    """The `last_modified_func` of the listings, queried once per request"""
+    if not hasattr(request, "catalog_last_modified"):
+        request.catalog_last_modified = get_catalog_last_modified()
+    return request.catalog_last_modified
+
+
+def movie_last_modified(request, *args, **kwargs) -> Optional[datetime.datetime]:
+    """The `last_modified_func` of the movie `pk`, queried once per request"""
+    if not hasattr(request, "movie_last_modified"):
+        request.movie_last_modified = get_movie_last_modified(kwargs.get("pk"))
+    return request.movie_last_modified
@@ -0,0 +1,30 @@
+"""Parsing of the movie filters shared from the web-app and the API"""
+from typing import Mapping, Optional, Tuple
+
+
+def _parse_year(params: Mapping[str, str], name: str) -> Optional[int]:
+    """Returns the year parameter `name` or `None` when it's missing"""
+    value = params.get(name)
+    if value in (None, ""):
+        return None
+    if not value.isdigit():
+        raise ValueError(f"`{name}` must be a year, got: {value!r}")
+    return int(value)
+
+
+def get_release_year_range(
+    params: Mapping[str, str]
+) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Returns the (`year_min`, `year_max`) range of the release year filters
+    `year_min`, `year_max` and `decade` (e.g. `decade=1990` for 1990-1999)
+    of the query `params`, raising a `ValueError` for invalid values
+    """
+    year_min = _parse_year(params, "year_min")
+    year_max = _parse_year(params, "year_max")
+    decade = _parse_year(params, "decade")
+    if decade is not None:
+        decade -= decade % 10
+        year_min = decade if year_min is None else max(year_min, decade)
+        year_max = decade + 9 if year_max is None else min(year_max, decade + 9)
+    return year_min, year_max
@@ -0,0 +1,123 @@
+"""
+Normalized genres of the movies.
+
+The free text `genre` of a movie (e.g. `Sci-fi / Action`) is split on `/`
+into its `Genre` rows, matched by their slug, whenever it's written. Every
+`Genre` stores the number of its movies (`movies_count`), changed by the
+same `UPDATE` which adds/removes the movies of the genre, so the genre
+facets are read without a `GROUP BY` over the movies.
+"""
+import operator
+from collections import Counter, defaultdict
+from functools import reduce
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import F, Q, QuerySet
+from django.utils.text import slugify
+
+from .models import Genre, Movie
+
+GENRES_SEPARATOR = "/"
+
+MovieGenre = Movie.genres.through
+
+
+def parse_genres(text: str) -> List[Tuple[str, str]]:
+    """
+    Returns the `(slug, name)` of the genres of the `text`, split on `/`
+    and trimmed, without the duplicate and the empty ones
+    """
+    genres = {}
+    for name in (text or "").split(GENRES_SEPARATOR):
+        name = " ".join(name.split())
+        slug = slugify(name)
+        if slug and slug not in genres:
+            genres[slug] = name
+    return list(genres.items())
+
+
+def _change_counts(changes: Counter, key: str = "id") -> None:
+    """
+    Adds the `{genre id (or other unique key): delta}` changes to the counts,
+    one `UPDATE` per distinct delta
+    """
+    genres_by_delta = defaultdict(list)
+    for genre, delta in changes.items():
+        if delta:
+            genres_by_delta[delta].append(genre)
+    for delta, genres in genres_by_delta.items():
+        Genre.objects.filter(**{f"{key}__in": genres}).update(
+            movies_count=F("movies_count") + delta
+        )
+
+
+def sync_movie_genres(genres: Dict[int, str]) -> None:
+    """
+    Sets the genres of the `{movie_id: genre text}` movies, creating the
+    missing ones, and keeps the counts of the changed genres in sync
+    """
+    parsed = {movie_id: parse_genres(text) for movie_id, text in genres.items()}
+    names = {}
+    for pairs in parsed.values():
+        for slug, name in pairs:
+            # the first spelling of a genre names it
+            names.setdefault(slug, name)
+    with transaction.atomic():
+        if names:
+            Genre.objects.bulk_create(
+                [Genre(slug=slug, name=name) for slug, name in names.items()],
+                ignore_conflicts=True,
+            )
+        ids = dict(Genre.objects.filter(slug__in=names).values_list("slug", "id"))
+        wanted = {
+            (movie_id, ids[slug])
+            for movie_id, pairs in parsed.items()
+            for slug, _ in pairs
+        }
+        current = set(
+            MovieGenre.objects.filter(movie_id__in=genres).values_list(
+                "movie_id", "genre_id"
+            )
+        )
+        added, removed = wanted - current, current - wanted
+        if added:
+            MovieGenre.objects.bulk_create(
+                [
+                    MovieGenre(movie_id=movie_id, genre_id=genre_id)
+                    for movie_id, genre_id in added
+                ]
+            )
+        if removed:
+            MovieGenre.objects.filter(
+                reduce(
+                    operator.or_,
+                    (
+                        Q(movie_id=movie_id, genre_id=genre_id)
+                        for movie_id, genre_id in removed
+                    ),
+                )
+            ).delete()
+        changes = Counter(genre_id for _, genre_id in added)
+        changes.subtract(genre_id for _, genre_id in removed)
+        _change_counts(changes)
+
+
+def remove_movies_genres(genres: Iterable[str]) -> None:
+    """
+    Takes the deleted movies of the `genres` texts off the counts of their
+    genres, which are kept in sync with the texts
+    """
+    changes = Counter()
+    for text in genres:
+        changes.subtract(slug for slug, _ in parse_genres(text))
+    _change_counts(changes, key="slug")
+
+
+def get_genre_facets(limit: Optional[int] = None) -> QuerySet:
+    """
+    Returns the genres with movies and their stored number of movies,
+    the genres with the most movies first
+    """
+    genres = Genre.objects.filter(movies_count__gt=0).order_by("-movies_count", "name")
+    return genres[:limit] if limit is not None else genres
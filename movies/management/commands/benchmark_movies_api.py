@@ -0,0 +1,101 @@
+"""
+Compare the serializer and the plain-rows paths of the movies API,
+e.g. `./manage.py benchmark_movies_api --rows 1000 --query "expand=author"`
+"""
+import statistics
+import time
+from typing import Callable, List
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from api.renderers import FastJSONRenderer
+from api.rows import AUTHOR_COLUMNS, MovieRows
+from api.serializers import MovieSerializer
+from movies.models import Movie
+
+
+def _serializer_path(queryset, request: Request) -> bytes:
+    """The movies as model instances with the `MovieSerializer` and `JSONRenderer`"""
+    serializer = MovieSerializer(context={"request": request})
+    concrete = {
+        field.name
+        for field in Movie._meta.concrete_fields  # pylint: disable=protected-access
+    }
+    columns = [name for name in serializer.fields if name in concrete]
+    if "author" in serializer.fields:
+        queryset = queryset.select_related("author")
+        columns += ["author", *AUTHOR_COLUMNS.values()]
+    if {"likes", "dislikes"} & set(serializer.fields):
+        queryset = queryset.prefetch_related("reactions")
+    movies = queryset.only(*columns)
+    data = MovieSerializer(movies, many=True, context={"request": request}).data
+    return JSONRenderer().render(data)
+
+
+def _rows_path(queryset, request: Request) -> bytes:
+    """The movies as plain rows with the `FastJSONRenderer`"""
+    rows = MovieRows(MovieSerializer(context={"request": request}))
+    data = rows.to_representation(list(rows.values(queryset)))
+    return FastJSONRenderer().render(data)
+
+
+class Command(BaseCommand):
+    help = "Benchmark the serializer and the plain-rows paths of the movies API"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1000, help="movies per run")
+        parser.add_argument("--repeat", type=int, default=10, help="runs per path")
+        parser.add_argument(
+            "--query", default="", help="query string, e.g. `fields=id,title`"
+        )
+
+    def _timings(self, path: Callable, queryset, request, repeat: int) -> List[float]:
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            path(queryset, request)
+            timings.append(time.perf_counter() - start)
+        return timings
+
+    def handle(self, *args, **options):
+        rows, repeat = options["rows"], options["repeat"]
+        if rows < 1 or repeat < 1:
+            raise CommandError("`--rows` and `--repeat` must be positive")
+        request = Request(APIRequestFactory().get(f"/?{options['query']}"))
+        # the missing movies are created for the benchmark and rolled back
+        with transaction.atomic():
+            missing = rows - Movie.objects.count()
+            if missing > 0:
+                self.stdout.write(f"Creating {missing} temporary movies..")
+                author, _ = get_user_model().objects.get_or_create(username="benchmark")
+                Movie.objects.bulk_create(
+                    Movie(author=author, title=f"Movie {index}", desc="Desc", year=2000)
+                    for index in range(missing)
+                )
+            queryset = Movie.objects.order_by("id")[:rows]
+            if _serializer_path(queryset, request) != _rows_path(queryset, request):
+                raise CommandError("The two paths gave different responses")
+
+            results = {
+                name: self._timings(path, queryset, request, repeat)
+                for name, path in (
+                    ("serializer", _serializer_path),
+                    ("plain rows", _rows_path),
+                )
+            }
+            transaction.set_rollback(True)
+
+        for name, timings in results.items():
+            self.stdout.write(
+                f"{name:>10}: median {statistics.median(timings) * 1000:.1f}ms"
+                f" best {min(timings) * 1000:.1f}ms ({rows} movies, {repeat} runs)"
+            )
+        speedup = statistics.median(results["serializer"]) / statistics.median(
+            results["plain rows"]
+        )
+        self.stdout.write(self.style.SUCCESS(f"Plain rows speedup: {speedup:.1f}x"))
@@ -17,7 +17,7 @@ class SampleData:
     file_path: Path
     desc: str
     genre: str
-    year: str
+    year: int
 
 
 class Command(BaseCommand):
@@ -54,7 +54,7 @@ class Command(BaseCommand):
                 "izard immortal. Harry and Voldemort meet at Hogwarts Castle for an epic showdown "
                 "where the forces of darkness may finally meet their match.",
                 genre="Fantasy",
-                year="2011",
+                year=2011,
             ),
             SampleData(
                 title="Star Wars: The Rise of Skywalker",
@@ -65,7 +65,7 @@ class Command(BaseCommand):
                 " while Rey anticipates her inevitable confrontation with Kylo Ren. Warning:"
                 " Some flashing-lights scenes in this film may affect photosensitive viewers.",
                 genre="Sci-fi/Action",
-                year="2019",
+                year=2019,
             ),
             SampleData(
                 title="Avengers: Endgame",
@@ -75,7 +75,7 @@ class Command(BaseCommand):
                 "Thor, Black Widow, Captain America and Bruce Banner -- must figure out a way to bring b"
                 "ack their vanquished allies for an epic showdown with Thanos -- "
                 "the evil demigod who decimated the planet and the universe.",
-                year="2019",
+                year=2019,
                 genre="Action/Adventure",
             ),
             SampleData(
@@ -88,7 +88,7 @@ class Command(BaseCommand):
                 " Bond must go to Jamaica, where he encounters beautiful "
                 "Honey Ryder (Ursula Andress), "
                 "to confront a megalomaniacal villain in his massive island headquarters..",
-                year="1962",
+                year=1962,
                 genre="Action/Adventure",
             ),
             SampleData(
@@ -100,7 +100,7 @@ class Command(BaseCommand):
                 "to an empty house and assumes his wish to have no family has come true."
                 " But his excitement sours when he realizes that two con men (Joe Pesci, Daniel Stern)"
                 " plan to rob the McCallister residence, and that he alone must protect the family home.",
-                year="1990",
+                year=1990,
                 genre="Comedy",
             ),
             SampleData(
@@ -113,7 +113,7 @@ class Command(BaseCommand):
                 "first-class service to the hotel's guests, including satisfying the sexual needs "
                 "of the many elderly women who stay there. When one of Gustave's lovers dies mysteriously,"
                 " Gustave finds himself the recipient of a priceless painting and the chief suspect in her murder.",
-                year="2014",
+                year=2014,
                 genre="Comedy/Drama",
             ),
             SampleData(
@@ -125,7 +125,7 @@ class Command(BaseCommand):
                 "Earth's population to a new home via a wormhole. But first, Brand must send former "
                 "NASA pilot Cooper (Matthew McConaughey) and a team of researchers through the wormhole"
                 " and across the galaxy to find out which of three planets could be mankind's new home.",
-                year="2014",
+                year=2014,
                 genre=" Sci-fi/Adventure ",
             ),
             SampleData(
@@ -137,7 +137,7 @@ class Command(BaseCommand):
                 "(Keira Knightley), analyze Enigma messages while he builds a machine to decipher them."
                 " Turing and team finally succeed and become heroes, but in 1952, the quiet genius encounters"
                 " disgrace when authorities reveal he is gay and send him to prison.",
-                year="2014",
+                year=2014,
                 genre="War/Drama",
             ),
             SampleData(
@@ -150,7 +150,7 @@ class Command(BaseCommand):
                 "of which he has very little left, according to his doctor."
                 " He and Jane defy terrible odds and break new ground in the "
                 "fields of medicine and science, achieving more than either could hope to imagine.",
-                year="2014",
+                year=2014,
                 genre="Romance/Drama",
             ),
             SampleData(
@@ -164,7 +164,7 @@ class Command(BaseCommand):
                 "as he bears witness to their illusions and deceits -- pens a tale of impossible "
                 "love, dreams, and tragedy.",
                 genre="Romance/Drama",
-                year="2013",
+                year=2013,
             ),
             SampleData(
                 title="The King's Speech",
@@ -176,7 +176,7 @@ class Command(BaseCommand):
                 "to help him overcome his stammer. An extraordinary friendship develops between "
                 "the two men, as Logue uses unconventional means to teach the monarch how to"
                 " speak with confidence.",
-                year="2010",
+                year=2010,
                 genre="History/Drama",
             ),
             SampleData(
@@ -188,7 +188,7 @@ class Command(BaseCommand):
                 "underground club with strict rules and fight other men who are fed up with their"
                 " mundane lives. Their perfect partnership frays when Marla (Helena Bonham Carter),"
                 " a fellow support group crasher, attracts Tyler's attention.",
-                year="1999",
+                year=1999,
                 genre="Thriller/Drama",
             ),
         ]
@@ -0,0 +1,30 @@
+"""
+Precompute the OpenAPI document of the API on deploy,
+e.g. `./manage.py generate_openapi_schema`
+"""
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from api.schema import write_schema
+
+
+class Command(BaseCommand):
+    help = "Generate the OpenAPI document served from `/openapi.json`"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output",
+            default=settings.OPENAPI_SCHEMA_PATH,
+            help="file of the document, by default the `OPENAPI_SCHEMA_PATH`",
+        )
+
+    def handle(self, *args, **options):
+        path = Path(options["output"])
+        document = write_schema(path)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Wrote the OpenAPI document to {path} ({len(document.content)} bytes)"
+            )
+        )
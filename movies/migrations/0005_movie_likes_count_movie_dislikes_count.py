@@ -0,0 +1,58 @@
+# Generated by Django 4.1.7 on 2026-10-18 12:06
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def populate_reaction_counters(apps, schema_editor):
+    """Initialize the stored counters from the existing likes/dislikes"""
+    Movie = apps.get_model("movies", "Movie")
+    counters = {}
+    for field_name, counter in (
+        ("likes", "likes_count"),
+        ("dislikes", "dislikes_count"),
+    ):
+        through = Movie._meta.get_field(field_name).remote_field.through
+        total = (
+            through.objects.filter(movie_id=OuterRef("pk"))
+            .order_by()
+            .values("movie_id")
+            .annotate(total=Count("*"))
+            .values("total")
+        )
+        counters[counter] = Coalesce(Subquery(total), 0)
+    Movie.objects.update(**counters)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("movies", "0004_movie_dislikes_movie_likes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="movie",
+            name="dislikes_count",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Stored number of dislikes, kept in sync with `dislikes`",
+                verbose_name="Number of dislikes",
+            ),
+        ),
+        migrations.AddField(
+            model_name="movie",
+            name="likes_count",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Stored number of likes, kept in sync with `likes`",
+                verbose_name="Number of likes",
+            ),
+        ),
+        migrations.RunPython(
+            populate_reaction_counters, reverse_code=migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 4.1.7 on 2026-10-18 12:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("movies", "0005_movie_likes_count_movie_dislikes_count"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="movie",
+            index=models.Index(
+                fields=["created_date", "id"], name="movie_created_id_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="movie",
+            index=models.Index(fields=["year", "id"], name="movie_year_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="movie",
+            index=models.Index(
+                fields=["-likes_count", "id"], name="movie_likes_id_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="movie",
+            index=models.Index(
+                fields=["-dislikes_count", "id"], name="movie_dislikes_id_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="movie",
+            index=models.Index(fields=["author", "id"], name="movie_author_id_idx"),
+        ),
+    ]
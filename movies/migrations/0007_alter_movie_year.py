@@ -0,0 +1,35 @@
+# Generated by Django 4.1.7 on 2026-10-18 12:16
+
+import django.core.validators
+from django.db import migrations, models
+
+
+def clean_years(apps, schema_editor):
+    """
+    Keep only the digits of the years which can't be cast to an integer
+    (or `0` when there aren't any), before changing the column type
+    """
+    Movie = apps.get_model("movies", "Movie")
+    for movie in Movie.objects.exclude(year__regex=r"^[0-9]{1,4}$").only("year"):
+        digits = "".join(char for char in movie.year if char.isdigit())[:4]
+        Movie.objects.filter(pk=movie.pk).update(year=digits or "0")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("movies", "0006_movie_listing_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(clean_years, reverse_code=migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="movie",
+            name="year",
+            field=models.PositiveSmallIntegerField(
+                help_text="Year of publication",
+                validators=[django.core.validators.MaxValueValidator(9999)],
+                verbose_name="Published Year",
+            ),
+        ),
+    ]
@@ -0,0 +1,164 @@
+# Generated by Django 4.1.7 on 2026-10-18 12:20
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+LIKE = 1
+DISLIKE = -1
+BATCH_SIZE = 2000
+
+
+def _relations(Movie):
+    """Returns the `through` models of the likes/dislikes with their value"""
+    return (
+        (Movie._meta.get_field("likes").remote_field.through, LIKE),
+        (Movie._meta.get_field("dislikes").remote_field.through, DISLIKE),
+    )
+
+
+def _count_reactions(Reaction, value):
+    """Returns the number of `value` reactions of the outer movie"""
+    return Coalesce(
+        Subquery(
+            Reaction.objects.filter(movie_id=OuterRef("pk"), value=value)
+            .order_by()
+            .values("movie_id")
+            .annotate(total=Count("*"))
+            .values("total")
+        ),
+        0,
+    )
+
+
+def copy_reactions(apps, schema_editor):
+    """
+    Copy the likes/dislikes many-to-many rows into reactions.
+    A user who is in both sets of a movie keeps the like.
+    """
+    Movie = apps.get_model("movies", "Movie")
+    Reaction = apps.get_model("movies", "Reaction")
+    for through, value in _relations(Movie):
+        rows = through.objects.order_by("pk").values_list("movie_id", "customuser_id")
+        batch = []
+        for movie_id, user_id in rows.iterator(chunk_size=BATCH_SIZE):
+            batch.append(Reaction(movie_id=movie_id, user_id=user_id, value=value))
+            if len(batch) == BATCH_SIZE:
+                Reaction.objects.bulk_create(batch, ignore_conflicts=True)
+                batch = []
+        Reaction.objects.bulk_create(batch, ignore_conflicts=True)
+    Movie.objects.update(
+        likes_count=_count_reactions(Reaction, LIKE),
+        dislikes_count=_count_reactions(Reaction, DISLIKE),
+    )
+
+
+def restore_reactions(apps, schema_editor):
+    """Copy the reactions back into the likes/dislikes many-to-many rows"""
+    Movie = apps.get_model("movies", "Movie")
+    Reaction = apps.get_model("movies", "Reaction")
+    for through, value in _relations(Movie):
+        through.objects.bulk_create(
+            (
+                through(movie_id=movie_id, customuser_id=user_id)
+                for movie_id, user_id in Reaction.objects.filter(
+                    value=value
+                ).values_list("movie_id", "user_id")
+            ),
+            batch_size=BATCH_SIZE,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("movies", "0007_alter_movie_year"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="movie",
+            name="dislikes_count",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Stored number of dislikes, kept in sync with the reactions",
+                verbose_name="Number of dislikes",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="movie",
+            name="likes_count",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Stored number of likes, kept in sync with the reactions",
+                verbose_name="Number of likes",
+            ),
+        ),
+        migrations.CreateModel(
+            name="Reaction",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "value",
+                    models.SmallIntegerField(
+                        choices=[(1, "Like"), (-1, "Dislike")],
+                        help_text="Like or dislike",
+                        verbose_name="Reaction",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "movie",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="reactions",
+                        to="movies.movie",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="reactions",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="reaction",
+            index=models.Index(
+                fields=["movie", "value"], name="reaction_movie_value_idx"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="reaction",
+            constraint=models.UniqueConstraint(
+                fields=("user", "movie"), name="reaction_user_movie_uniq"
+            ),
+        ),
+        migrations.RunPython(copy_reactions, reverse_code=restore_reactions),
+        migrations.RemoveField(
+            model_name="movie",
+            name="dislikes",
+        ),
+        migrations.RemoveField(
+            model_name="movie",
+            name="likes",
+        ),
+    ]
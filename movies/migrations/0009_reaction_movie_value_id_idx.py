@@ -0,0 +1,23 @@
+# Generated by Django 4.1.7 on 2026-10-18 12:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("movies", "0008_reaction"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="reaction",
+            index=models.Index(
+                fields=["movie", "value", "id"], name="reaction_movie_value_id_idx"
+            ),
+        ),
+        migrations.RemoveIndex(
+            model_name="reaction",
+            name="reaction_movie_value_idx",
+        ),
+    ]
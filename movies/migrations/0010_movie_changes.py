@@ -0,0 +1,41 @@
+# Generated by Django 4.1.7 on 2026-10-18 12:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("movies", "0009_reaction_movie_value_id_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MovieDeletion",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("movie_id", models.BigIntegerField()),
+                ("deleted_at", models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="movie",
+            index=models.Index(
+                fields=["updated_date", "id"], name="movie_updated_id_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="moviedeletion",
+            index=models.Index(
+                fields=["deleted_at", "id"], name="deletion_deleted_id_idx"
+            ),
+        ),
+    ]
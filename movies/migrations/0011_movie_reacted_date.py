@@ -0,0 +1,26 @@
+# Generated by Django 4.1.7 on 2026-10-18 12:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("movies", "0010_movie_changes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="movie",
+            name="reacted_date",
+            field=models.DateTimeField(
+                editable=False,
+                help_text="Last change of the reactions, part of the conditional responses",
+                null=True,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="movie",
+            index=models.Index(fields=["reacted_date"], name="movie_reacted_idx"),
+        ),
+    ]
@@ -0,0 +1,24 @@
+from django.db import migrations
+
+from movies.search import create_search_index, drop_search_index
+
+
+def forwards(apps, schema_editor):  # pylint: disable=unused-argument
+    create_search_index(schema_editor)
+
+
+def backwards(apps, schema_editor):  # pylint: disable=unused-argument
+    drop_search_index(schema_editor)
+
+
+class Migration(migrations.Migration):
+    """
+    The full-text search index of the movies, FTS5 on SQLite and
+    a `tsvector` column with a GIN index on PostgreSQL (see `movies.search`)
+    """
+
+    dependencies = [
+        ("movies", "0011_movie_reacted_date"),
+    ]
+
+    operations = [migrations.RunPython(forwards, backwards)]
@@ -0,0 +1,108 @@
+# Generated by Django 4.1.7 on 2026-10-18 13:09
+
+from collections import Counter
+from typing import List, Tuple
+
+from django.db import migrations, models
+from django.utils.text import slugify
+
+
+def parse_genres(text: str) -> List[Tuple[str, str]]:
+    """
+    Returns the `(slug, name)` of the genres of the `text`, split on `/`
+    and trimmed, without the duplicate and the empty ones
+    (a copy of `movies.genres.parse_genres` as of this migration)
+    """
+    genres = {}
+    for name in (text or "").split("/"):
+        name = " ".join(name.split())
+        slug = slugify(name)
+        if slug and slug not in genres:
+            genres[slug] = name
+    return list(genres.items())
+
+
+def forwards(apps, schema_editor):  # pylint: disable=unused-argument
+    """Splits the `genre` of the existing movies into their genres"""
+    Movie = apps.get_model("movies", "Movie")
+    Genre = apps.get_model("movies", "Genre")
+    MovieGenre = Movie.genres.through
+    parsed = {
+        movie_id: parse_genres(genre)
+        for movie_id, genre in Movie.objects.values_list("id", "genre").iterator()
+    }
+    names = {}
+    for pairs in parsed.values():
+        for slug, name in pairs:
+            # the first spelling of a genre names it
+            names.setdefault(slug, name)
+    counts = Counter(slug for pairs in parsed.values() for slug, _ in pairs)
+    Genre.objects.bulk_create(
+        [
+            Genre(slug=slug, name=name, movies_count=counts[slug])
+            for slug, name in names.items()
+        ],
+        batch_size=1000,
+    )
+    ids = dict(Genre.objects.values_list("slug", "id"))
+    MovieGenre.objects.bulk_create(
+        [
+            MovieGenre(movie_id=movie_id, genre_id=ids[slug])
+            for movie_id, pairs in parsed.items()
+            for slug, _ in pairs
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+    """
+    The normalized genres of the movies, from their `genre` split on `/`
+    (see `movies.genres`)
+    """
+
+    dependencies = [
+        ("movies", "0012_movie_search_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Genre",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=255)),
+                ("slug", models.SlugField(max_length=255, unique=True)),
+                (
+                    "movies_count",
+                    models.PositiveIntegerField(
+                        default=0,
+                        editable=False,
+                        help_text="Stored number of movies, kept in sync with the movie genres",
+                        verbose_name="Number of movies",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="genre",
+            index=models.Index(
+                fields=["-movies_count", "name"], name="genre_count_name_idx"
+            ),
+        ),
+        migrations.AddField(
+            model_name="movie",
+            name="genres",
+            field=models.ManyToManyField(
+                blank=True, editable=False, related_name="movies", to="movies.genre"
+            ),
+        ),
+        migrations.RunPython(forwards, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 4.1.7 on 2026-10-18 13:45
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def populate_changed_at(apps, schema_editor):
+    """Initialize the watermark from the latest of the existing dates"""
+    Movie = apps.get_model("movies", "Movie")
+    Movie.objects.update(changed_at=F("updated_date"))
+    Movie.objects.filter(reacted_date__gt=F("updated_date")).update(
+        changed_at=F("reacted_date")
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("movies", "0013_genre"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="movie",
+            name="movie_updated_id_idx",
+        ),
+        # `auto_now` is applied by Django, the plain nullable column is added
+        # without remaking the table (and its search triggers) on SQLite
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.AddField(
+                    model_name="movie",
+                    name="changed_at",
+                    field=models.DateTimeField(null=True),
+                ),
+            ],
+            state_operations=[
+                migrations.AddField(
+                    model_name="movie",
+                    name="changed_at",
+                    field=models.DateTimeField(
+                        auto_now=True,
+                        help_text="Last change of the movie or of its reactions, "
+                        "the position of the changes feed",
+                        null=True,
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="movie",
+            index=models.Index(
+                fields=["changed_at", "id"], name="movie_changed_id_idx"
+            ),
+        ),
+        migrations.RunPython(
+            populate_changed_at, reverse_code=migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.1.7 on 2026-10-18 14:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("movies", "0014_movie_changed_at"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="movie",
+            name="movie_reacted_idx",
+        ),
+        migrations.AlterField(
+            model_name="movie",
+            name="reacted_date",
+            field=models.DateTimeField(
+                editable=False, help_text="Last change of the reactions", null=True
+            ),
+        ),
+    ]
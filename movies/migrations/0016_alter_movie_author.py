@@ -0,0 +1,44 @@
+# Generated by Django 4.1.7 on 2026-10-18 14:36
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+from movies.search import create_search_index, drop_search_index
+
+
+def drop_sqlite_search_index(apps, schema_editor):  # pylint: disable=unused-argument
+    """SQLite remakes the table to alter the field, without its search triggers"""
+    if schema_editor.connection.vendor == "sqlite":
+        drop_search_index(schema_editor)
+
+
+def create_sqlite_search_index(apps, schema_editor):  # pylint: disable=unused-argument
+    if schema_editor.connection.vendor == "sqlite":
+        create_search_index(schema_editor)
+
+
+class Migration(migrations.Migration):
+    """
+    The single-column index of the author is dropped, the `movie_author_id_idx`
+    starts with the author
+    """
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("movies", "0015_remove_movie_reacted_idx"),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_sqlite_search_index, create_sqlite_search_index),
+        migrations.AlterField(
+            model_name="movie",
+            name="author",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.RunPython(create_sqlite_search_index, drop_sqlite_search_index),
+    ]
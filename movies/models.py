@@ -1,4 +1,5 @@
-"""Movie Django-model"""
+"""Movie, Genre, MovieDeletion and Reaction Django-models"""
+from django.core.validators import MaxValueValidator
 from django.db import models
 
 from config import settings
@@ -6,7 +7,10 @@ from movies.movie_manager import MovieManager
 
 
 class Movie(models.Model):  # pylint: disable=missing-class-docstring
-    author = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    # indexed by the `movie_author_id_idx` below
+    author = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, db_index=False
+    )
     title = models.CharField(
         verbose_name="Movie Title", max_length=255, help_text="Title of the movie"
     )
@@ -19,25 +23,42 @@ class Movie(models.Model):  # pylint: disable=missing-class-docstring
         blank=True,
         help_text="Optional genre of the movie ",
     )
-    year = models.CharField(
-        verbose_name="Published Year", max_length=4, help_text="Date of publication"
+    # the `genre` split into its normalized genres (see `movies.genres`)
+    genres = models.ManyToManyField(
+        "Genre", related_name="movies", blank=True, editable=False
     )
-    likes = models.ManyToManyField(
-        settings.AUTH_USER_MODEL,
-        related_name="movie_likes",
-        verbose_name="Users who liked this a movie",
-        help_text="Many user can like this movie and this movie can be liked from different users",
+    year = models.PositiveSmallIntegerField(
+        verbose_name="Published Year",
+        validators=[MaxValueValidator(9999)],
+        help_text="Year of publication",
     )
-    dislikes = models.ManyToManyField(
-        settings.AUTH_USER_MODEL,
-        related_name="movie_dislikes",
-        verbose_name="Users who don't this a movie",
-        help_text="Many user can dislike this movie and this movie "
-        "can be disliked from different users",
+    likes_count = models.PositiveIntegerField(
+        verbose_name="Number of likes",
+        default=0,
+        editable=False,
+        help_text="Stored number of likes, kept in sync with the reactions",
+    )
+    dislikes_count = models.PositiveIntegerField(
+        verbose_name="Number of dislikes",
+        default=0,
+        editable=False,
+        help_text="Stored number of dislikes, kept in sync with the reactions",
+    )
+    reacted_date = models.DateTimeField(
+        null=True,
+        editable=False,
+        help_text="Last change of the reactions",
     )
 
     created_date = models.DateTimeField(auto_now_add=True)
     updated_date = models.DateTimeField(auto_now=True)
+    # set along with the `updated_date` and the `reacted_date`
+    changed_at = models.DateTimeField(
+        auto_now=True,
+        null=True,
+        help_text="Last change of the movie or of its reactions, "
+        "the position of the changes feed",
+    )
     cover = models.ImageField(
         upload_to="covers/",
         verbose_name="Movie cover image",
@@ -46,15 +67,133 @@ class Movie(models.Model):  # pylint: disable=missing-class-docstring
     )
     objects = MovieManager()
 
+    class Meta:
+        # one index per listing ordering of the `MovieQuerySet`
+        # (the `id` is the tie-breaker of the keyset pagination)
+        indexes = [
+            models.Index(fields=["created_date", "id"], name="movie_created_id_idx"),
+            models.Index(fields=["year", "id"], name="movie_year_id_idx"),
+            models.Index(fields=["-likes_count", "id"], name="movie_likes_id_idx"),
+            models.Index(
+                fields=["-dislikes_count", "id"], name="movie_dislikes_id_idx"
+            ),
+            models.Index(fields=["author", "id"], name="movie_author_id_idx"),
+            # the changes feed (`movies.changes`) and the validators of the
+            # conditional responses (`movies.conditional`)
+            models.Index(fields=["changed_at", "id"], name="movie_changed_id_idx"),
+        ]
+
+    # maintained with `UPDATE` statements whenever the reactions change
+    REACTION_COUNTERS = ("likes_count", "dislikes_count")
+    REACTION_FIELDS = (*REACTION_COUNTERS, "reacted_date")
+
+    def save(self, *args, **kwargs):
+        """
+        Saving an existing movie never writes the stored reaction fields, so
+        a stale instance can't overwrite a concurrent reaction change
+        """
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.REACTION_FIELDS
+            ]
+        super().save(*args, **kwargs)
+
     def __str__(self) -> str:
         return f"{self.title} by {self.author.username}"  # pylint: disable=no-member
 
     @property
     def total_likes(self) -> int:
-        """Returns # of total likes pear movie"""
-        return self.likes.count()
+        """Returns # of total likes pear movie, the stored `likes_count`"""
+        return self.likes_count
 
     @property
     def total_dislikes(self) -> int:
-        """Returns # of total dislikes pear movie"""
-        return self.dislikes.count()
+        """Returns # of total dislikes pear movie, the stored `dislikes_count`"""
+        return self.dislikes_count
+
+
+class Genre(models.Model):
+    """
+    One genre of the movies, e.g. both `Sci-fi/Action` and ` sci-fi `
+    have the `sci-fi` genre
+    """
+
+    name = models.CharField(max_length=255)
+    slug = models.SlugField(max_length=255, unique=True)
+    movies_count = models.PositiveIntegerField(
+        verbose_name="Number of movies",
+        default=0,
+        editable=False,
+        help_text="Stored number of movies, kept in sync with the movie genres",
+    )
+
+    class Meta:
+        indexes = [
+            # the genre facets, the genres with the most movies first
+            models.Index(fields=["-movies_count", "name"], name="genre_count_name_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return self.name
+
+
+class MovieDeletion(models.Model):
+    """
+    Tombstone of a deleted movie, so the changes feed can tell
+    the clients which movies to remove
+    """
+
+    movie_id = models.BigIntegerField()
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["deleted_at", "id"], name="deletion_deleted_id_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"Movie {self.movie_id} deleted at {self.deleted_at}"
+
+
+class Reaction(models.Model):
+    """
+    The like or dislike of one user on one movie.
+    Users can have at most one reaction per movie.
+    """
+
+    LIKE = 1
+    DISLIKE = -1
+    VALUE_CHOICES = ((LIKE, "Like"), (DISLIKE, "Dislike"))
+
+    # both indexed from the constraint/index below
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="reactions",
+        db_index=False,
+    )
+    movie = models.ForeignKey(
+        Movie, on_delete=models.CASCADE, related_name="reactions", db_index=False
+    )
+    value = models.SmallIntegerField(
+        verbose_name="Reaction", choices=VALUE_CHOICES, help_text="Like or dislike"
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "movie"], name="reaction_user_movie_uniq"
+            ),
+        ]
+        indexes = [
+            # the `id` is the tie-breaker of the keyset pagination of the reactors
+            models.Index(
+                fields=["movie", "value", "id"], name="reaction_movie_value_id_idx"
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.get_value_display()} from {self.user_id} on {self.movie_id}"
@@ -1,30 +1,98 @@
 """Movie model custom ManagerQuerySet"""
-from django.db import models
-from django.db.models import Count
+from contextvars import ContextVar
+from typing import Dict, Optional
+
+from django.db import connections, models, transaction
 
 from accounts.models import CustomUser
 
+from .search import get_search_expressions, get_search_terms
+
+# the `{id: genre}` of the movies deleted so far while `MovieQuerySet.delete`
+# takes care of them at once, instead of the per-movie handlers (`movies.signals`)
+bulk_deleted_movies: ContextVar[Optional[Dict[int, str]]] = ContextVar(
+    "bulk_deleted_movies", default=None
+)
+
 
 class MovieQuerySet(models.QuerySet):
     """MovieQuerySet"""
 
     def by_author(self, author: CustomUser):
         """Returns movies filtered by author"""
-        return self.filter(author=author)
+        return self.filter(author=author).order_by("id")
 
     def by_published_date(self):
         """Returns movies ordered by year"""
-        return self.order_by("year")
+        return self.order_by("year", "id")
 
     def by_likes(self):
         """Returns movies ordered by likes"""
-        return self.annotate(tmp=Count("likes")).order_by("-tmp")
+        return self.order_by("-likes_count", "id")
+
+    def released_between(
+        self, year_min: Optional[int] = None, year_max: Optional[int] = None
+    ):
+        """Returns movies released from `year_min` until `year_max` (inclusive)"""
+        movies = self
+        if year_min is not None:
+            movies = movies.filter(year__gte=year_min)
+        if year_max is not None:
+            movies = movies.filter(year__lte=year_max)
+        return movies
+
+    def by_decade(self, decade: int):
+        """Returns movies released in the decade starting at `decade`, e.g. 1990"""
+        return self.released_between(decade, decade + 9)
+
+    def by_genre(self, slug: str):
+        """Returns movies of the genre with the `slug` (see `movies.genres`)"""
+        return self.filter(genres__slug=slug)
+
+    def search(self, query: str):
+        """
+        Returns movies matching the full-text search `query`,
+        the most relevant first (see `movies.search`)
+        """
+        if not get_search_terms(query):
+            return self.none()
+        match, rank = get_search_expressions(connections[self.db].vendor, query)
+        return (
+            self.filter(match).annotate(search_rank=rank).order_by("-search_rank", "id")
+        )
 
     def by_dislikes(self):
         """Returns movies ordered by dislikes"""
         # by default the order is ascending
         # `-` reverse that
-        return self.annotate(tmp=Count("dislikes")).order_by("-tmp")
+        return self.order_by("-dislikes_count", "id")
+
+    def delete(self):
+        """
+        Deletes the movies with one `DELETE` per table, keeps their
+        tombstones (`MovieDeletion`) with a single `INSERT` and takes them
+        off the genre counts with one `UPDATE` per distinct delta, so the
+        number of queries doesn't depend on the number of movies
+        """
+        # pylint: disable=import-outside-toplevel
+        from .cache import invalidate_catalog
+        from .genres import remove_movies_genres
+        from .models import MovieDeletion
+
+        with transaction.atomic(using=self.db, savepoint=False):
+            token = bulk_deleted_movies.set({})
+            try:
+                deleted = super().delete()
+                movies = bulk_deleted_movies.get()
+            finally:
+                bulk_deleted_movies.reset(token)
+            if movies:
+                MovieDeletion.objects.using(self.db).bulk_create(
+                    [MovieDeletion(movie_id=movie_id) for movie_id in movies]
+                )
+                remove_movies_genres(movies.values())
+                invalidate_catalog()
+        return deleted
 
 
 class MovieManager(models.Manager):
@@ -49,3 +117,21 @@ class MovieManager(models.Manager):
     def by_published_date(self):
         """Returns movies ordered by likes"""
         return self.get_queryset().by_published_date()
+
+    def released_between(
+        self, year_min: Optional[int] = None, year_max: Optional[int] = None
+    ):
+        """Returns movies released from `year_min` until `year_max` (inclusive)"""
+        return self.get_queryset().released_between(year_min, year_max)
+
+    def by_decade(self, decade: int):
+        """Returns movies released in the decade starting at `decade`, e.g. 1990"""
+        return self.get_queryset().by_decade(decade)
+
+    def by_genre(self, slug: str):
+        """Returns movies of the genre with the `slug`"""
+        return self.get_queryset().by_genre(slug)
+
+    def search(self, query: str):
+        """Returns movies matching the full-text search `query`, most relevant first"""
+        return self.get_queryset().search(query)
@@ -0,0 +1,145 @@
+"""
+Keyset (cursor) pagination for the `Movie` querysets.
+
+Instead of `OFFSET/LIMIT` and a `COUNT(*)`, every page continues right
+after the last row of the previous one using the values of the ordering
+fields, so deep pages cost the same as the first one.
+"""
+import base64
+import binascii
+import datetime
+import json
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Sequence
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Q, QuerySet
+
+
+class InvalidCursor(ValueError):
+    """Raised when a cursor can't be decoded for the given ordering"""
+
+
+@dataclass()
+class KeysetPage:  # pylint: disable=missing-class-docstring
+    items: List[Any] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+def _json_default(value: Any) -> str:
+    """Keep the full precision of the dates in the cursor"""
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    raise TypeError(f"Cannot encode {type(value)} in a cursor")
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Returns an opaque cursor for the values of the ordering fields"""
+    payload = json.dumps(list(values), default=_json_default, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def _to_python(queryset: QuerySet, name: str, value: Any) -> Any:
+    """
+    Returns the cursor `value` of the ordering field `name` of the `queryset`
+    as its python value, raises `ValidationError` for a value of another type
+    """
+    if name in queryset.query.annotations:
+        field = queryset.query.annotations[name].output_field
+    else:
+        field = queryset.model._meta.get_field(name)  # pylint: disable=protected-access
+    return field.to_python(value)
+
+
+def decode_cursor(
+    cursor: str, ordering: Sequence[str], queryset: Optional[QuerySet] = None
+) -> List[Any]:
+    """
+    Returns the values of the ordering fields from an opaque cursor,
+    converted to the types of the fields of the `queryset` if given
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, binascii.Error) as error:
+        raise InvalidCursor(cursor) from error
+    if not isinstance(values, list) or len(values) != len(ordering):
+        raise InvalidCursor(cursor)
+    # only the scalar values of the `encode_cursor`, never lists or objects
+    if not all(
+        value is None or isinstance(value, (str, int, float)) for value in values
+    ):
+        raise InvalidCursor(cursor)
+    if queryset is not None:
+        try:
+            values = [
+                _to_python(queryset, order.lstrip("-"), value)
+                for order, value in zip(ordering, values)
+            ]
+        except (ValidationError, FieldDoesNotExist, TypeError, ValueError) as error:
+            raise InvalidCursor(cursor) from error
+        # `to_python` keeps a `None` and the lookups can't compare to it
+        if None in values:
+            raise InvalidCursor(cursor)
+    return values
+
+
+def get_keyset_ordering(queryset: QuerySet) -> List[str]:
+    """
+    Returns the ordering of the `queryset` with the primary key
+    appended as a tie-breaker, so every row has a unique position
+    """
+    ordering = [str(order) for order in queryset.query.order_by]
+    if not {"id", "-id", "pk", "-pk"} & set(ordering):
+        ordering.append("id")
+    return ordering
+
+
+def keyset_filter(ordering: Sequence[str], values: Sequence[Any]) -> Q:
+    """
+    Returns the condition for the rows after the position `values`, e.g.
+    for the ordering `("-likes_count", "id")`:
+    `likes_count <= x AND (likes_count < x OR (likes_count = x AND id > y))`
+    The leading bound lets the database start a range search of the index
+    right at the position, instead of walking all the entries before it.
+    """
+    condition = Q()
+    for index, order in enumerate(ordering):
+        name = order.lstrip("-")
+        lookup = "lt" if order.startswith("-") else "gt"
+        after = Q(**{f"{name}__{lookup}": values[index]})
+        for previous, value in zip(ordering[:index], values[:index]):
+            after &= Q(**{previous.lstrip("-"): value})
+        condition |= after
+    if len(ordering) > 1:
+        name = ordering[0].lstrip("-")
+        lookup = "lte" if ordering[0].startswith("-") else "gte"
+        condition = Q(**{f"{name}__{lookup}": values[0]}) & condition
+    return condition
+
+
+def get_position(item: Any, ordering: Sequence[str]) -> List[Any]:
+    """Returns the values of the ordering fields for a model instance or a dict"""
+    names = [order.lstrip("-") for order in ordering]
+    if isinstance(item, dict):
+        return [item[name] for name in names]
+    return [getattr(item, name) for name in names]
+
+
+def paginate_keyset(
+    queryset: QuerySet, cursor: Optional[str] = None, page_size: int = 20
+) -> KeysetPage:
+    """
+    Returns the page of the ordered `queryset` which starts after the `cursor`,
+    fetching one extra row to know if there is a next page.
+    """
+    ordering = get_keyset_ordering(queryset)
+    queryset = queryset.order_by(*ordering)
+    if cursor:
+        queryset = queryset.filter(
+            keyset_filter(ordering, decode_cursor(cursor, ordering, queryset))
+        )
+    items = list(queryset[: page_size + 1])
+    page = KeysetPage(items=items[:page_size])
+    if len(items) > page_size:
+        page.next_cursor = encode_cursor(get_position(page.items[-1], ordering))
+    return page
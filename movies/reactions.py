@@ -0,0 +1,148 @@
+"""
+Likes/dislikes of the movies.
+
+Every reaction change runs a constant number of statements within one
+transaction: it locks the movie row, reads the current reaction of the
+user, deletes or upserts it and updates the stored counters with
+a single `UPDATE`, which also stamps the `reacted_date` of the movie.
+The reactions of a deleted user are taken off the counters of their movies
+with one `UPDATE` per reaction value.
+"""
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from django.core.exceptions import PermissionDenied
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .cache import invalidate_catalog
+from .models import Movie, Reaction
+
+LIKE = Reaction.LIKE
+DISLIKE = Reaction.DISLIKE
+
+COUNTERS = {LIKE: "likes_count", DISLIKE: "dislikes_count"}
+
+
+@dataclass()
+class ReactionChange:  # pylint: disable=missing-class-docstring
+    # the reaction value before and after the change, `None` for no reaction
+    previous: Optional[int] = None
+    value: Optional[int] = None
+
+    @property
+    def added(self) -> bool:
+        """`True` when a new reaction was added"""
+        return self.value is not None and self.value != self.previous
+
+    @property
+    def replaced(self) -> bool:
+        """`True` when the new reaction replaced the opposite one"""
+        return self.added and self.previous is not None
+
+
+def _lock_movie(movie_id: int, user_id: int) -> None:
+    """
+    Locks the movie row, so the concurrent reactions on the same movie
+    are serialized. Raises `Movie.DoesNotExist` for an unknown movie and
+    `PermissionDenied` when the user is the author of the movie.
+    """
+    author_id = (
+        Movie.objects.select_for_update()
+        .filter(pk=movie_id)
+        .values_list("author_id", flat=True)
+        .first()
+    )
+    if author_id is None:
+        raise Movie.DoesNotExist(movie_id)
+    if author_id == user_id:
+        raise PermissionDenied("Users can't react on their own movies")
+
+
+def _change_reaction(
+    movie_id: int, user_id: int, value: Optional[int], toggle: bool = False
+) -> ReactionChange:
+    """
+    Sets the reaction of the user on the movie to `value` (`None` removes it).
+    With `toggle` an existing reaction equal to `value` is removed instead.
+    """
+    with transaction.atomic():
+        _lock_movie(movie_id, user_id)
+        user_reactions = Reaction.objects.filter(movie_id=movie_id, user_id=user_id)
+        change = ReactionChange(
+            previous=user_reactions.values_list("value", flat=True).first(),
+            value=value,
+        )
+        if toggle and change.previous == value:
+            change.value = None
+        if change.previous == change.value:
+            return change
+
+        if change.value is None:
+            user_reactions.delete()
+        else:
+            Reaction.objects.bulk_create(
+                [
+                    Reaction(
+                        movie_id=movie_id,
+                        user_id=user_id,
+                        value=change.value,
+                        created_at=timezone.now(),
+                    )
+                ],
+                update_conflicts=True,
+                unique_fields=["user", "movie"],
+                update_fields=["value", "created_at"],
+            )
+        counters = {}
+        if change.previous is not None:
+            counters[COUNTERS[change.previous]] = F(COUNTERS[change.previous]) - 1
+        if change.value is not None:
+            counters[COUNTERS[change.value]] = F(COUNTERS[change.value]) + 1
+        now = timezone.now()
+        Movie.objects.filter(pk=movie_id).update(
+            **counters, reacted_date=now, changed_at=now
+        )
+        invalidate_catalog()
+    return change
+
+
+def remove_user_reactions(user_id: int) -> None:
+    """
+    Takes the reactions of the user, deleted along with the user,
+    off the counters of their movies
+    """
+    movie_ids: Dict[int, List[int]] = defaultdict(list)
+    for movie_id, value in Reaction.objects.filter(user_id=user_id).values_list(
+        "movie_id", "value"
+    ):
+        movie_ids[value].append(movie_id)
+    if not movie_ids:
+        return
+    now = timezone.now()
+    for value, ids in movie_ids.items():
+        counter = COUNTERS[value]
+        Movie.objects.filter(pk__in=ids).update(
+            **{counter: F(counter) - 1}, reacted_date=now, changed_at=now
+        )
+    invalidate_catalog()
+
+
+def set_reaction(movie_id: int, user_id: int, value: int) -> ReactionChange:
+    """Sets the `value` (`LIKE`/`DISLIKE`) reaction of the user on the movie"""
+    return _change_reaction(movie_id, user_id, value)
+
+
+def clear_reaction(movie_id: int, user_id: int) -> ReactionChange:
+    """Removes any reaction of the user from the movie"""
+    return _change_reaction(movie_id, user_id, None)
+
+
+def toggle_reaction(movie_id: int, user_id: int, value: int) -> ReactionChange:
+    """
+    Adds the `value` (`LIKE`/`DISLIKE`) reaction of the user on the movie,
+    replacing the opposite one, or reverts it when it already exists.
+    """
+    return _change_reaction(movie_id, user_id, value, toggle=True)
@@ -0,0 +1,140 @@
+"""
+Full-text search over the title, the description and the genre of the movies.
+
+The inverted index depends on the database:
+1) SQLite: an external content FTS5 table, kept in sync by triggers
+2) PostgreSQL: a `tsvector` column with a GIN index, kept in sync by a trigger
+
+so every change of a movie (including bulk/queryset updates and deletions)
+updates the index. The matching movies are annotated with their relevance
+as `search_rank` (higher is better, title > genre > description).
+"""
+import re
+from typing import Tuple
+
+from django.db import NotSupportedError
+from django.db.models import BooleanField, FloatField
+from django.db.models.expressions import RawSQL
+
+SQLITE_INDEX = [
+    # `porter` stems the english words, like the `english` PostgreSQL configuration
+    """
+    CREATE VIRTUAL TABLE movies_movie_fts USING fts5(
+        title, "desc", genre,
+        content='movies_movie', content_rowid='id', tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER movies_movie_fts_insert AFTER INSERT ON movies_movie BEGIN
+        INSERT INTO movies_movie_fts(rowid, title, "desc", genre)
+        VALUES (new.id, new.title, new."desc", new.genre);
+    END
+    """,
+    """
+    CREATE TRIGGER movies_movie_fts_delete AFTER DELETE ON movies_movie BEGIN
+        INSERT INTO movies_movie_fts(movies_movie_fts, rowid, title, "desc", genre)
+        VALUES ('delete', old.id, old.title, old."desc", old.genre);
+    END
+    """,
+    """
+    CREATE TRIGGER movies_movie_fts_update AFTER UPDATE OF title, "desc", genre
+    ON movies_movie BEGIN
+        INSERT INTO movies_movie_fts(movies_movie_fts, rowid, title, "desc", genre)
+        VALUES ('delete', old.id, old.title, old."desc", old.genre);
+        INSERT INTO movies_movie_fts(rowid, title, "desc", genre)
+        VALUES (new.id, new.title, new."desc", new.genre);
+    END
+    """,
+    "INSERT INTO movies_movie_fts(movies_movie_fts) VALUES ('rebuild')",
+]
+SQLITE_DROP_INDEX = [
+    "DROP TRIGGER IF EXISTS movies_movie_fts_insert",
+    "DROP TRIGGER IF EXISTS movies_movie_fts_delete",
+    "DROP TRIGGER IF EXISTS movies_movie_fts_update",
+    "DROP TABLE IF EXISTS movies_movie_fts",
+]
+
+POSTGRESQL_VECTOR = """
+    setweight(to_tsvector('english', coalesce({row}.title, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce({row}.genre, '')), 'B') ||
+    setweight(to_tsvector('english', coalesce({row}."desc", '')), 'C')
+"""
+POSTGRESQL_INDEX = [
+    "ALTER TABLE movies_movie ADD COLUMN search_vector tsvector",
+    f"""
+    CREATE FUNCTION movies_movie_search_vector() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector := {POSTGRESQL_VECTOR.format(row="NEW")};
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER movies_movie_search_vector
+    BEFORE INSERT OR UPDATE OF title, "desc", genre ON movies_movie
+    FOR EACH ROW EXECUTE PROCEDURE movies_movie_search_vector()
+    """,
+    "UPDATE movies_movie SET search_vector = "
+    + POSTGRESQL_VECTOR.format(row="movies_movie"),
+    "CREATE INDEX movie_search_vector_idx ON movies_movie USING GIN (search_vector)",
+]
+POSTGRESQL_DROP_INDEX = [
+    "DROP TRIGGER IF EXISTS movies_movie_search_vector ON movies_movie",
+    "DROP FUNCTION IF EXISTS movies_movie_search_vector()",
+    "ALTER TABLE movies_movie DROP COLUMN IF EXISTS search_vector",
+]
+
+# the match condition and the relevance of a movie, for the search query
+SEARCH_SQL = {
+    "sqlite": (
+        '"movies_movie"."id" IN '
+        "(SELECT rowid FROM movies_movie_fts WHERE movies_movie_fts MATCH %s)",
+        "(SELECT -bm25(movies_movie_fts, 10.0, 1.0, 5.0) FROM movies_movie_fts"
+        ' WHERE movies_movie_fts MATCH %s AND rowid = "movies_movie"."id")',
+    ),
+    "postgresql": (
+        '"movies_movie"."search_vector" @@ websearch_to_tsquery(\'english\', %s)',
+        'ts_rank_cd("movies_movie"."search_vector",'
+        " websearch_to_tsquery('english', %s))::double precision",
+    ),
+}
+
+
+def create_search_index(schema_editor) -> None:
+    """Creates the search index of the movies, for the database of `schema_editor`"""
+    statements = {"sqlite": SQLITE_INDEX, "postgresql": POSTGRESQL_INDEX}
+    for statement in statements.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(statement)
+
+
+def drop_search_index(schema_editor) -> None:
+    """Drops the search index of the movies, for the database of `schema_editor`"""
+    statements = {"sqlite": SQLITE_DROP_INDEX, "postgresql": POSTGRESQL_DROP_INDEX}
+    for statement in statements.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(statement)
+
+
+def get_search_terms(query: str) -> str:
+    """
+    Returns the FTS5 query of the words of the search `query`,
+    every word quoted so no FTS5 syntax gets through
+    """
+    return " ".join(f'"{word}"' for word in re.findall(r"\w+", query))
+
+
+def get_search_expressions(vendor: str, query: str) -> Tuple[RawSQL, RawSQL]:
+    """
+    Returns the match condition and the relevance expressions of the movies
+    for the search `query` (PostgreSQL parses the web search syntax, e.g.
+    quoted phrases, `or` and `-word`, itself).
+    Raises `NotSupportedError` for other databases.
+    """
+    if vendor not in SEARCH_SQL:
+        raise NotSupportedError(f"The movies search isn't supported on {vendor}")
+    if vendor == "sqlite":
+        query = get_search_terms(query)
+    match, rank = SEARCH_SQL[vendor]
+    return (
+        RawSQL(match, [query], output_field=BooleanField()),
+        RawSQL(rank, [query], output_field=FloatField()),
+    )
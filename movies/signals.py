@@ -0,0 +1,51 @@
+"""Movie model signal handlers"""
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from .cache import invalidate_catalog
+from .genres import remove_movies_genres, sync_movie_genres
+from .models import Movie, MovieDeletion
+from .movie_manager import bulk_deleted_movies
+from .reactions import remove_user_reactions
+
+
+@receiver(post_save, sender=Movie)
+@receiver(post_delete, sender=Movie)
+def on_movie_changed(sender, **kwargs):  # pylint: disable=unused-argument
+    """Invalidates the cached catalog whenever a movie is saved or deleted"""
+    if bulk_deleted_movies.get() is None:
+        invalidate_catalog()
+
+
+@receiver(post_delete, sender=Movie)
+def on_movie_deleted(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """Keeps a tombstone of the deleted movie for the changes feed"""
+    movies = bulk_deleted_movies.get()
+    if movies is not None:
+        # written at once by `MovieQuerySet.delete`
+        movies[instance.id] = instance.genre
+    else:
+        MovieDeletion.objects.create(movie_id=instance.id)
+
+
+@receiver(post_save, sender=Movie)
+def on_movie_saved(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """Splits the `genre` of the saved movie into its normalized genres"""
+    update_fields = kwargs.get("update_fields")
+    if update_fields is None or "genre" in update_fields:
+        sync_movie_genres({instance.id: instance.genre})
+
+
+@receiver(pre_delete, sender=Movie)
+def on_movie_deleting(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """Takes the movie off the counts of its genres"""
+    # taken off at once by `MovieQuerySet.delete`
+    if bulk_deleted_movies.get() is None:
+        remove_movies_genres([instance.genre])
+
+
+@receiver(pre_delete, sender=settings.AUTH_USER_MODEL)
+def on_user_deleting(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """Takes the reactions of the user off the counters of their movies"""
+    remove_user_reactions(instance.id)
@@ -0,0 +1,53 @@
+// Likes/dislikes of the home page through the reactions API
+// (`api/movies/v1/{id}/reaction`), the forms POST is the fallback
+const REACTION_LABELS = {
+  like: ['Like it <i class="bi bi-hand-thumbs-up"></i>', "Liked!"],
+  dislike: ['Dislike it<i class="bi bi-hand-thumbs-down"></i>', "Disliked!"],
+};
+
+function setCount(element, count) {
+  element.lastChild.textContent = element.lastChild.textContent.replace(/\d+/, count);
+}
+
+function updateCard(reactions, state) {
+  const card = reactions.closest(".card");
+  reactions.dataset.userReaction = state.reaction || "";
+  setCount(card.querySelector("[data-likes-count]"), state.likes_count);
+  setCount(card.querySelector("[data-dislikes-count]"), state.dislikes_count);
+  reactions.querySelectorAll("form[data-reaction]").forEach(function (form) {
+    const labels = REACTION_LABELS[form.dataset.reaction];
+    form.querySelector("button").innerHTML = labels[form.dataset.reaction === state.reaction ? 1 : 0];
+  });
+}
+
+document.querySelectorAll("[data-reaction-url] form[data-reaction]").forEach(function (form) {
+  form.addEventListener("submit", function (event) {
+    if (!window.fetch) {
+      return;
+    }
+    event.preventDefault();
+    const reactions = form.closest("[data-reaction-url]");
+    const reaction = form.dataset.reaction;
+    // clicking the current reaction reverts it, as the form POST does
+    const revert = reactions.dataset.userReaction === reaction;
+    fetch(reactions.dataset.reactionUrl, {
+      method: revert ? "DELETE" : "PUT",
+      credentials: "same-origin",
+      headers: {
+        "Accept": "application/json",
+        "Content-Type": "application/json",
+        "X-CSRFToken": form.querySelector("[name=csrfmiddlewaretoken]").value,
+      },
+      body: revert ? null : JSON.stringify({reaction: reaction}),
+    }).then(function (response) {
+      if (!response.ok) {
+        throw new Error(response.statusText);
+      }
+      return response.json();
+    }).then(function (state) {
+      updateCard(reactions, state);
+    }).catch(function () {
+      form.submit();
+    });
+  });
+});
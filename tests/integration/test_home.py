@@ -25,8 +25,9 @@ def test_home_with_one_movie_no_user_logged_in(client, fake_user_with_one_movie)
     # All the movie infos are rendered in the page
     assert movie.title in response_content
     assert movie.desc in response_content
-    assert movie.genre not in response_content
-    assert movie.year in response_content
+    # the genre is listed in the genre facets, with its number of movies
+    assert f"{movie.genre} (1)" in response_content
+    assert str(movie.year) in response_content
     # User's name is listed as a url
     assert user.username.title() in response_content
     # But we aren't able to add any feedback
@@ -60,8 +61,9 @@ def test_home_with_one_movie_user_logged_in(client, fake_user_with_one_movie):
     # All the movie infos are rendered in the page
     assert movie.title in response_content
     assert movie.desc in response_content
-    assert movie.genre not in response_content
-    assert movie.year in response_content
+    # the genre is listed in the genre facets, with its number of movies
+    assert f"{movie.genre} (1)" in response_content
+    assert str(movie.year) in response_content
     # We can only Logout
     assert "Hello " + user.username in response_content
     assert "Logout" in response_content
@@ -96,8 +98,9 @@ def test_users_can_edit_their_movies(client, fake_user_with_one_movie):
     # All the movie infos are rendered in the page
     assert movie.title in response_content
     assert movie.desc in response_content
-    assert movie.genre not in response_content
-    assert movie.year in response_content
+    # the genre is listed in the genre facets, with its number of movies
+    assert f"{movie.genre} (1)" in response_content
+    assert str(movie.year) in response_content
     # Edit the movie
     edit_url = reverse("update-movie", args=[movie.id])
     response = client.post(
@@ -110,13 +113,13 @@ def test_users_can_edit_their_movies(client, fake_user_with_one_movie):
     assert "New title" in response_content
     assert movie.desc not in response_content
     assert "new" in response_content
-    assert movie.year not in response_content
+    assert str(movie.year) not in response_content
     assert "2023" in response_content
     #
     movie.refresh_from_db()
     assert movie.title == "New title"
     assert movie.desc == "new"
-    assert movie.year == "2023"
+    assert movie.year == 2023
 
 
 @pytest.mark.django_db
@@ -142,8 +145,9 @@ def test_users_can_delete_their_movies(client, fake_user_with_one_movie):
     # All the movie infos are rendered in the page
     assert movie.title in response_content
     assert movie.desc in response_content
-    assert movie.genre not in response_content
-    assert movie.year in response_content
+    # the genre is listed in the genre facets, with its number of movies
+    assert f"{movie.genre} (1)" in response_content
+    assert str(movie.year) in response_content
     assert Movie.objects.count() == 1
     # Edit the movie
     delete_url = reverse("delete-movie", args=[movie.id])
@@ -156,7 +160,7 @@ def test_users_can_delete_their_movies(client, fake_user_with_one_movie):
     assert "New title" not in response_content
     assert movie.desc not in response_content
     assert "new" not in response_content
-    assert movie.year not in response_content
+    assert str(movie.year) not in response_content
     assert "2023" not in response_content
 
 
@@ -176,6 +180,8 @@ def test_users_can_like_other_movies(client, fake_users_with_movies):
     )
 
     assert response.status_code == http.HTTPStatus.FOUND
+    first_movie.refresh_from_db()
+    second_movie.refresh_from_db()
     assert first_movie.total_likes == 0
     assert second_movie.total_likes == 0
 
@@ -196,6 +202,8 @@ def test_users_can_like_other_movies(client, fake_users_with_movies):
     response_content = str(response.content)
     assert "<strong>Likes:</strong> 1</p>" in response_content
     assert "<strong>Dislikes:</strong>0</p>" in response_content
+    first_movie.refresh_from_db()
+    second_movie.refresh_from_db()
     assert first_movie.total_likes == 0
     assert first_movie.total_dislikes == 0
     assert second_movie.total_likes == 1
@@ -218,6 +226,8 @@ def test_users_can_dislike_other_movies(client, fake_users_with_movies):
     )
 
     assert response.status_code == http.HTTPStatus.FOUND
+    first_movie.refresh_from_db()
+    second_movie.refresh_from_db()
     assert first_movie.total_dislikes == 0
     assert second_movie.total_dislikes == 0
     url = reverse("home")
@@ -239,6 +249,8 @@ def test_users_can_dislike_other_movies(client, fake_users_with_movies):
     response_content = str(response.content)
     assert "<strong>Likes:</strong> 0</p>" in response_content
     assert "<strong>Dislikes:</strong>1</p>" in response_content
+    first_movie.refresh_from_db()
+    second_movie.refresh_from_db()
     assert first_movie.total_likes == 0
     assert first_movie.total_dislikes == 0
     assert second_movie.total_likes == 0
@@ -269,6 +281,8 @@ def test_users_can_revert_their_dislike_to_movie(client, fake_users_with_movies)
     response_content = str(response.content)
     assert "<strong>Likes:</strong> 0</p>" in response_content
     assert "<strong>Dislikes:</strong>0</p>" in response_content
+    first_movie.refresh_from_db()
+    second_movie.refresh_from_db()
     assert first_movie.total_likes == 0
     assert second_movie.total_likes == 0
     assert first_movie.total_dislikes == 0
@@ -282,6 +296,8 @@ def test_users_can_revert_their_dislike_to_movie(client, fake_users_with_movies)
     response_content = str(response.content)
     assert "<strong>Likes:</strong> 0</p>" in response_content
     assert "<strong>Dislikes:</strong>1</p>" in response_content
+    first_movie.refresh_from_db()
+    second_movie.refresh_from_db()
     assert first_movie.total_likes == 0
     assert second_movie.total_likes == 0
     assert first_movie.total_dislikes == 0
@@ -293,6 +309,8 @@ def test_users_can_revert_their_dislike_to_movie(client, fake_users_with_movies)
     response_content = str(response.content)
     assert "<strong>Likes:</strong> 0</p>" in response_content
     assert "<strong>Dislikes:</strong>0</p>" in response_content
+    first_movie.refresh_from_db()
+    second_movie.refresh_from_db()
     assert first_movie.total_likes == 0
     assert second_movie.total_likes == 0
     assert first_movie.total_dislikes == 0
@@ -324,6 +342,8 @@ def test_users_can_revert_their_like(client, fake_users_with_movies):
     response_content = str(response.content)
     assert "<strong>Likes:</strong> 0</p>" in response_content
     assert "<strong>Dislikes:</strong>0</p>" in response_content
+    first_movie.refresh_from_db()
+    second_movie.refresh_from_db()
     assert first_movie.total_likes == 0
     assert second_movie.total_likes == 0
     assert first_movie.total_dislikes == 0
@@ -336,6 +356,8 @@ def test_users_can_revert_their_like(client, fake_users_with_movies):
     response_content = str(response.content)
     assert "<strong>Likes:</strong> 1</p>" in response_content
     assert "<strong>Dislikes:</strong>0</p>" in response_content
+    first_movie.refresh_from_db()
+    second_movie.refresh_from_db()
     assert first_movie.total_likes == 0
     assert first_movie.total_dislikes == 0
     assert second_movie.total_likes == 1
@@ -345,6 +367,8 @@ def test_users_can_revert_their_like(client, fake_users_with_movies):
     client.post(like_url)
     assert "<strong>Likes:</strong> 0</p>" in response_content
     assert "<strong>Dislikes:</strong>0</p>" in response_content
+    first_movie.refresh_from_db()
+    second_movie.refresh_from_db()
     assert first_movie.total_likes == 0
     assert first_movie.total_dislikes == 0
     assert second_movie.total_likes == 0
@@ -368,6 +392,8 @@ def test_user_change_their_dislike_to_a_like(client, fake_users_with_movies):
         path=login_url, data={"username": users[0].username, "password": "password123"}
     )
     assert response.status_code == http.HTTPStatus.FOUND
+    first_movie.refresh_from_db()
+    second_movie.refresh_from_db()
     assert first_movie.total_likes == 0
     assert second_movie.total_likes == 0
     assert first_movie.total_dislikes == 0
@@ -386,6 +412,8 @@ def test_user_change_their_dislike_to_a_like(client, fake_users_with_movies):
     # Then we have the right content
     assert "<strong>Likes:</strong> 0</p>" in response_content
     assert "<strong>Dislikes:</strong>1</p>" in response_content
+    first_movie.refresh_from_db()
+    second_movie.refresh_from_db()
     assert first_movie.total_likes == 0
     assert second_movie.total_likes == 0
     assert first_movie.total_dislikes == 0
@@ -393,6 +421,8 @@ def test_user_change_their_dislike_to_a_like(client, fake_users_with_movies):
     # Also if they change the dislike to a like
     like_url = reverse("like-movie", args=[second_movie.id])
     client.post(like_url)
+    first_movie.refresh_from_db()
+    second_movie.refresh_from_db()
     assert first_movie.total_likes == 0
     assert second_movie.total_likes == 1
     assert first_movie.total_dislikes == 0
@@ -419,6 +449,8 @@ def test_user_change_their_like_to_a_dislike(client, fake_users_with_movies):
         path=login_url, data={"username": users[0].username, "password": "password123"}
     )
     assert response.status_code == http.HTTPStatus.FOUND
+    first_movie.refresh_from_db()
+    second_movie.refresh_from_db()
     assert first_movie.total_likes == 0
     assert second_movie.total_likes == 0
     assert first_movie.total_dislikes == 0
@@ -438,6 +470,8 @@ def test_user_change_their_like_to_a_dislike(client, fake_users_with_movies):
     # Then we have the right content
     assert "<strong>Likes:</strong> 1</p>" in response_content
     assert "<strong>Dislikes:</strong>0</p>" in response_content
+    first_movie.refresh_from_db()
+    second_movie.refresh_from_db()
     assert first_movie.total_likes == 0
     assert first_movie.total_dislikes == 0
     assert second_movie.total_likes == 1
@@ -452,6 +486,8 @@ def test_user_change_their_like_to_a_dislike(client, fake_users_with_movies):
     response_content = str(response.content)
     assert "<strong>Likes:</strong> 0</p>" in response_content
     assert "<strong>Dislikes:</strong>1</p>" in response_content
+    first_movie.refresh_from_db()
+    second_movie.refresh_from_db()
     assert first_movie.total_likes == 0
     assert first_movie.total_dislikes == 0
     assert second_movie.total_likes == 0
@@ -0,0 +1,95 @@
+"""Test cases for the cached token authentication"""
+import http
+
+import pytest
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+
+@pytest.fixture(name="token_client")
+def token_client_fixture(fake_users_with_movies):
+    """
+    pytest fixture for an API client with the token of the first user
+    and the movie of the second user
+    """
+    users, movies = fake_users_with_movies
+    token = Token.objects.create(user=users[0])
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+    return client, token, movies[1]
+
+
+@pytest.mark.django_db
+def test_cached_token_authentication(token_client, django_assert_num_queries):
+    """
+    Given a client which has been authenticated with its token
+    When the client calls an API endpoint again
+    Then we expect the user to be authenticated without the token query
+    """
+    # Given
+    client, token, movie = token_client
+    url = reverse("movies-reaction", args=[movie.id])
+    assert client.get(url).status_code == http.HTTPStatus.OK
+    # When
+    with django_assert_num_queries(1) as captured:
+        response = client.get(url)
+    # Then
+    assert response.status_code == http.HTTPStatus.OK
+    assert "authtoken_token" not in captured.captured_queries[0]["sql"]
+    assert token.user_id == response.wsgi_request.user.id
+
+
+@pytest.mark.django_db
+def test_deleted_token_is_not_authenticated(token_client):
+    """
+    Given a client which has been authenticated with its token
+    When the token is deleted
+    Then we expect the client not to be authenticated anymore
+    """
+    # Given
+    client, token, movie = token_client
+    url = reverse("movies-reaction", args=[movie.id])
+    assert client.get(url).status_code == http.HTTPStatus.OK
+    # When
+    token.delete()
+    response = client.get(url)
+    # Then
+    assert response.status_code == http.HTTPStatus.FORBIDDEN
+
+
+@pytest.mark.django_db
+def test_deactivated_user_is_not_authenticated(token_client):
+    """
+    Given a client which has been authenticated with its token
+    When its user is deactivated
+    Then we expect the client not to be authenticated anymore
+    """
+    # Given
+    client, token, movie = token_client
+    url = reverse("movies-reaction", args=[movie.id])
+    assert client.get(url).status_code == http.HTTPStatus.OK
+    # When
+    token.user.is_active = False
+    token.user.save()
+    response = client.get(url)
+    # Then
+    assert response.status_code == http.HTTPStatus.FORBIDDEN
+
+
+@pytest.mark.django_db
+def test_logout_invalidates_the_token(token_client):
+    """
+    Given a client which has been authenticated with its token
+    When the client logs out from the `dj-rest-auth` logout endpoint
+    Then we expect the client not to be authenticated anymore
+    """
+    # Given
+    client, _, movie = token_client
+    url = reverse("movies-reaction", args=[movie.id])
+    assert client.get(url).status_code == http.HTTPStatus.OK
+    # When
+    assert client.post(reverse("rest_logout")).status_code == http.HTTPStatus.OK
+    response = client.get(url)
+    # Then
+    assert response.status_code == http.HTTPStatus.FORBIDDEN
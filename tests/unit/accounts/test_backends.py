@@ -0,0 +1,128 @@
+"""Test cases for the cached sessions and users of the web app"""
+import http
+
+import pytest
+from django.urls import reverse
+
+from config.settings import get_identity_settings
+from tests.utils import login_user
+
+IDENTITY_TABLES = ('FROM "django_session"', 'FROM "accounts_customuser"')
+
+
+@pytest.fixture(autouse=True)
+def cached_identity(settings):
+    """pytest fixture for the cached sessions and users of a shared cache"""
+    settings.SESSION_ENGINE = "django.contrib.sessions.backends.cached_db"
+    settings.AUTHENTICATION_BACKENDS = ["accounts.backends.CachedModelBackend"]
+
+
+@pytest.mark.parametrize(
+    "cache_backend,session_engine,backend",
+    [
+        (
+            "django.core.cache.backends.locmem.LocMemCache",
+            "django.contrib.sessions.backends.db",
+            "django.contrib.auth.backends.ModelBackend",
+        ),
+        (
+            "django.core.cache.backends.memcached.PyMemcacheCache",
+            "django.contrib.sessions.backends.cached_db",
+            "accounts.backends.CachedModelBackend",
+        ),
+    ],
+)
+def test_identity_cached_only_with_a_shared_cache(
+    cache_backend, session_engine, backend
+):
+    """
+    Given a per-process or a shared cache backend
+    When we get the identity settings of the backend
+    Then we expect the cached sessions and users only for the shared cache
+    """
+    assert get_identity_settings(cache_backend) == (session_engine, [backend])
+
+
+@pytest.mark.django_db
+def test_logged_in_page_view_without_identity_queries(
+    client, fake_user_with_one_movie, django_assert_max_num_queries
+):
+    """
+    Given a logged-in user who has visited the `home` page
+    When the user visits the `home` page again
+    Then we expect the session and the user without any query
+    """
+    # Given
+    user, _ = fake_user_with_one_movie
+    login_user(client=client, user=user)
+    client.get(reverse("home"))
+    # When
+    with django_assert_max_num_queries(10) as captured:
+        response = client.get(reverse("home"))
+    # Then
+    assert response.status_code == http.HTTPStatus.OK
+    assert "Logout" in str(response.content)
+    assert not [
+        query["sql"]
+        for query in captured.captured_queries
+        if query["sql"].startswith(("SELECT", "UPDATE"))
+        and any(table in query["sql"] for table in IDENTITY_TABLES)
+    ]
+
+
+@pytest.mark.django_db
+def test_password_change_logs_out(client, fake_user_with_one_movie):
+    """
+    Given a logged-in user who has visited the `home` page
+    When the password of the user changes
+    Then we expect the user to be logged out
+    """
+    # Given
+    user, _ = fake_user_with_one_movie
+    login_user(client=client, user=user)
+    client.get(reverse("home"))
+    # When
+    user.set_password("new-password123")
+    user.save()
+    response = client.get(reverse("home"))
+    # Then
+    assert "Logout" not in str(response.content)
+
+
+@pytest.mark.django_db
+def test_deactivation_logs_out(client, fake_user_with_one_movie):
+    """
+    Given a logged-in user who has visited the `home` page
+    When the user is deactivated
+    Then we expect the user to be logged out
+    """
+    # Given
+    user, _ = fake_user_with_one_movie
+    login_user(client=client, user=user)
+    client.get(reverse("home"))
+    # When
+    user.is_active = False
+    user.save()
+    response = client.get(reverse("home"))
+    # Then
+    assert "Logout" not in str(response.content)
+
+
+@pytest.mark.django_db
+def test_logout_ends_the_cached_session(client, fake_user_with_one_movie):
+    """
+    Given a logged-in user who has visited the `home` page
+    When the user logs out
+    Then we expect the next visit of the session to be anonymous
+    """
+    # Given
+    user, _ = fake_user_with_one_movie
+    login_user(client=client, user=user)
+    session_cookie = client.cookies["sessionid"].value
+    client.get(reverse("home"))
+    # When
+    client.get(reverse("logout"))
+    client.cookies["sessionid"] = session_cookie
+    response = client.get(reverse("home"))
+    # Then
+    assert "Logout" not in str(response.content)
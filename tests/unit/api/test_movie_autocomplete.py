@@ -0,0 +1,51 @@
+"""Test cases for the `api/movies/v1/autocomplete` endpoint"""
+import http
+
+import pytest
+from django.urls import reverse
+
+from movies import autocomplete
+
+
+@pytest.fixture(autouse=True)
+def fresh_autocomplete(monkeypatch):
+    """pytest fixture for an autocomplete index without the movies of other tests"""
+    monkeypatch.setattr(
+        autocomplete, "movie_autocomplete", autocomplete.MovieAutocomplete()
+    )
+
+
+@pytest.mark.django_db
+def test_autocomplete(client, fake_users_with_movies, django_assert_num_queries):
+    """
+    Given two movies and a warm autocomplete index
+    When we call the `api/movies/v1/autocomplete` endpoint with `q=f&limit=1`
+    Then we expect the top suggestion without any query
+    """
+    # Given
+    _, movies = fake_users_with_movies
+    client.get(reverse("movies-autocomplete") + "?q=h")
+    # When
+    with django_assert_num_queries(0):
+        response = client.get(reverse("movies-autocomplete") + "?q=f&limit=1")
+    # Then
+    assert response.status_code == http.HTTPStatus.OK
+    assert response.json() == {
+        "results": [
+            {"type": "movie", "id": movies[1].id, "text": "Fight Club", "likes": 0}
+        ]
+    }
+
+
+@pytest.mark.django_db
+def test_autocomplete_without_prefix(client, fake_users_with_movies):
+    """
+    Given two movies
+    When we call the `api/movies/v1/autocomplete` endpoint without `q`
+    Then we expect no suggestions
+    """
+    # When
+    response = client.get(reverse("movies-autocomplete"))
+    # Then
+    assert response.status_code == http.HTTPStatus.OK
+    assert response.json() == {"results": []}
@@ -0,0 +1,315 @@
+"""Test cases for the `api/movies/v1/bulk` endpoint"""
+import http
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from api.views import MovieBulkAPIView
+from movies.cache import get_catalog_generation
+from movies.genres import sync_movie_genres
+from movies.models import Genre, Movie, MovieDeletion, Reaction
+from movies.reactions import LIKE, set_reaction
+from tests.utils import login_user
+
+
+@pytest.mark.django_db
+def test_bulk_create_movies(
+    client, fake_user_with_one_movie, django_capture_on_commit_callbacks
+):
+    """
+    Given one authenticated user
+    When the user posts three movies, one of them without a title,
+        to the `api/movies/v1/bulk` endpoint
+    Then we expect the two valid movies created with a single `INSERT`
+        and the error of the invalid one by its index
+    """
+    # Given
+    faker_user, _ = fake_user_with_one_movie
+    login_user(client=client, user=faker_user)
+    generation = get_catalog_generation()
+    # When
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        response = client.post(
+            reverse("movies-bulk"),
+            data=[
+                {"title": "First", "desc": "desc", "year": 2001},
+                {"desc": "desc", "year": 2002},
+                {"title": "Third", "desc": "desc", "year": 2003, "likes_count": 5},
+            ],
+            content_type="application/json",
+        )
+    # Then
+    assert response.status_code == http.HTTPStatus.CREATED
+    created = Movie.objects.filter(title__in=["First", "Third"]).order_by("id")
+    assert response.data["created"] == [
+        {"index": 0, "id": created[0].id},
+        {"index": 2, "id": created[1].id},
+    ]
+    assert [error["index"] for error in response.data["errors"]] == [1]
+    assert "title" in response.data["errors"][0]["errors"]
+    assert {movie.author_id for movie in created} == {faker_user.id}
+    assert [movie.likes_count for movie in created] == [0, 0]
+    assert len(callbacks) == 1
+    assert get_catalog_generation() != generation
+
+
+@pytest.mark.django_db
+def test_bulk_create_movies_single_insert(
+    client, fake_user_with_one_movie, django_assert_max_num_queries
+):
+    """
+    Given one authenticated user
+    When the user posts fifty movies to the `api/movies/v1/bulk` endpoint
+    Then we expect a single `INSERT` statement
+    """
+    # Given
+    faker_user, _ = fake_user_with_one_movie
+    login_user(client=client, user=faker_user)
+    # When
+    with django_assert_max_num_queries(10) as captured:
+        response = client.post(
+            reverse("movies-bulk"),
+            data=[
+                {"title": f"movie {index}", "desc": "desc", "year": 2000}
+                for index in range(50)
+            ],
+            content_type="application/json",
+        )
+    # Then
+    assert response.status_code == http.HTTPStatus.CREATED
+    assert len(response.data["created"]) == 50
+    inserts = [
+        query
+        for query in captured.captured_queries
+        if query["sql"].startswith('INSERT INTO "movies_movie"')
+    ]
+    assert len(inserts) == 1
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "data",
+    [
+        [],
+        {"title": "Not a list", "desc": "desc", "year": 2000},
+        [{"desc": "desc", "year": 2000}],
+        [{"title": "t", "desc": "desc", "year": 2000}] * 3,
+    ],
+)
+def test_bulk_create_movies_invalid(client, fake_user, monkeypatch, data):
+    """
+    Given one authenticated user and a maximum of two movies per request
+    When the user posts an empty list, a single movie, only invalid movies
+        or too many movies to the `api/movies/v1/bulk` endpoint
+    Then we expect a `http.HTTPStatus.BAD_REQUEST` and no movies created
+    """
+    monkeypatch.setattr(MovieBulkAPIView, "max_batch_size", 2)
+    login_user(client=client, user=fake_user)
+    response = client.post(
+        reverse("movies-bulk"), data=data, content_type="application/json"
+    )
+    assert response.status_code == http.HTTPStatus.BAD_REQUEST
+    assert Movie.objects.count() == 0
+
+
+@pytest.mark.django_db
+def test_bulk_create_movies_user_non_authenticated(client):
+    """
+    Given a non-authenticated user
+    When the user posts movies to the `api/movies/v1/bulk` endpoint
+    Then we expect a `http.HTTPStatus.FORBIDDEN`
+    """
+    response = client.post(
+        reverse("movies-bulk"),
+        data=[{"title": "t", "desc": "desc", "year": 2000}],
+        content_type="application/json",
+    )
+    assert response.status_code == http.HTTPStatus.FORBIDDEN
+
+
+@pytest.mark.django_db
+def test_bulk_update_movies(
+    client, fake_user, django_capture_on_commit_callbacks, django_assert_max_num_queries
+):
+    """
+    Given one authenticated user with three movies
+    When the user patches the genre of two of them
+        at the `api/movies/v1/bulk` endpoint
+    Then we expect the two movies updated with a single `UPDATE`
+    """
+    # Given
+    movies = [
+        Movie.objects.create(author=fake_user, title=f"movie {index}", year=2000)
+        for index in range(3)
+    ]
+    login_user(client=client, user=fake_user)
+    ids = [movies[0].id, movies[2].id]
+    # When
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        # including the sync of their genres (see `movies.genres`)
+        with django_assert_max_num_queries(15) as captured:
+            response = client.patch(
+                reverse("movies-bulk"),
+                data={"ids": ids, "changes": {"genre": "Drama", "likes_count": 9}},
+                content_type="application/json",
+            )
+    # Then
+    assert response.status_code == http.HTTPStatus.OK
+    assert response.data == {"updated": ids}
+    assert dict(Movie.objects.values_list("id", "genre")) == {
+        movies[0].id: "Drama",
+        movies[1].id: "",
+        movies[2].id: "Drama",
+    }
+    assert not Movie.objects.filter(likes_count__gt=0).exists()
+    assert list(Genre.objects.values_list("slug", "movies_count")) == [("drama", 2)]
+    updates = [
+        query
+        for query in captured.captured_queries
+        if query["sql"].startswith('UPDATE "movies_movie"')
+    ]
+    assert len(updates) == 1
+    assert len(callbacks) == 1
+
+
+@pytest.mark.django_db
+def test_bulk_delete_movies(
+    client, fake_users_with_movies, django_assert_max_num_queries
+):
+    """
+    Given two users with one movie each, and a like on the second user's movies
+    When the second user deletes their movies at the `api/movies/v1/bulk` endpoint
+    Then we expect the movies and their reactions deleted
+        with one `DELETE` statement per table
+    """
+    # Given
+    users, movies = fake_users_with_movies
+    first_user, second_user = users
+    other_movie = Movie.objects.create(author=second_user, title="other", year=2000)
+    set_reaction(movies[1].id, first_user.id, LIKE)
+    set_reaction(other_movie.id, first_user.id, LIKE)
+    login_user(client=client, user=second_user)
+    # When
+    with django_assert_max_num_queries(12) as captured:
+        response = client.delete(
+            reverse("movies-bulk"),
+            data={"ids": [movies[1].id, other_movie.id]},
+            content_type="application/json",
+        )
+    # Then
+    assert response.status_code == http.HTTPStatus.NO_CONTENT
+    assert list(Movie.objects.all()) == [movies[0]]
+    assert not Reaction.objects.exists()
+    deletes = [
+        query["sql"]
+        for query in captured.captured_queries
+        if query["sql"].startswith("DELETE")
+    ]
+    # the movies, their reactions and their genres
+    assert len(deletes) == 3
+
+
+def _bulk_delete_queries(client, user, count: int, genre: str = "") -> list:
+    """Returns the queries of the bulk delete of `count` new movies of the `user`"""
+    movies = Movie.objects.bulk_create(
+        [
+            Movie(author=user, title=f"movie {index}", genre=genre, year=2000)
+            for index in range(count)
+        ]
+    )
+    sync_movie_genres({movie.id: genre for movie in movies})
+    with CaptureQueriesContext(connection) as captured:
+        response = client.delete(
+            reverse("movies-bulk"),
+            data={"ids": [movie.id for movie in movies]},
+            content_type="application/json",
+        )
+    assert response.status_code == http.HTTPStatus.NO_CONTENT
+    return [query["sql"] for query in captured.captured_queries]
+
+
+@pytest.mark.django_db
+def test_bulk_delete_movies_queries_dont_grow(client, fake_user):
+    """
+    Given one authenticated user
+    When the user deletes 5 and then 50 movies of two genres
+        at the `api/movies/v1/bulk` endpoint
+    Then we expect the same number of queries, with the tombstones of
+        the deleted movies written by a single `INSERT` and the genre counts
+        changed by a single `UPDATE`
+    """
+    # Given
+    login_user(client=client, user=fake_user)
+    # When
+    few = _bulk_delete_queries(client, fake_user, 5, genre="Drama/Comedy")
+    many = _bulk_delete_queries(client, fake_user, 50, genre="Drama/Comedy")
+    # Then
+    assert len(few) == len(many)
+    assert MovieDeletion.objects.count() == 55
+    assert dict(Genre.objects.values_list("slug", "movies_count")) == {
+        "drama": 0,
+        "comedy": 0,
+    }
+    for prefix in ('INSERT INTO "movies_moviedeletion"', 'UPDATE "movies_genre"'):
+        assert len([sql for sql in many if sql.startswith(prefix)]) == 1
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("method", ["patch", "delete"])
+def test_bulk_change_movies_of_other_users(client, fake_users_with_movies, method):
+    """
+    Given two users with one movie each
+    When the first user patches/deletes both movies at the `api/movies/v1/bulk` endpoint
+    Then we expect a `http.HTTPStatus.FORBIDDEN` with the id of the other user's movie
+        and no movie changed
+    """
+    # Given
+    users, movies = fake_users_with_movies
+    login_user(client=client, user=users[0])
+    # When
+    response = getattr(client, method)(
+        reverse("movies-bulk"),
+        data={"ids": [movie.id for movie in movies], "changes": {"genre": "Drama"}},
+        content_type="application/json",
+    )
+    # Then
+    assert response.status_code == http.HTTPStatus.FORBIDDEN
+    assert response.data["detail"].endswith(f": {movies[1].id}")
+    assert Movie.objects.count() == 2
+    assert not Movie.objects.filter(genre="Drama").exists()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        ({"ids": [99999], "changes": {"genre": "Drama"}}, http.HTTPStatus.NOT_FOUND),
+        ({"ids": [], "changes": {"genre": "Drama"}}, http.HTTPStatus.BAD_REQUEST),
+        ({"changes": {"genre": "Drama"}}, http.HTTPStatus.BAD_REQUEST),
+        ({"ids": "own", "changes": {"title": ""}}, http.HTTPStatus.BAD_REQUEST),
+        ({"ids": "own", "changes": {"likes_count": 1}}, http.HTTPStatus.BAD_REQUEST),
+        ({"ids": "own"}, http.HTTPStatus.BAD_REQUEST),
+    ],
+)
+def test_bulk_update_movies_invalid(client, fake_user_with_one_movie, data, expected):
+    """
+    Given one user with one movie
+    When the user patches unknown, none or invalid ids
+        or invalid/empty changes at the `api/movies/v1/bulk` endpoint
+    Then we expect the right error and the movie unchanged
+    """
+    # Given
+    faker_user, movie = fake_user_with_one_movie
+    login_user(client=client, user=faker_user)
+    if data.get("ids") == "own":
+        data = {**data, "ids": [movie.id]}
+    # When
+    response = client.patch(
+        reverse("movies-bulk"), data=data, content_type="application/json"
+    )
+    # Then
+    assert response.status_code == expected
+    movie_after = Movie.objects.get(id=movie.id)
+    assert (movie_after.title, movie_after.genre) == (movie.title, movie.genre)
@@ -0,0 +1,136 @@
+"""Test cases for the `api/movies/v1/changes` endpoint"""
+import http
+
+import pytest
+from django.urls import reverse
+
+from api.views import MovieChangesAPIView
+from movies.models import Movie, MovieDeletion
+from tests.utils import login_user
+
+
+def _sync(client, cursor: str = "", query: str = ""):
+    """Returns the response data of the changes after the `cursor`"""
+    response = client.get(reverse("movies-changes") + f"?cursor={cursor}&{query}")
+    assert response.status_code == http.HTTPStatus.OK
+    return response.data
+
+
+@pytest.mark.django_db
+def test_changes_after_cursor(client, fake_users_with_movies, settings):
+    """
+    Given two users with one movie each, synced from a client
+    When the first movie is updated, the second one is deleted
+        and a new movie is created
+    Then we expect only the updated/new movies and the id of the deleted one
+        after the cursor of the client
+    """
+    # Given
+    settings.MOVIES_CHANGES_SETTLE_SECONDS = 0
+    users, movies = fake_users_with_movies
+    first_sync = _sync(client, query="fields=id,title")
+    assert first_sync["changed"] == [
+        {"id": movie.id, "title": movie.title} for movie in movies
+    ]
+    assert (first_sync["deleted"], first_sync["has_more"]) == ([], False)
+    # When
+    movies[0].title = "New title"
+    movies[0].save()
+    login_user(client=client, user=users[1])
+    client.delete(reverse("movies-detail", args=[movies[1].id]))
+    new_movie = Movie.objects.create(author=users[0], title="New movie", year=2023)
+    second_sync = _sync(client, first_sync["cursor"], query="fields=id,title")
+    # Then
+    assert second_sync["changed"] == [
+        {"id": movies[0].id, "title": "New title"},
+        {"id": new_movie.id, "title": "New movie"},
+    ]
+    assert second_sync["deleted"] == [movies[1].id]
+    third_sync = _sync(client, second_sync["cursor"])
+    assert (third_sync["changed"], third_sync["deleted"]) == ([], [])
+
+
+@pytest.mark.django_db
+def test_changes_after_reaction(client, fake_users_with_movies, settings):
+    """
+    Given two users with one movie each, synced from a client
+    When the first user likes the movie of the second one
+    Then we expect only the liked movie with its new counters
+        after the cursor of the client
+    """
+    # Given
+    settings.MOVIES_CHANGES_SETTLE_SECONDS = 0
+    users, movies = fake_users_with_movies
+    first_sync = _sync(client, query="fields=id,likes_count")
+    # When
+    login_user(client=client, user=users[0])
+    client.put(
+        reverse("movies-reaction", args=[movies[1].id]),
+        data={"reaction": "like"},
+        content_type="application/json",
+    )
+    second_sync = _sync(client, first_sync["cursor"], query="fields=id,likes_count")
+    # Then
+    assert second_sync["changed"] == [{"id": movies[1].id, "likes_count": 1}]
+
+
+@pytest.mark.django_db
+def test_changes_pages(client, fake_user, settings, monkeypatch):
+    """
+    Given three movies and one change per page
+    When a client syncs while `has_more` is `True`
+    Then we expect every movie once, in the order they changed
+    """
+    # Given
+    settings.MOVIES_CHANGES_SETTLE_SECONDS = 0
+    monkeypatch.setattr(MovieChangesAPIView, "page_size", 1)
+    movies = [
+        Movie.objects.create(author=fake_user, title=f"movie {index}", year=2000)
+        for index in range(3)
+    ]
+    # When
+    synced, cursor, has_more = [], "", True
+    while has_more:
+        data = _sync(client, cursor, query="fields=id")
+        synced.extend(movie["id"] for movie in data["changed"])
+        cursor, has_more = data["cursor"], data["has_more"]
+    # Then
+    assert synced == [movie.id for movie in movies]
+
+
+@pytest.mark.django_db
+def test_changes_wait_to_settle(client, fake_user_with_one_movie, settings):
+    """
+    Given a movie which was just created
+    When a client syncs within `MOVIES_CHANGES_SETTLE_SECONDS`
+    Then we expect the movie to be left for the next sync
+    """
+    settings.MOVIES_CHANGES_SETTLE_SECONDS = 60
+    assert _sync(client)["changed"] == []
+
+
+@pytest.mark.django_db
+def test_delete_movie_keeps_tombstone(client, fake_user_with_one_movie):
+    """
+    Given one user with one movie
+    When the user deletes the movie from the web-app
+    Then we expect a tombstone of the movie
+    """
+    faker_user, movie = fake_user_with_one_movie
+    login_user(client=client, user=faker_user)
+    client.post(reverse("delete-movie", args=[movie.id]))
+    assert list(MovieDeletion.objects.values_list("movie_id", flat=True)) == [movie.id]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "cursor", ["invalid", "WzFd", "WyJub3QgYSBkYXRlIiwxLCIyMDIzLTAxLTAxIiwxXQ=="]
+)
+def test_changes_invalid_cursor(client, cursor):
+    """
+    Given an invalid cursor
+    When a client syncs with it
+    Then we expect a `http.HTTPStatus.NOT_FOUND`
+    """
+    response = client.get(reverse("movies-changes") + f"?cursor={cursor}")
+    assert response.status_code == http.HTTPStatus.NOT_FOUND
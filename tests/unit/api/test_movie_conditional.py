@@ -0,0 +1,104 @@
+"""Test cases for the conditional `GET` requests of the movies API"""
+import http
+
+import pytest
+from django.urls import reverse
+from django.utils.http import http_date
+
+from movies.reactions import LIKE, set_reaction
+
+
+@pytest.mark.django_db
+def test_list_movie_not_modified(
+    client, fake_users_with_movies, django_assert_num_queries
+):
+    """
+    Given a list of the movies with its `ETag`
+    When we call the `api/movies/v1/` endpoint with `If-None-Match`
+    Then we expect a `304` without any query
+    """
+    # Given
+    url = reverse("movies") + "?fields=id"
+    etag = client.get(url).headers["ETag"]
+    # When
+    with django_assert_num_queries(0):
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    # Then
+    assert response.status_code == http.HTTPStatus.NOT_MODIFIED
+    assert response.headers["ETag"] == etag
+    assert not response.content
+
+
+@pytest.mark.django_db
+def test_list_movie_modified(
+    client, fake_users_with_movies, django_capture_on_commit_callbacks
+):
+    """
+    Given a list of the movies with its `ETag`
+    When a movie gets a like
+    Then we expect the changed list with a new `ETag`
+    """
+    # Given
+    users, movies = fake_users_with_movies
+    etag = client.get(reverse("movies")).headers["ETag"]
+    # When
+    with django_capture_on_commit_callbacks(execute=True):
+        set_reaction(movies[1].id, users[0].id, LIKE)
+    response = client.get(reverse("movies"), HTTP_IF_NONE_MATCH=etag)
+    # Then
+    assert response.status_code == http.HTTPStatus.OK
+    assert response.headers["ETag"] != etag
+    assert response.data["results"][1]["likes_count"] == 1
+
+
+@pytest.mark.django_db
+def test_list_movie_etag_per_representation(client, fake_users_with_movies):
+    """
+    Given a list of the movies with its `ETag`
+    When we ask for other fields with the same `If-None-Match`
+    Then we expect the new representation
+    """
+    # Given
+    etag = client.get(reverse("movies")).headers["ETag"]
+    # When
+    response = client.get(reverse("movies") + "?fields=id", HTTP_IF_NONE_MATCH=etag)
+    # Then
+    assert response.status_code == http.HTTPStatus.OK
+    assert response.headers["ETag"] != etag
+
+
+@pytest.mark.django_db
+def test_movie_detail_not_modified(
+    client, fake_user_with_one_movie, django_assert_num_queries
+):
+    """
+    Given a movie retrieved with its `Last-Modified` date
+    When we call the `api/movies/v1/<id>` endpoint with `If-Modified-Since`
+    Then we expect a `304` with only the query of the movie dates
+    """
+    # Given
+    _, movie = fake_user_with_one_movie
+    url = reverse("movies-detail", args=[movie.id])
+    response = client.get(url)
+    assert response.headers["Last-Modified"] == http_date(movie.changed_at.timestamp())
+    # When
+    with django_assert_num_queries(1):
+        response = client.get(
+            url, HTTP_IF_MODIFIED_SINCE=response.headers["Last-Modified"]
+        )
+    # Then
+    assert response.status_code == http.HTTPStatus.NOT_MODIFIED
+
+
+@pytest.mark.django_db
+def test_missing_movie_detail_has_no_validators(client):
+    """
+    Given no movies
+    When we call the `api/movies/v1/<id>` endpoint
+    Then we expect a `404` without an `ETag`
+    """
+    # When
+    response = client.get(reverse("movies-detail", args=[1]))
+    # Then
+    assert response.status_code == http.HTTPStatus.NOT_FOUND
+    assert "ETag" not in response.headers
@@ -39,8 +39,8 @@ def test_edit_movie_user_authenticated(client, fake_user_with_one_movie):
         "desc": movie.desc,
         "genre": movie.genre,
         "year": movie.year,
-        "likes": [],
-        "dislikes": [],
+        "likes_count": 0,
+        "dislikes_count": 0,
         "id": movie.id,
     }
     assert Movie.objects.count() == 1
@@ -94,8 +94,8 @@ def test_get_movie_user_authenticated(client, fake_user_with_one_movie):
         "desc": movie.desc,
         "genre": movie.genre,
         "year": movie.year,
-        "likes": [],
-        "dislikes": [],
+        "likes_count": 0,
+        "dislikes_count": 0,
         "id": movie.id,
     }
     assert Movie.objects.count() == 1
@@ -123,8 +123,8 @@ def test_get_detail_user_non_authenticated_user(client, fake_user_with_one_movie
         "desc": movie.desc,
         "genre": movie.genre,
         "year": movie.year,
-        "likes": [],
-        "dislikes": [],
+        "likes_count": 0,
+        "dislikes_count": 0,
         "id": movie.id,
     }
     assert Movie.objects.count() == 1
@@ -171,3 +171,27 @@ def test_delete_detail_user_non_authenticated_user(client, fake_user_with_one_mo
     # Then
     assert response.status_code == http.HTTPStatus.FORBIDDEN
     assert Movie.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_get_movie_sparse_fields(client, fake_user_with_one_movie):
+    """
+    Given one user with one movie
+    When we call the `api/movies/v1/{id}` endpoint
+        with `fields=title,dislikes_count&expand=author`
+    Then we expect only these fields and the author of the movie
+    """
+    # Given
+    faker_user, movie = fake_user_with_one_movie
+    # When
+    response = client.get(
+        reverse("movies-detail", args=[movie.id])
+        + "?fields=title,dislikes_count&expand=author"
+    )
+    # Then
+    assert response.status_code == http.HTTPStatus.OK
+    assert response.data == {
+        "title": movie.title,
+        "dislikes_count": 0,
+        "author": {"id": faker_user.id, "username": faker_user.username},
+    }
@@ -0,0 +1,124 @@
+"""Test cases for the `api/movies/v1/export` endpoint"""
+import datetime
+import http
+import json
+
+import pytest
+from django.urls import reverse
+
+from movies.models import Movie
+from movies.reactions import LIKE, set_reaction
+from tests.utils import login_user
+
+
+def _export(client, query: str = ""):
+    """Returns the response of the export and its decoded lines"""
+    response = client.get(reverse("movies-export") + query)
+    if not response.streaming:
+        return response, []
+    content = b"".join(response.streaming_content)
+    return response, [json.loads(line) for line in content.splitlines()]
+
+
+@pytest.mark.django_db
+def test_export_movies(client, fake_users_with_movies, settings):
+    """
+    Given two users with one movie each and a like on the second movie
+    When we call the `api/movies/v1/export` endpoint, reading two movies per chunk
+    Then we expect one JSON line per movie with its author and reaction counts
+    """
+    # Given
+    settings.MOVIES_EXPORT_CHUNK_SIZE = 2
+    users, movies = fake_users_with_movies
+    extra = Movie.objects.create(author=users[0], title="extra", year=2000)
+    set_reaction(movies[1].id, users[0].id, LIKE)
+    login_user(client=client, user=users[0])
+    # When
+    response, lines = _export(client)
+    # Then
+    assert response.status_code == http.HTTPStatus.OK
+    assert response["Content-Type"] == "application/x-ndjson"
+    assert [line["id"] for line in lines] == [movies[0].id, movies[1].id, extra.id]
+    assert lines[1]["author"] == {"id": users[1].id, "username": users[1].username}
+    assert (lines[1]["likes_count"], lines[1]["dislikes_count"]) == (1, 0)
+    assert lines[1]["title"] == movies[1].title
+    assert set(lines[0]) == {
+        "id",
+        "title",
+        "desc",
+        "genre",
+        "year",
+        "likes_count",
+        "dislikes_count",
+        "author",
+        "created_date",
+        "updated_date",
+    }
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "since", ["2023-03-01", "2023-03-01T00:00:00", "2023-03-01T00:00:00Z"]
+)
+def test_export_movies_since(client, fake_users_with_movies, since):
+    """
+    Given two movies, the first one last changed before March 2023
+    When we call the `api/movies/v1/export` endpoint with `since` March 2023
+    Then we expect only the second movie
+    """
+    # Given
+    users, movies = fake_users_with_movies
+    february = datetime.datetime(2023, 2, 1, tzinfo=datetime.timezone.utc)
+    march = datetime.datetime(2023, 3, 2, tzinfo=datetime.timezone.utc)
+    Movie.objects.filter(id=movies[0].id).update(
+        updated_date=february, changed_at=february
+    )
+    Movie.objects.filter(id=movies[1].id).update(updated_date=march, changed_at=march)
+    login_user(client=client, user=users[0])
+    # When
+    _, lines = _export(client, f"?since={since}")
+    # Then
+    assert [line["id"] for line in lines] == [movies[1].id]
+
+
+@pytest.mark.django_db
+def test_export_movies_since_reaction(client, fake_users_with_movies):
+    """
+    Given two movies last updated before March 2023
+    When the first one is liked
+        and we call the `api/movies/v1/export` endpoint with `since` March 2023
+    Then we expect only the first movie, with its new counters
+    """
+    # Given
+    users, movies = fake_users_with_movies
+    february = datetime.datetime(2023, 2, 1, tzinfo=datetime.timezone.utc)
+    Movie.objects.update(updated_date=february, changed_at=february)
+    login_user(client=client, user=users[0])
+    # When
+    set_reaction(movies[0].id, users[1].id, LIKE)
+    _, lines = _export(client, "?since=2023-03-01")
+    # Then
+    assert [(line["id"], line["likes_count"]) for line in lines] == [(movies[0].id, 1)]
+
+
+@pytest.mark.django_db
+def test_export_movies_invalid_since(client, fake_user):
+    """
+    Given one authenticated user
+    When we call the `api/movies/v1/export` endpoint with an invalid `since`
+    Then we expect a `http.HTTPStatus.BAD_REQUEST`
+    """
+    login_user(client=client, user=fake_user)
+    response, _ = _export(client, "?since=yesterday")
+    assert response.status_code == http.HTTPStatus.BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_export_movies_user_non_authenticated(client):
+    """
+    Given a non-authenticated user
+    When we call the `api/movies/v1/export` endpoint
+    Then we expect a `http.HTTPStatus.FORBIDDEN`
+    """
+    response, _ = _export(client)
+    assert response.status_code == http.HTTPStatus.FORBIDDEN
@@ -39,9 +39,9 @@ def test_add_new_movie_user_authenticated(client, fake_user_with_one_movie):
         "title": "New movie title",
         "desc": "New movie description",
         "genre": "New genre",
-        "year": "1999",
-        "likes": [],
-        "dislikes": [],
+        "year": 1999,
+        "likes_count": 0,
+        "dislikes_count": 0,
         "id": movie.id + 1,
     }
     assert Movie.objects.count() == 2
@@ -81,9 +81,9 @@ def test_add_new_movie_user_authenticated_update_likes(
         "title": "New movie title",
         "desc": "New movie description",
         "genre": "New genre",
-        "year": "1999",
-        "likes": [],
-        "dislikes": [],
+        "year": 1999,
+        "likes_count": 0,
+        "dislikes_count": 0,
         "id": movie.id + 1,
     }
     assert Movie.objects.count() == 2
@@ -0,0 +1,133 @@
+"""Test cases for the reaction view:
+`api/movies/v1/{id}/reaction`
+"""
+import http
+
+import pytest
+from django.urls import reverse
+
+from movies.reactions import LIKE, set_reaction
+from tests.utils import login_user
+
+
+@pytest.mark.django_db
+def test_get_reaction_state(client, fake_users_with_movies):
+    """
+    Given two users and a movie liked from the first user
+    When the first user calls the `api/movies/v1/{id}/reaction` endpoint
+    Then we expect the counters of the movie and the like of the user
+    """
+    # Given
+    users, movies = fake_users_with_movies
+    first_user, _ = users
+    _, second_movie = movies
+    set_reaction(second_movie.id, first_user.id, LIKE)
+    login_user(client=client, user=first_user)
+    # When
+    response = client.get(reverse("movies-reaction", args=[second_movie.id]))
+    # Then
+    assert response.status_code == http.HTTPStatus.OK
+    assert response.json() == {
+        "id": second_movie.id,
+        "likes_count": 1,
+        "dislikes_count": 0,
+        "reaction": "like",
+    }
+
+
+@pytest.mark.django_db
+def test_put_and_delete_reaction(client, fake_users_with_movies):
+    """
+    Given two users and their movies
+    When the first user likes, dislikes and un-reacts the movie of the second user
+        through the `api/movies/v1/{id}/reaction` endpoint
+    Then we expect the new reaction state in every response
+    """
+    # Given
+    users, movies = fake_users_with_movies
+    first_user, _ = users
+    _, second_movie = movies
+    login_user(client=client, user=first_user)
+    url = reverse("movies-reaction", args=[second_movie.id])
+    # When
+    liked = client.put(url, data={"reaction": "like"}, content_type="application/json")
+    disliked = client.put(
+        url, data={"reaction": "dislike"}, content_type="application/json"
+    )
+    deleted = client.delete(url)
+    # Then
+    assert [response.status_code for response in (liked, disliked, deleted)] == [
+        http.HTTPStatus.OK
+    ] * 3
+    assert [
+        (
+            response.json()["likes_count"],
+            response.json()["dislikes_count"],
+            response.json()["reaction"],
+        )
+        for response in (liked, disliked, deleted)
+    ] == [(1, 0, "like"), (0, 1, "dislike"), (0, 0, None)]
+
+
+@pytest.mark.django_db
+def test_put_reaction_invalid(client, fake_users_with_movies):
+    """
+    Given two users and their movies
+    When the first user sends an unknown reaction
+    Then we expect a `http.HTTPStatus.BAD_REQUEST`
+    """
+    users, movies = fake_users_with_movies
+    login_user(client=client, user=users[0])
+    response = client.put(
+        reverse("movies-reaction", args=[movies[1].id]),
+        data={"reaction": "love"},
+        content_type="application/json",
+    )
+    assert response.status_code == http.HTTPStatus.BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_put_reaction_own_movie(client, fake_user_with_one_movie):
+    """
+    Given one user with one movie
+    When the user likes the movie through the API
+    Then we expect a `http.HTTPStatus.FORBIDDEN` and no reaction
+    """
+    user, movie = fake_user_with_one_movie
+    login_user(client=client, user=user)
+    response = client.put(
+        reverse("movies-reaction", args=[movie.id]),
+        data={"reaction": "like"},
+        content_type="application/json",
+    )
+    assert response.status_code == http.HTTPStatus.FORBIDDEN
+    assert not movie.reactions.exists()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("method", ["get", "put", "delete"])
+def test_reaction_missing_movie(client, fake_user, method):
+    """
+    Given one user
+    When the user calls the reaction endpoint of a movie which doesn't exist
+    Then we expect a `http.HTTPStatus.NOT_FOUND`
+    """
+    login_user(client=client, user=fake_user)
+    response = getattr(client, method)(
+        reverse("movies-reaction", args=[99999]),
+        data={"reaction": "like"},
+        content_type="application/json",
+    )
+    assert response.status_code == http.HTTPStatus.NOT_FOUND
+
+
+@pytest.mark.django_db
+def test_reaction_user_non_authenticated(client, fake_user_with_one_movie):
+    """
+    Given one movie
+    When a non-authenticated user calls the reaction endpoint
+    Then we expect a `http.HTTPStatus.FORBIDDEN`
+    """
+    _, movie = fake_user_with_one_movie
+    response = client.get(reverse("movies-reaction", args=[movie.id]))
+    assert response.status_code == http.HTTPStatus.FORBIDDEN
@@ -0,0 +1,68 @@
+"""Test cases for the reactors views:
+`api/movies/v1/{id}/likes` and `api/movies/v1/{id}/dislikes`
+"""
+import http
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+
+from movies.reactions import DISLIKE, LIKE, set_reaction
+
+
+@pytest.mark.django_db
+def test_list_movie_likes_cursor_pagination(client, fake_user_with_one_movie):
+    """
+    Given one movie liked from three users and disliked from another one
+    When we call the `api/movies/v1/{id}/likes` endpoint with `page_size=2`
+        and follow the `next` links
+    Then we expect the users who liked the movie once, in the order they liked it
+    """
+    # Given
+    _, movie = fake_user_with_one_movie
+    User = get_user_model()  # pylint: disable=invalid-name
+    users = [User.objects.create(username=f"user{index}") for index in range(4)]
+    for user in users[:3]:
+        set_reaction(movie.id, user.id, LIKE)
+    set_reaction(movie.id, users[3].id, DISLIKE)
+    # When
+    url = reverse("movies-likes", args=[movie.id]) + "?page_size=2"
+    results = []
+    while url:
+        response = client.get(url)
+        assert response.status_code == http.HTTPStatus.OK
+        results.extend(response.data["results"])
+        url = response.data["next"]
+    # Then
+    assert [(result["user"], result["username"]) for result in results] == [
+        (user.id, user.username) for user in users[:3]
+    ]
+
+
+@pytest.mark.django_db
+def test_list_movie_dislikes(client, fake_users_with_movies):
+    """
+    Given two users and a movie disliked from the first user
+    When we call the `api/movies/v1/{id}/dislikes` endpoint
+    Then we expect only the first user
+    """
+    # Given
+    users, movies = fake_users_with_movies
+    set_reaction(movies[1].id, users[0].id, DISLIKE)
+    # When
+    response = client.get(reverse("movies-dislikes", args=[movies[1].id]))
+    # Then
+    assert response.status_code == http.HTTPStatus.OK
+    assert response.data["next"] is None
+    assert [result["user"] for result in response.data["results"]] == [users[0].id]
+
+
+@pytest.mark.django_db
+def test_list_movie_likes_missing_movie(client):
+    """
+    Given no movies
+    When we call the `api/movies/v1/{id}/likes` endpoint
+    Then we expect a `http.HTTPStatus.NOT_FOUND`
+    """
+    response = client.get(reverse("movies-likes", args=[99999]))
+    assert response.status_code == http.HTTPStatus.NOT_FOUND
@@ -4,7 +4,10 @@ import http
 import pytest
 from django.urls import reverse
 
+from movies.conditional import get_catalog_last_modified
 from movies.models import Movie
+from movies.pagination import encode_cursor
+from movies.reactions import DISLIKE, LIKE, set_reaction
 
 
 @pytest.mark.django_db
@@ -23,10 +26,269 @@ def test_list_movie(client, fake_user_with_one_movie):
     response = client.get(reverse("movies"))
     # Then
     assert response.status_code == http.HTTPStatus.OK
-    assert response.data[0]["title"] == movie.title
-    assert response.data[0]["desc"] == movie.desc
-    assert response.data[0]["genre"] == movie.genre
-    assert response.data[0]["genre"] == movie.genre
-    assert response.data[0]["year"] == movie.year
-    assert response.data[0]["likes"] == []
-    assert response.data[0]["dislikes"] == []
+    assert response.data["next"] is None
+    assert response.data["results"][0]["title"] == movie.title
+    assert response.data["results"][0]["desc"] == movie.desc
+    assert response.data["results"][0]["genre"] == movie.genre
+    assert response.data["results"][0]["genre"] == movie.genre
+    assert response.data["results"][0]["year"] == movie.year
+    assert response.data["results"][0]["likes_count"] == 0
+    assert response.data["results"][0]["dislikes_count"] == 0
+    assert "likes" not in response.data["results"][0]
+
+
+@pytest.mark.django_db
+def test_list_movie_cursor_pagination(client, fake_user):
+    """
+    Given five movies
+    When we call the `api/movies/v1/` endpoint with `page_size=2`
+        and follow the `next` links
+    Then we expect all the movies once, in `id` order
+    """
+    # Given
+    movies = [
+        Movie.objects.create(author=fake_user, title=f"movie {index}", year=2000)
+        for index in range(5)
+    ]
+    # When
+    url = reverse("movies") + "?page_size=2"
+    titles = []
+    while url:
+        response = client.get(url)
+        assert response.status_code == http.HTTPStatus.OK
+        assert len(response.data["results"]) <= 2
+        titles.extend(movie["title"] for movie in response.data["results"])
+        url = response.data["next"]
+    # Then
+    assert titles == [movie.title for movie in movies]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "cursor",
+    ["not-a-cursor", encode_cursor([{"id": 1}]), encode_cursor(["one"])],
+)
+def test_list_movie_invalid_cursor(client, cursor):
+    """
+    Given a malformed cursor or a cursor with a value of the wrong type
+    When we call the `api/movies/v1/` endpoint
+    Then we expect a `http.HTTPStatus.NOT_FOUND`
+    """
+    # When
+    response = client.get(reverse("movies") + f"?cursor={cursor}")
+    # Then
+    assert response.status_code == http.HTTPStatus.NOT_FOUND
+
+
+@pytest.mark.django_db
+def test_list_movie_by_release_years(client, fake_users_with_movies):
+    """
+    Given two movies released in 2011 and 1999
+    When we call the `api/movies/v1/` endpoint with release year filters
+    Then we expect only the movies released within them
+    """
+    # Given
+    _, movies = fake_users_with_movies
+    # When
+    by_decade = client.get(reverse("movies") + "?decade=1990")
+    by_range = client.get(reverse("movies") + "?year_min=2000&year_max=2011")
+    # Then
+    assert [movie["id"] for movie in by_decade.data["results"]] == [movies[1].id]
+    assert [movie["id"] for movie in by_range.data["results"]] == [movies[0].id]
+
+
+@pytest.mark.django_db
+def test_list_movie_invalid_release_year(client):
+    """
+    Given an invalid `year_min`
+    When we call the `api/movies/v1/` endpoint
+    Then we expect a `http.HTTPStatus.BAD_REQUEST`
+    """
+    # When
+    response = client.get(reverse("movies") + "?year_min=abc")
+    # Then
+    assert response.status_code == http.HTTPStatus.BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_list_movie_include_reactors(
+    client, fake_users_with_movies, django_assert_num_queries
+):
+    """
+    Given two users and a movie liked and disliked from other users
+    When we call the `api/movies/v1/` endpoint with `include=reactors`
+    Then we expect the `likes`/`dislikes` user ids lists
+        with one query for the movies and one for their reactions
+    """
+    # Given
+    users, movies = fake_users_with_movies
+    first_user, second_user = users
+    set_reaction(movies[1].id, first_user.id, LIKE)
+    set_reaction(movies[0].id, second_user.id, DISLIKE)
+    # the validator of the conditional responses is cached already
+    get_catalog_last_modified()
+    # When
+    with django_assert_num_queries(2):
+        response = client.get(reverse("movies") + "?include=reactors")
+    # Then
+    assert response.status_code == http.HTTPStatus.OK
+    assert [
+        (movie["likes_count"], movie["likes"], movie["dislikes"])
+        for movie in response.data["results"]
+    ] == [(0, [], [second_user.id]), (1, [first_user.id], [])]
+
+
+@pytest.mark.django_db
+def test_list_movie_sparse_fields(
+    client, fake_users_with_movies, django_assert_num_queries
+):
+    """
+    Given two movies
+    When we call the `api/movies/v1/` endpoint with `fields=id,title,year,likes_count`
+    Then we expect only these fields
+        and the other columns to be left out of the query
+    """
+    # Given
+    _, movies = fake_users_with_movies
+    # the validator of the conditional responses is cached already
+    get_catalog_last_modified()
+    # When
+    with django_assert_num_queries(1) as captured:
+        response = client.get(reverse("movies") + "?fields=id,title,year,likes_count")
+    # Then
+    assert response.status_code == http.HTTPStatus.OK
+    assert response.data["results"] == [
+        {"id": movie.id, "title": movie.title, "year": movie.year, "likes_count": 0}
+        for movie in movies
+    ]
+    sql = captured.captured_queries[0]["sql"]
+    assert '"desc"' not in sql
+    assert '"genre"' not in sql
+
+
+@pytest.mark.django_db
+def test_list_movie_expand_author(
+    client, fake_users_with_movies, django_assert_num_queries
+):
+    """
+    Given two users with one movie each
+    When we call the `api/movies/v1/` endpoint with `fields=id&expand=author`
+    Then we expect the authors of the movies joined in the same query
+    """
+    # Given
+    users, movies = fake_users_with_movies
+    # the validator of the conditional responses is cached already
+    get_catalog_last_modified()
+    # When
+    with django_assert_num_queries(1):
+        response = client.get(reverse("movies") + "?fields=id&expand=author")
+    # Then
+    assert response.status_code == http.HTTPStatus.OK
+    assert response.data["results"] == [
+        {"id": movie.id, "author": {"id": user.id, "username": user.username}}
+        for movie, user in zip(movies, users)
+    ]
+
+
+@pytest.mark.django_db
+def test_list_movie_by_ids(client, fake_user, django_assert_num_queries):
+    """
+    Given three movies
+    When we call the `api/movies/v1/` endpoint with `ids` of two of them,
+        in reverse order, a duplicate and an unknown id
+    Then we expect the two movies in the requested order with a single query
+        and the unknown id as missing
+    """
+    # Given
+    movies = [
+        Movie.objects.create(author=fake_user, title=f"movie {index}", year=2000)
+        for index in range(3)
+    ]
+    ids = f"{movies[2].id},99999,{movies[0].id},{movies[2].id}"
+    # the validator of the conditional responses is cached already
+    get_catalog_last_modified()
+    # When
+    with django_assert_num_queries(1):
+        response = client.get(reverse("movies") + f"?ids={ids}&fields=id")
+    # Then
+    assert response.status_code == http.HTTPStatus.OK
+    assert response.data == {
+        "next": None,
+        "results": [{"id": movies[2].id}, {"id": movies[0].id}],
+        "missing": [99999],
+    }
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("ids", ["", "1,a", ",".join(str(i) for i in range(1, 102))])
+def test_list_movie_by_invalid_ids(client, ids):
+    """
+    Given no, invalid or too many ids
+    When we call the `api/movies/v1/` endpoint with them
+    Then we expect a `http.HTTPStatus.BAD_REQUEST`
+    """
+    response = client.get(reverse("movies") + f"?ids={ids}")
+    assert response.status_code == http.HTTPStatus.BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_list_movie_search(client, fake_user):
+    """
+    Given movies with `space` in the title or the description and another movie
+    When we call the `api/movies/v1/` endpoint with `q=space`, one movie per page
+    Then we expect the matching movies, the most relevant first, page after page
+    """
+    # Given
+    Movie.objects.create(
+        author=fake_user, title="Interstellar", desc="space", year=2014
+    )
+    Movie.objects.create(author=fake_user, title="Space Jam", desc="NBA", year=1996)
+    Movie.objects.create(author=fake_user, title="Heat", desc="Crime", year=1995)
+    # When
+    first_page = client.get(reverse("movies") + "?q=space&page_size=1&fields=title")
+    second_page = client.get(first_page.data["next"])
+    # Then
+    assert first_page.data["results"] == [{"title": "Space Jam"}]
+    assert second_page.data["results"] == [{"title": "Interstellar"}]
+    assert second_page.data["next"] is None
+
+
+@pytest.mark.django_db
+def test_list_movie_by_genre(client, fake_user):
+    """
+    Given movies of different genres
+    When we call the `api/movies/v1/` endpoint with `genre=sci-fi`
+    Then we expect only the movies of that genre
+    """
+    # Given
+    Movie.objects.create(author=fake_user, title="Alien", genre="Sci-fi", year=1979)
+    Movie.objects.create(author=fake_user, title="Heat", genre="Crime", year=1995)
+    # When
+    response = client.get(reverse("movies") + "?genre=sci-fi&fields=title")
+    # Then
+    assert response.status_code == http.HTTPStatus.OK
+    assert response.data["results"] == [{"title": "Alien"}]
+
+
+@pytest.mark.django_db
+def test_list_genres(client, fake_user, django_assert_num_queries):
+    """
+    Given movies of different genres
+    When we call the `api/movies/v1/genres` endpoint
+    Then we expect the genres with their number of movies, the most movies first,
+        read with a single query
+    """
+    # Given
+    Movie.objects.create(author=fake_user, title="Alien", genre="Sci-fi", year=1979)
+    Movie.objects.create(
+        author=fake_user, title="Heat", genre="Crime/Sci-fi", year=1995
+    )
+    # When
+    with django_assert_num_queries(1):
+        response = client.get(reverse("movies-genres"))
+    # Then
+    assert response.status_code == http.HTTPStatus.OK
+    assert response.json() == [
+        {"name": "Sci-fi", "slug": "sci-fi", "movies_count": 2},
+        {"name": "Crime", "slug": "crime", "movies_count": 1},
+    ]
@@ -0,0 +1,90 @@
+"""Test cases for the plain-rows read path of the movies API"""
+import datetime
+import decimal
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from api.renderers import FastJSONRenderer
+from api.rows import MovieRows
+from api.serializers import MovieSerializer
+from movies.models import Movie
+from movies.reactions import DISLIKE, LIKE, set_reaction
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "query",
+    [
+        "",
+        "include=reactors",
+        "expand=author",
+        "fields=id,title,year,likes_count&expand=author&include=reactors",
+    ],
+)
+def test_rows_same_bytes_as_serializer(fake_users_with_movies, query):
+    """
+    Given two users with movies, reactions and unicode descriptions
+    When we render the movies from their plain rows with the `FastJSONRenderer`
+    Then we expect the same bytes as the `MovieSerializer` with the `JSONRenderer`
+    """
+    # Given
+    users, movies = fake_users_with_movies
+    first_user, second_user = users
+    Movie.objects.create(
+        author=first_user,
+        title='Amélie \u2028 \u2029 "quoted"',
+        desc="Ünïcödé 🎬 \\ \n",
+        year=2001,
+    )
+    set_reaction(movies[1].id, first_user.id, LIKE)
+    set_reaction(movies[0].id, second_user.id, DISLIKE)
+    request = Request(APIRequestFactory().get(f"/?{query}"))
+    queryset = Movie.objects.order_by("id")
+    # When
+    rows = MovieRows(MovieSerializer(context={"request": request}))
+    content = FastJSONRenderer().render(
+        rows.to_representation(list(rows.values(queryset)))
+    )
+    # Then
+    expected = JSONRenderer().render(
+        MovieSerializer(queryset, many=True, context={"request": request}).data
+    )
+    assert content == expected
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"date": datetime.datetime(2023, 3, 1, 10, 12, 43, 125678)},
+        {"aware": datetime.datetime(2023, 3, 1, tzinfo=datetime.timezone.utc)},
+        {"day": datetime.date(2023, 3, 1), "amount": decimal.Decimal("1.50")},
+        {1: ["\u2028", None, True]},
+    ],
+)
+def test_fast_json_renderer_same_bytes(data):
+    """
+    Given datetimes, decimals and non-string keys
+    When we render them with the `FastJSONRenderer`
+    Then we expect the same bytes as the `JSONRenderer`
+    """
+    assert FastJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+@pytest.mark.django_db
+def test_benchmark_movies_api_command(fake_user_with_one_movie):
+    """
+    Given one movie
+    When we run the `benchmark_movies_api` command for three movies
+    Then we expect the timings of both paths
+        and the temporary movies rolled back
+    """
+    out = StringIO()
+    call_command("benchmark_movies_api", rows=3, repeat=2, stdout=out)
+    assert "serializer: median" in out.getvalue()
+    assert "Plain rows speedup" in out.getvalue()
+    assert Movie.objects.count() == 1
@@ -0,0 +1,143 @@
+"""Test cases for the precomputed OpenAPI document"""
+import http
+import json
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+
+from api import schema
+
+
+@pytest.fixture(name="schema_path")
+def schema_path_fixture(settings, tmp_path, monkeypatch):
+    """pytest fixture for a process without a loaded document and its file path"""
+    monkeypatch.setattr(schema, "_document", None)
+    settings.OPENAPI_SCHEMA_PATH = tmp_path / "openapi.json"
+    return settings.OPENAPI_SCHEMA_PATH
+
+
+@pytest.mark.django_db
+def test_openapi_schema_generated_once(client, schema_path, monkeypatch):
+    """
+    Given no precomputed document
+    When we call the `openapi.json` endpoint twice
+    Then we expect the document of the API generated only once,
+        with its `ETag` and cache headers
+    """
+    # Given
+    calls = []
+    generate_schema = schema.generate_schema
+    monkeypatch.setattr(
+        schema,
+        "generate_schema",
+        lambda: calls.append(1) or generate_schema(),
+    )
+    # When
+    first_response = client.get(reverse("schema-json"))
+    response = client.get(reverse("schema-json"))
+    # Then
+    assert len(calls) == 1
+    assert response.status_code == http.HTTPStatus.OK
+    assert response.content == first_response.content
+    assert "/movies/v1/" in json.loads(response.content)["paths"]
+    assert response.headers["ETag"] == schema.get_schema_document().etag
+    assert response.headers["Cache-Control"] == "public, max-age=300"
+
+
+@pytest.mark.django_db
+def test_openapi_schema_not_modified(client, schema_path):
+    """
+    Given the `ETag` of the document
+    When we call the `openapi.json` endpoint with `If-None-Match`
+    Then we expect a `304`
+    """
+    # Given
+    etag = client.get(reverse("schema-json")).headers["ETag"]
+    # When
+    response = client.get(reverse("schema-json"), HTTP_IF_NONE_MATCH=etag)
+    # Then
+    assert response.status_code == http.HTTPStatus.NOT_MODIFIED
+
+
+@pytest.mark.django_db
+def test_openapi_schema_from_the_command(client, schema_path, monkeypatch):
+    """
+    Given the document precomputed with the `generate_openapi_schema` command
+    When we call the `openapi.json` endpoint
+    Then we expect the document of the file without generating it again
+    """
+    # Given
+    call_command("generate_openapi_schema")
+    monkeypatch.setattr(schema, "generate_schema", pytest.fail)
+    # When
+    response = client.get(reverse("schema-json"))
+    # Then
+    assert response.status_code == http.HTTPStatus.OK
+    assert response.content == schema_path.read_bytes()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "content",
+    [b'{"x-source-stamp": "previous", "paths": {}}', b'{"paths": {}}', b"<html>"],
+)
+def test_openapi_schema_stale_file(client, schema_path, content):
+    """
+    Given a precomputed document of other code (another stamp, or none)
+    When we call the `openapi.json` endpoint
+    Then we expect the document generated from the current code
+    """
+    # Given
+    schema_path.write_bytes(content)
+    # When
+    response = client.get(reverse("schema-json"))
+    # Then
+    assert response.status_code == http.HTTPStatus.OK
+    document = json.loads(response.content)
+    assert document["x-source-stamp"] == schema.get_source_stamp()
+    assert "/movies/v1/" in document["paths"]
+
+
+def test_source_stamp_follows_the_api_settings(settings):
+    """
+    Given the stamp of the current code
+    When a setting of the API changes
+    Then we expect another stamp
+    """
+    # Given
+    stamp = schema.get_source_stamp()
+    # When
+    settings.SWAGGER_SETTINGS = {"SPEC_URL": "schema-json", "USE_SESSION_AUTH": False}
+    # Then
+    assert schema.get_source_stamp() != stamp
+
+
+def test_source_stamp_covers_the_project(settings):
+    """
+    Given the project
+    When we list the modules hashed into the stamp
+    Then we expect the URL conf, the API and the accounts among them
+    """
+    sources = schema._get_project_sources()  # pylint: disable=protected-access
+    assert {
+        settings.BASE_DIR / "config" / "urls.py",
+        settings.BASE_DIR / "accounts" / "views.py",
+        settings.BASE_DIR / "accounts" / "models.py",
+        settings.BASE_DIR / "api" / "views.py",
+    } <= set(sources)
+    assert not [source for source in sources if "migrations" in source.parts]
+
+
+@pytest.mark.django_db
+def test_swagger_ui_loads_the_precomputed_document(client):
+    """
+    Given the `swagger` page
+    When we load it
+    Then we expect it to fetch the `openapi.json` document
+    """
+    # When
+    response = client.get(reverse("schema-swagger-ui"))
+    # Then
+    assert response.status_code == http.HTTPStatus.OK
+    assert reverse("schema-json") in response.content.decode()
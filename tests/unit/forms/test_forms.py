@@ -20,6 +20,8 @@ from web_app.forms import MovieForm
             },
             True,
         ),
+        ({"title": "Only title", "desc": "some description", "year": "abcd"}, False),
+        ({"title": "Only title", "desc": "some description", "year": "10000"}, False),
     ],
 )
 def test_movie_form(form_input, expected):
@@ -0,0 +1,116 @@
+"""Test cases for the in-memory autocomplete of the movies"""
+import pytest
+from django.utils import timezone
+
+from movies.autocomplete import AUTHOR, MOVIE, MovieAutocomplete, PrefixIndex
+from movies.models import Movie
+from movies.reactions import LIKE, set_reaction
+
+
+def _texts(suggestions) -> list:
+    return [suggestion["text"] for suggestion in suggestions]
+
+
+def test_prefix_index_finds_every_word():
+    """
+    Given a prefix index of a title and a username
+    When we look for prefixes of their words, in any case
+    Then we expect the items of the matching keys only
+    """
+    # Given
+    index = PrefixIndex([("Harry  Potter", MOVIE, 1), ("harriet", AUTHOR, 1)])
+    # Then
+    assert index.find("HAR") == {(MOVIE, 1), (AUTHOR, 1)}
+    assert index.find("potter") == {(MOVIE, 1)}
+    assert index.find("harry pot") == {(MOVIE, 1)}
+    assert index.find("otter") == set()
+    assert index.find("  ") == set()
+
+
+def test_prefix_index_add_remove():
+    """
+    Given an empty prefix index
+    When we add two titles and remove the first one
+    Then we expect only the second one to be found
+    """
+    # Given
+    index = PrefixIndex()
+    # When
+    index.add("Alien", MOVIE, 1)
+    index.add("Aliens", MOVIE, 2)
+    index.remove("Alien", MOVIE, 1)
+    # Then
+    assert index.find("alien") == {(MOVIE, 2)}
+
+
+@pytest.mark.django_db
+def test_suggestions_ranked_by_likes(fake_users_with_movies):
+    """
+    Given three movies starting with `fi` and their authors, one movie with a like
+    When we ask for two suggestions of `fi` and the suggestions of an author
+    Then we expect the most liked first, then the oldest
+    """
+    # Given
+    users, movies = fake_users_with_movies
+    Movie.objects.create(author=users[0], title="Fight Club 2", year=2000)
+    fighter = Movie.objects.create(author=users[0], title="Fighter", year=2010)
+    set_reaction(fighter.id, users[1].id, LIKE)
+    # When
+    suggestions = MovieAutocomplete().suggest("fi", limit=2)
+    # Then
+    assert suggestions == [
+        {"type": MOVIE, "id": fighter.id, "text": "Fighter", "likes": 1},
+        {"type": MOVIE, "id": movies[1].id, "text": "Fight Club", "likes": 0},
+    ]
+    assert MovieAutocomplete().suggest("BO") == [
+        {"type": AUTHOR, "id": users[0].id, "text": "bob", "likes": 1}
+    ]
+
+
+@pytest.mark.django_db
+def test_suggestions_follow_the_changes(
+    fake_users_with_movies, django_capture_on_commit_callbacks
+):
+    """
+    Given an autocomplete index which has answered once
+    When a movie is created, another one deleted and a third renamed and liked
+    Then we expect the suggestions of the current catalog
+    """
+    # Given
+    users, movies = fake_users_with_movies
+    autocomplete = MovieAutocomplete()
+    assert _texts(autocomplete.suggest("f")) == ["Fight Club"]
+    # When
+    with django_capture_on_commit_callbacks(execute=True):
+        Movie.objects.create(author=users[0], title="Fargo", year=1996)
+        movies[0].delete()
+    with django_capture_on_commit_callbacks(execute=True):
+        now = timezone.now()
+        Movie.objects.filter(id=movies[1].id).update(
+            title="Fight Club (1999)", updated_date=now, changed_at=now
+        )
+    with django_capture_on_commit_callbacks(execute=True):
+        set_reaction(movies[1].id, users[0].id, LIKE)
+    # Then
+    assert _texts(autocomplete.suggest("f")) == ["Fight Club (1999)", "Fargo"]
+    assert _texts(autocomplete.suggest("harry")) == []
+    assert _texts(autocomplete.suggest("bob")) == ["bob"]
+
+
+@pytest.mark.django_db
+def test_suggestions_without_changes_skip_the_database(
+    fake_users_with_movies, django_assert_num_queries
+):
+    """
+    Given an autocomplete index which has answered once
+    When we ask for suggestions without any change of the catalog
+    Then we expect them without any query
+    """
+    # Given
+    autocomplete = MovieAutocomplete()
+    autocomplete.suggest("f")
+    # When
+    with django_assert_num_queries(0):
+        suggestions = autocomplete.suggest("harry")
+    # Then
+    assert _texts(suggestions) == ["Harry Potter and the Deathly Hallows: Part 2"]
@@ -0,0 +1,98 @@
+"""Test cases for the validators of the conditional responses"""
+import pytest
+
+from movies.conditional import get_catalog_last_modified, get_movie_last_modified
+from movies.models import Movie
+from movies.reactions import LIKE, clear_reaction, set_reaction
+
+
+@pytest.mark.django_db
+def test_reaction_changes_the_last_modified(fake_users_with_movies):
+    """
+    Given two movies
+    When a user likes a movie and then removes the like
+    Then we expect every change to move the `reacted_date`
+        and the last modified date of the movie
+    """
+    # Given
+    users, movies = fake_users_with_movies
+    before = get_movie_last_modified(movies[1].id)
+    # When
+    set_reaction(movies[1].id, users[0].id, LIKE)
+    liked = get_movie_last_modified(movies[1].id)
+    clear_reaction(movies[1].id, users[0].id)
+    cleared = get_movie_last_modified(movies[1].id)
+    # Then
+    assert before < liked < cleared
+    assert Movie.objects.get(id=movies[1].id).reacted_date == cleared
+
+
+@pytest.mark.django_db
+def test_movie_save_keeps_the_reacted_date(fake_users_with_movies):
+    """
+    Given a movie instance loaded before a like
+    When the stale instance is saved
+    Then we expect the `reacted_date` of the like to be kept
+    """
+    # Given
+    users, movies = fake_users_with_movies
+    stale = Movie.objects.get(id=movies[1].id)
+    set_reaction(movies[1].id, users[0].id, LIKE)
+    reacted_date = Movie.objects.get(id=movies[1].id).reacted_date
+    # When
+    stale.title = "New title"
+    stale.save()
+    # Then
+    assert Movie.objects.get(id=movies[1].id).reacted_date == reacted_date
+
+
+@pytest.mark.django_db
+def test_catalog_last_modified(
+    fake_users_with_movies, django_capture_on_commit_callbacks
+):
+    """
+    Given two movies
+    When a movie gets a like and another one is deleted
+    Then we expect a later catalog last modified date after every change
+    """
+    # Given
+    users, movies = fake_users_with_movies
+    first = get_catalog_last_modified()
+    # When
+    with django_capture_on_commit_callbacks(execute=True):
+        set_reaction(movies[1].id, users[0].id, LIKE)
+    liked = get_catalog_last_modified()
+    with django_capture_on_commit_callbacks(execute=True):
+        movies[0].delete()
+    deleted = get_catalog_last_modified()
+    # Then
+    assert first == movies[1].changed_at
+    assert first < liked < deleted
+
+
+@pytest.mark.django_db
+def test_catalog_last_modified_is_cached(
+    fake_user_with_one_movie, django_assert_num_queries
+):
+    """
+    Given the catalog last modified date of the current catalog generation
+    When we ask for it again
+    Then we expect it without any query
+    """
+    # Given
+    last_modified = get_catalog_last_modified()
+    # When
+    with django_assert_num_queries(0):
+        cached = get_catalog_last_modified()
+    # Then
+    assert cached == last_modified
+
+
+@pytest.mark.django_db
+def test_missing_movie_last_modified():
+    """
+    Given no movies
+    When we ask for the last modified date of a movie
+    Then we expect `None`
+    """
+    assert get_movie_last_modified(1) is None
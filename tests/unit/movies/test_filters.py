@@ -0,0 +1,36 @@
+"""Test cases for the parsing of the movie filters"""
+import pytest
+
+from movies.filters import get_release_year_range
+
+
+@pytest.mark.parametrize(
+    "params,expected",
+    [
+        ({}, (None, None)),
+        ({"year_min": "1990"}, (1990, None)),
+        ({"year_min": "1990", "year_max": "2000"}, (1990, 2000)),
+        ({"decade": "1990"}, (1990, 1999)),
+        ({"decade": "1995"}, (1990, 1999)),
+        ({"decade": "1990", "year_min": "1995"}, (1995, 1999)),
+        ({"decade": "1990", "year_max": "2005"}, (1990, 1999)),
+        ({"year_min": ""}, (None, None)),
+    ],
+)
+def test_get_release_year_range(params, expected):
+    """
+    Make sure the `year_min`, `year_max` and `decade` parameters
+    are combined to the right range
+    """
+    assert get_release_year_range(params) == expected
+
+
+@pytest.mark.parametrize(
+    "params", [{"year_min": "abc"}, {"year_max": "-1"}, {"decade": "90s"}]
+)
+def test_get_release_year_range_invalid(params):
+    """
+    Make sure invalid years raise a `ValueError`
+    """
+    with pytest.raises(ValueError):
+        get_release_year_range(params)
@@ -0,0 +1,102 @@
+"""Test cases for the normalized genres of the movies"""
+import pytest
+
+from movies.genres import get_genre_facets, parse_genres, sync_movie_genres
+from movies.models import Genre, Movie
+
+
+def _counts() -> dict:
+    return dict(Genre.objects.values_list("slug", "movies_count"))
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("", []),
+        ("Drama", [("drama", "Drama")]),
+        (
+            " Sci-fi /Action / sci-fi// ",
+            [("sci-fi", "Sci-fi"), ("action", "Action")],
+        ),
+        ("Film  noir", [("film-noir", "Film noir")]),
+    ],
+)
+def test_parse_genres(text, expected):
+    """
+    Given a genre text
+    When we parse it
+    Then we expect its trimmed genres split on `/`, without duplicates
+    """
+    assert parse_genres(text) == expected
+
+
+@pytest.mark.django_db
+def test_movie_genres_follow_the_saved_genre(fake_user):
+    """
+    Given two movies sharing a genre
+    When one of them is saved with another genre and the other is deleted
+    Then we expect their genres and the stored counts in sync
+    """
+    # Given
+    first = Movie.objects.create(
+        author=fake_user, title="Alien", genre="Sci-fi/Horror", year=1979
+    )
+    second = Movie.objects.create(
+        author=fake_user, title="Heat", genre="crime / sci-fi", year=1995
+    )
+    assert _counts() == {"sci-fi": 2, "horror": 1, "crime": 1}
+    assert Genre.objects.get(slug="sci-fi").name == "Sci-fi"
+    # When
+    first.genre = "Horror"
+    first.save()
+    second.delete()
+    # Then
+    assert _counts() == {"sci-fi": 0, "horror": 1, "crime": 0}
+    assert list(first.genres.values_list("slug", flat=True)) == ["horror"]
+    assert list(get_genre_facets()) == [Genre.objects.get(slug="horror")]
+
+
+@pytest.mark.django_db
+def test_sync_movie_genres_of_many_movies(fake_user, django_assert_max_num_queries):
+    """
+    Given three movies without genres
+    When we sync the genres of all of them at once
+    Then we expect a constant number of queries and the right counts
+    """
+    # Given
+    movies = Movie.objects.bulk_create(
+        [
+            Movie(author=fake_user, title=f"movie {index}", year=2000)
+            for index in range(3)
+        ]
+    )
+    # When
+    # one `UPDATE` of the counts per distinct delta
+    with django_assert_max_num_queries(9):
+        sync_movie_genres(
+            {
+                movies[0].id: "Drama",
+                movies[1].id: "Drama/Comedy",
+                movies[2].id: "Comedy/Drama/Action",
+            }
+        )
+    # Then
+    assert _counts() == {"drama": 3, "comedy": 2, "action": 1}
+    assert [genre.slug for genre in get_genre_facets(limit=2)] == ["drama", "comedy"]
+
+
+@pytest.mark.django_db
+def test_by_genre(fake_user):
+    """
+    Given movies of different genres
+    When we filter the movies by the slug of a genre
+    Then we expect only the movies of that genre
+    """
+    # Given
+    alien = Movie.objects.create(
+        author=fake_user, title="Alien", genre="Sci-fi/Horror", year=1979
+    )
+    Movie.objects.create(author=fake_user, title="Heat", genre="Crime", year=1995)
+    # When, Then
+    assert list(Movie.objects.by_genre("horror")) == [alien]
+    assert not Movie.objects.by_genre("drama").exists()
@@ -0,0 +1,174 @@
+"""Test cases for the query plans of the movie listings"""
+import pytest
+from django.db import connection
+from django.db.models import Max
+from django.test.client import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from api.views import MovieListAPIList
+from movies.autocomplete import COLUMNS
+from movies.models import Movie, MovieDeletion
+from movies.pagination import get_keyset_ordering, get_position, keyset_filter
+from web_app.utils import apply_queryset_filtering
+
+# the plans are checked in the `EXPLAIN` output of PostgreSQL
+# and in the `EXPLAIN QUERY PLAN` output of SQLite
+pytestmark = pytest.mark.skipif(
+    connection.vendor not in ("postgresql", "sqlite"), reason="Query plans"
+)
+
+LISTING_QUERIES = [
+    "",
+    "filter=date",
+    "filter=released_date",
+    "filter=likes",
+    "filter=dislikes",
+    "filter=by_current_user",
+    "author={author_id}",
+    "filter=released_date&decade=1990",
+]
+
+
+def prefer_indexes() -> None:
+    """Makes the planner of PostgreSQL consider the indexes of the tiny test tables"""
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+
+def explain(sql: str) -> str:
+    """Returns the query plan of the `sql`"""
+    prefer_indexes()
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            cursor.execute("EXPLAIN " + sql)
+        else:
+            cursor.execute("EXPLAIN QUERY PLAN " + sql)
+        return "\n".join(str(row) for row in cursor.fetchall())
+
+
+def assert_plan_uses_index(plan: str, after_cursor: bool = False) -> None:
+    """
+    Asserts that the `plan` reads the rows from an index instead of scanning
+    the whole table (and sorting it). The pages after a cursor have to start
+    with a range search of the index, not a scan of it.
+    """
+    if connection.vendor == "postgresql":
+        assert "Seq Scan" not in plan, plan
+        assert "Sort" not in plan, plan
+        if after_cursor:
+            assert "Index Cond" in plan, plan
+    else:
+        assert "TEMP B-TREE" not in plan, plan
+        if after_cursor:
+            assert "SEARCH" in plan, plan
+            assert "SCAN" not in plan, plan
+
+
+def assert_uses_index(queryset, after_cursor: bool = False) -> None:
+    """
+    Asserts that the plan of the `queryset` reads the rows in order from an index
+    (see `assert_plan_uses_index`)
+    """
+    prefer_indexes()
+    plan = queryset.explain()
+    assert_plan_uses_index(plan, after_cursor=after_cursor)
+    # `id` is SQLite's `rowid`, the table itself is ordered by it
+    if (
+        connection.vendor == "sqlite"
+        and not after_cursor
+        and get_keyset_ordering(queryset) != ["id"]
+    ):
+        assert "USING INDEX" in plan, plan
+
+
+def get_listing_queryset(query, user):
+    """Returns the home page queryset for the `query` of the `user`"""
+    fake_request = RequestFactory().get("/?" + query.format(author_id=user.id))
+    fake_request.user = user
+    return apply_queryset_filtering(
+        request=fake_request, queryset=Movie.objects.get_queryset()
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("query", LISTING_QUERIES)
+def test_home_listing_pages_use_an_index(fake_users_with_movies, query):
+    """
+    Given two users with one movie each
+    When we list the first and the following page of every `home` filtering
+    Then we expect query plans which use an index for the ordering,
+        with a range search of it after the cursor
+    """
+    # Given
+    users, movies = fake_users_with_movies
+    movies_qs = get_listing_queryset(query, users[0])
+    ordering = get_keyset_ordering(movies_qs)
+    movies_qs = movies_qs.order_by(*ordering)
+    # When/Then
+    assert_uses_index(movies_qs[:21])
+    assert_uses_index(
+        movies_qs.filter(keyset_filter(ordering, get_position(movies[0], ordering)))[
+            :21
+        ],
+        after_cursor=True,
+    )
+
+
+@pytest.mark.django_db
+def test_api_listing_uses_an_index(fake_users_with_movies):
+    """
+    Given two users with one movie each
+    When we list the movies with the ordering of the movie list API
+    Then we expect a query plan which uses an index for the ordering
+    """
+    # Given
+    _, movies = fake_users_with_movies
+    movies_qs = MovieListAPIList.queryset.all()
+    # When/Then
+    assert_uses_index(movies_qs[:21])
+    assert_uses_index(movies_qs.filter(id__gt=movies[0].id)[:21], after_cursor=True)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "model,field,index",
+    [
+        (Movie, "changed_at", "movie_changed_id_idx"),
+        (MovieDeletion, "deleted_at", "deletion_deleted_id_idx"),
+    ],
+)
+def test_catalog_last_modified_uses_an_index(
+    fake_user_with_one_movie, model, field, index
+):
+    """
+    Given one movie
+    When we query the latest change of the catalog
+    Then we expect a query plan which reads it from the end of an index
+    """
+    # Given
+    with CaptureQueriesContext(connection) as captured:
+        model.objects.aggregate(latest=Max(field))
+    # When
+    plan = explain(captured.captured_queries[0]["sql"])
+    # Then
+    assert index in plan, plan
+    assert_plan_uses_index(plan)
+
+
+@pytest.mark.django_db
+def test_autocomplete_refresh_uses_an_index(fake_user_with_one_movie):
+    """
+    Given one movie
+    When we read the movies changed since a date, as the autocomplete refresh
+    Then we expect a query plan with a range search of the `changed_at` index
+    """
+    # When
+    prefer_indexes()
+    plan = (
+        Movie.objects.filter(changed_at__gt=timezone.now()).values(*COLUMNS).explain()
+    )
+    # Then
+    assert "movie_changed_id_idx" in plan, plan
+    assert_plan_uses_index(plan, after_cursor=True)
@@ -3,6 +3,7 @@ import pytest
 from django.contrib.auth import get_user_model
 
 from movies.models import Movie
+from movies.reactions import DISLIKE, LIKE, set_reaction
 
 
 @pytest.mark.django_db
@@ -18,8 +19,8 @@ def test_get_movies_by_author(fake_user):
     user = User(username="test-user")
     user.set_password(default_password)
     user.save()
-    Movie.objects.create(author=fake_user, title="some movie", year="2022")
-    Movie.objects.create(author=user, title="some other movie", year="2023")
+    Movie.objects.create(author=fake_user, title="some movie", year=2022)
+    Movie.objects.create(author=user, title="some other movie", year=2023)
     # When/Then
     assert Movie.objects.by_author(author=user).count() == 1
 
@@ -37,11 +38,9 @@ def test_get_movies_by_published_date(fake_user):
     user = User(username="test-user")
     user.set_password(default_password)
     user.save()
-    first_movie = Movie.objects.create(
-        author=fake_user, title="some movie", year="1000"
-    )
+    first_movie = Movie.objects.create(author=fake_user, title="some movie", year=1000)
     second_movie = Movie.objects.create(
-        author=user, title="some other movie", year="2023"
+        author=user, title="some other movie", year=2023
     )
     # When/Then
     assert first_movie.year < second_movie.year
@@ -64,16 +63,15 @@ def test_get_movies_by_total_likes(fake_user):
     user = User(username="test-user")
     user.set_password(default_password)
     user.save()
-    first_movie = Movie.objects.create(
-        author=fake_user, title="some movie", year="2023"
-    )
+    first_movie = Movie.objects.create(author=fake_user, title="some movie", year=2023)
     assert first_movie.total_likes == 0
     second_movie = Movie.objects.create(
-        author=user, title="some other movie", year="2023"
+        author=user, title="some other movie", year=2023
     )
-    second_movie.likes.add(fake_user)
+    set_reaction(second_movie.id, fake_user.id, LIKE)
     second_movie.save()
     # When/Then
+    second_movie.refresh_from_db()
     assert second_movie.total_likes == 1
     assert second_movie.total_likes == 1
     assert Movie.objects.by_likes().count() == 2
@@ -95,18 +93,36 @@ def test_get_movies_by_total_dislikes(fake_user):
     user = User(username="test-user")
     user.set_password(default_password)
     user.save()
-    first_movie = Movie.objects.create(
-        author=fake_user, title="some movie", year="2023"
-    )
+    first_movie = Movie.objects.create(author=fake_user, title="some movie", year=2023)
     assert first_movie.total_dislikes == 0
     second_movie = Movie.objects.create(
-        author=user, title="some other movie", year="2023"
+        author=user, title="some other movie", year=2023
     )
-    second_movie.dislikes.add(fake_user)
+    set_reaction(second_movie.id, fake_user.id, DISLIKE)
     second_movie.save()
     # When/Then
+    first_movie.refresh_from_db()
+    second_movie.refresh_from_db()
     assert first_movie.total_dislikes == 0
     assert second_movie.total_dislikes == 1
     assert Movie.objects.by_dislikes().count() == 2
     assert Movie.objects.by_dislikes().first() == second_movie
     assert Movie.objects.by_dislikes().last() == first_movie
+
+
+@pytest.mark.django_db
+def test_get_movies_released_between(fake_users_with_movies):
+    """
+    Given two movies released in 2011 and 1999
+    When I filter the movies by release year ranges and decades
+    Then I'm expecting only the movies released within them
+    """
+    # Given
+    _, movies = fake_users_with_movies
+    first_movie, second_movie = movies
+    # When/Then
+    assert list(Movie.objects.released_between(2000, 2020)) == [first_movie]
+    assert list(Movie.objects.released_between(year_max=1999)) == [second_movie]
+    assert Movie.objects.released_between().count() == 2
+    assert list(Movie.objects.by_decade(1990)) == [second_movie]
+    assert not Movie.objects.by_decade(1980).exists()
@@ -0,0 +1,157 @@
+"""Test cases for the keyset pagination of the movies"""
+import pytest
+from django.test.client import RequestFactory
+
+from movies.models import Movie
+from movies.pagination import (
+    InvalidCursor,
+    encode_cursor,
+    keyset_filter,
+    paginate_keyset,
+)
+from movies.reactions import LIKE, set_reaction
+from web_app.utils import apply_queryset_filtering
+
+
+def _collect_pages(queryset, page_size):
+    """Follow the cursors until the last page and return all the pages"""
+    pages = []
+    cursor = None
+    while True:
+        page = paginate_keyset(queryset, cursor=cursor, page_size=page_size)
+        pages.append(page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            return pages
+
+
+@pytest.fixture(name="movies_with_ties")
+def movies_with_ties_fixture(fake_users_with_movies):
+    """Eight movies from two users sharing the same year and counters"""
+    users, _ = fake_users_with_movies
+    Movie.objects.all().delete()
+    for index in range(8):
+        Movie.objects.create(author=users[index % 2], title=f"movie {index}", year=2000)
+    return users
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "query",
+    [
+        "",
+        "filter=date",
+        "filter=released_date",
+        "filter=likes",
+        "filter=dislikes",
+        "filter=by_current_user",
+        "author={author_id}",
+    ],
+)
+def test_paginate_every_filtering(movies_with_ties, query):
+    """
+    Given eight movies with identical years and counters
+    When we paginate every `home` filtering 3 movies at a time
+    Then we expect every movie exactly once in the same order
+         as the non-paginated queryset
+    """
+    # Given
+    first_user, _ = movies_with_ties
+    fake_request = RequestFactory().get("/?" + query.format(author_id=first_user.id))
+    fake_request.user = first_user
+    movies = apply_queryset_filtering(
+        request=fake_request, queryset=Movie.objects.get_queryset()
+    )
+    # When
+    pages = _collect_pages(movies, page_size=3)
+    # Then
+    assert all(len(page) <= 3 for page in pages)
+    assert [movie for page in pages for movie in page] == list(movies)
+
+
+@pytest.mark.django_db
+def test_paginate_by_likes_keeps_counter_order(fake_users_with_movies):
+    """
+    Given two movies where only the second one has a like
+    When we paginate the movies `by_likes` one at a time
+    Then we expect the liked movie on the first page
+    """
+    # Given
+    users, movies = fake_users_with_movies
+    set_reaction(movies[1].id, users[0].id, LIKE)
+    # When
+    pages = _collect_pages(Movie.objects.by_likes(), page_size=1)
+    # Then
+    assert pages == [[movies[1]], [movies[0]]]
+
+
+@pytest.mark.django_db
+def test_paginate_without_count_query(
+    fake_users_with_movies, django_assert_num_queries
+):
+    """
+    Given two movies
+    When we request a page after a cursor
+    Then we expect a single query without any `COUNT`
+    """
+    # Given
+    _, movies = fake_users_with_movies
+    first_page = paginate_keyset(Movie.objects.order_by("id"), page_size=1)
+    # When/Then
+    with django_assert_num_queries(1) as captured:
+        page = paginate_keyset(
+            Movie.objects.order_by("id"), cursor=first_page.next_cursor, page_size=1
+        )
+    assert "COUNT" not in captured.captured_queries[0]["sql"]
+    assert page.items == [movies[1]]
+    assert page.next_cursor is None
+
+
+@pytest.mark.parametrize(
+    "ordering, bound",
+    [
+        (("-likes_count", "id"), '"likes_count" <= 3'),
+        (("year", "id"), '"year" >= 3'),
+    ],
+)
+def test_keyset_filter_has_a_leading_bound(ordering, bound):
+    """
+    Given an ordering of more than one field
+    When we get the condition for the rows after a position
+    Then we expect it bounded by the first field, for an index range search
+    """
+    condition = keyset_filter(ordering, [3, 7])
+    sql = str(Movie.objects.filter(condition).query)
+    assert f'WHERE ("movies_movie".{bound} AND ' in sql
+
+
+def test_paginate_invalid_cursor():
+    """
+    Given a malformed cursor
+    When we paginate
+    Then we expect an `InvalidCursor` error
+    """
+    with pytest.raises(InvalidCursor):
+        paginate_keyset(Movie.objects.order_by("id"), cursor="%%%")
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "queryset, values",
+    [
+        (Movie.objects.by_likes(), [{"likes": 1}, 1]),
+        (Movie.objects.by_likes(), [[1], 1]),
+        (Movie.objects.by_likes(), ["many", 1]),
+        (Movie.objects.by_likes(), [None, 1]),
+        (Movie.objects.order_by("created_date"), ["not a date", 1]),
+        (Movie.objects.order_by("created_date"), [20200101, 1]),
+    ],
+)
+def test_paginate_tampered_cursor(queryset, values):
+    """
+    Given a well-formed cursor with values of the wrong types
+    When we paginate
+    Then we expect an `InvalidCursor` error
+    """
+    with pytest.raises(InvalidCursor):
+        paginate_keyset(queryset, cursor=encode_cursor(values))
@@ -0,0 +1,169 @@
+"""Test cases for the reaction toggles of the movies"""
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.exceptions import PermissionDenied
+from django.db import IntegrityError, connection
+from django.test.utils import CaptureQueriesContext
+
+from movies.models import Movie, Reaction
+from movies.reactions import (
+    DISLIKE,
+    LIKE,
+    clear_reaction,
+    set_reaction,
+    toggle_reaction,
+)
+
+
+def _statements(captured_queries):
+    """Returns the captured statements without the savepoint handling"""
+    return [
+        query["sql"]
+        for query in captured_queries
+        if "SAVEPOINT" not in query["sql"].upper()
+    ]
+
+
+@pytest.mark.django_db
+def test_toggle_reaction_constant_statements(
+    fake_users_with_movies, django_assert_max_num_queries
+):
+    """
+    Given a user who has disliked a movie
+    When the user likes the movie
+    Then we expect the dislike to be replaced with at most 5 statements
+        and the movie row to be touched only for its counters
+    """
+    # Given
+    users, movies = fake_users_with_movies
+    first_user, _ = users
+    _, second_movie = movies
+    toggle_reaction(second_movie.id, first_user.id, DISLIKE)
+    updated_date = Movie.objects.get(id=second_movie.id).updated_date
+    # When
+    with django_assert_max_num_queries(7) as captured:
+        toggle = toggle_reaction(second_movie.id, first_user.id, LIKE)
+    # Then
+    assert len(_statements(captured.captured_queries)) <= 5
+    assert toggle.added and toggle.replaced
+    second_movie.refresh_from_db()
+    assert second_movie.updated_date == updated_date
+    assert (second_movie.likes_count, second_movie.dislikes_count) == (1, 0)
+    assert list(second_movie.reactions.values_list("user_id", "value")) == [
+        (first_user.id, LIKE)
+    ]
+
+
+@pytest.mark.django_db
+def test_toggle_reaction_reverts(fake_users_with_movies):
+    """
+    Given a user who has liked a movie
+    When the user likes the movie again
+    Then we expect the like to be reverted
+    """
+    # Given
+    users, movies = fake_users_with_movies
+    first_user, _ = users
+    _, second_movie = movies
+    toggle_reaction(second_movie.id, first_user.id, LIKE)
+    # When
+    toggle = toggle_reaction(second_movie.id, first_user.id, LIKE)
+    # Then
+    assert not toggle.added
+    second_movie.refresh_from_db()
+    assert (second_movie.likes_count, second_movie.dislikes_count) == (0, 0)
+    assert not second_movie.reactions.exists()
+
+
+@pytest.mark.django_db
+def test_toggle_reaction_own_movie(fake_user_with_one_movie):
+    """
+    Given a user with one movie
+    When the user likes the movie
+    Then we expect a `PermissionDenied` error
+    """
+    user, movie = fake_user_with_one_movie
+    with pytest.raises(PermissionDenied):
+        toggle_reaction(movie.id, user.id, LIKE)
+
+
+@pytest.mark.django_db
+def test_toggle_reaction_missing_movie(fake_user):
+    """
+    Given a user
+    When the user likes a movie which doesn't exist
+    Then we expect a `Movie.DoesNotExist` error
+    """
+    with pytest.raises(Movie.DoesNotExist):
+        toggle_reaction(99999, fake_user.id, LIKE)
+
+
+@pytest.mark.django_db
+def test_set_reaction_replaces_reaction(fake_users_with_movies):
+    """
+    Given a user who has liked a movie
+    When the user dislikes and then clears the reaction of the movie
+    Then we expect a single reaction row per user/movie and the right counters
+    """
+    # Given
+    users, movies = fake_users_with_movies
+    first_user, _ = users
+    _, second_movie = movies
+    set_reaction(second_movie.id, first_user.id, LIKE)
+    # When
+    change = set_reaction(second_movie.id, first_user.id, DISLIKE)
+    # Then
+    assert change.replaced
+    assert list(second_movie.reactions.values_list("user_id", "value")) == [
+        (first_user.id, DISLIKE)
+    ]
+    second_movie.refresh_from_db()
+    assert (second_movie.likes_count, second_movie.dislikes_count) == (0, 1)
+    # When
+    clear_reaction(second_movie.id, first_user.id)
+    # Then
+    assert not second_movie.reactions.exists()
+    second_movie.refresh_from_db()
+    assert (second_movie.likes_count, second_movie.dislikes_count) == (0, 0)
+
+
+@pytest.mark.django_db
+def test_reaction_unique_per_user_and_movie(fake_users_with_movies):
+    """
+    Given a user who has liked a movie
+    When a second reaction row is inserted for the same user and movie
+    Then we expect an `IntegrityError`
+    """
+    users, movies = fake_users_with_movies
+    Reaction.objects.create(user=users[0], movie=movies[1], value=LIKE)
+    with pytest.raises(IntegrityError):
+        Reaction.objects.create(user=users[0], movie=movies[1], value=DISLIKE)
+
+
+@pytest.mark.django_db
+def test_delete_user_removes_reactions_from_counters(fake_users_with_movies):
+    """
+    Given a user who has liked one movie and disliked another one,
+        liked by another user too
+    When the user is deleted
+    Then we expect only the reactions of the other user in the counters,
+        taken off with one `UPDATE` per reaction value
+    """
+    # Given
+    users, movies = fake_users_with_movies
+    user = get_user_model().objects.create(username="carol")
+    set_reaction(movies[0].id, user.id, LIKE)
+    set_reaction(movies[1].id, user.id, DISLIKE)
+    set_reaction(movies[1].id, users[0].id, LIKE)
+    # When
+    with CaptureQueriesContext(connection) as captured:
+        user.delete()
+    # Then
+    assert [
+        query["sql"].startswith('UPDATE "movies_movie"')
+        for query in captured.captured_queries
+    ].count(True) == 2
+    assert list(
+        Movie.objects.order_by("id").values_list("likes_count", "dislikes_count")
+    ) == [(0, 0), (1, 0)]
+    assert Reaction.objects.count() == 1
@@ -0,0 +1,92 @@
+"""Test cases for the full-text search of the movies"""
+import pytest
+
+from movies.models import Movie
+
+
+def _titles(movies) -> list:
+    return [movie.title for movie in movies]
+
+
+@pytest.fixture(name="search_movies")
+def search_movies_fixture(fake_user):
+    """pytest fixture for movies with `space` in different fields"""
+    return [
+        Movie.objects.create(
+            author=fake_user, title="Interstellar", desc="A trip in space", year=2014
+        ),
+        Movie.objects.create(
+            author=fake_user, title="Space Jam", desc="Basketball", year=1996
+        ),
+        Movie.objects.create(
+            author=fake_user,
+            title="Alien",
+            desc="Horror",
+            genre="Space horror",
+            year=1979,
+        ),
+        Movie.objects.create(
+            author=fake_user, title="Heat", desc="Crime in Los Angeles", year=1995
+        ),
+    ]
+
+
+@pytest.mark.django_db
+def test_search_ranks_by_relevance(search_movies):
+    """
+    Given movies matching `space` in the title, the genre and the description
+    When we search for `space`
+    Then we expect only the matching movies, title > genre > description
+    """
+    # When
+    movies = Movie.objects.search("space")
+    # Then
+    assert _titles(movies) == ["Space Jam", "Alien", "Interstellar"]
+    assert movies[0].search_rank > movies[1].search_rank > movies[2].search_rank
+
+
+@pytest.mark.django_db
+def test_search_stems_and_matches_all_words(search_movies):
+    """
+    Given some movies
+    When we search for two words, one of them in another form
+    Then we expect the movies matching both words
+    """
+    assert _titles(Movie.objects.search("trips SPACE")) == ["Interstellar"]
+
+
+@pytest.mark.django_db
+def test_search_ignores_the_query_syntax(search_movies):
+    """
+    Given some movies
+    When we search with quotes and operators of the FTS5 syntax
+    Then we expect them searched as plain words
+    """
+    # When
+    movies = Movie.objects.search('jam" OR * NEAR(')
+    # Then
+    assert _titles(movies) == []
+    assert _titles(Movie.objects.search('"jam*')) == ["Space Jam"]
+    assert not Movie.objects.search("*!?").exists()
+
+
+@pytest.mark.django_db
+def test_search_index_follows_the_changes(search_movies):
+    """
+    Given some movies
+    When a movie is renamed, another one updated in bulk and a third deleted
+    Then we expect the search to find them by their current values only
+    """
+    # Given
+    interstellar, space_jam, alien, _ = search_movies
+    # When
+    interstellar.title = "Tenet"
+    interstellar.desc = "Inverted time"
+    interstellar.save()
+    Movie.objects.filter(id=space_jam.id).update(desc="Looney tunes")
+    alien.delete()
+    # Then
+    assert _titles(Movie.objects.search("space")) == ["Space Jam"]
+    assert _titles(Movie.objects.search("tenet")) == ["Tenet"]
+    assert _titles(Movie.objects.search("looney")) == ["Space Jam"]
+    assert _titles(Movie.objects.search("basketball")) == []
@@ -4,6 +4,10 @@ import http
 import pytest
 from django.urls import reverse
 
+from movies.models import Movie
+from movies.reactions import LIKE, set_reaction
+from tests.utils import login_user
+
 
 @pytest.mark.django_db
 def test_home_page_title(client):
@@ -40,3 +44,127 @@ def test_home_without_a_user_logged(client):
     assert "Login" in str(response.content)
     assert "Signup" in str(response.content)
     assert "hi" not in str(response.content)
+
+
+@pytest.mark.django_db
+def test_home_page_is_paginated(client, fake_user, settings):
+    """
+    Given three movies and a page size of two
+    When I call the `home` page and follow the `Next page` link
+    Then I'm expecting the remaining movie on the second page
+    """
+    # Given
+    settings.MOVIES_PAGE_SIZE = 2
+    for title in ("First movie", "Second movie", "Third movie"):
+        Movie.objects.create(author=fake_user, title=title, desc="desc", year=2000)
+    # When
+    response = client.get(reverse("home"))
+    # Then
+    assert response.status_code == http.HTTPStatus.OK
+    assert "Second movie" in str(response.content)
+    assert "Third movie" not in str(response.content)
+    next_page_query = response.context["next_page_query"]
+    # When
+    response = client.get(reverse("home") + "?" + next_page_query)
+    # Then
+    assert "Third movie" in str(response.content)
+    assert "First movie" not in str(response.content)
+    assert "next_page_query" not in response.context
+
+
+@pytest.mark.django_db
+def test_home_page_reaction_controls(client, fake_users_with_movies):
+    """
+    Given two users and a movie liked from the first user
+    When the first user visits the `home` page
+    Then we expect the reaction API url and the like of the user
+        on the card of the other user's movie
+    """
+    # Given
+    users, movies = fake_users_with_movies
+    set_reaction(movies[1].id, users[0].id, LIKE)
+    login_user(client=client, user=users[0])
+    # When
+    content = client.get(reverse("home")).content.decode()
+    # Then
+    assert (
+        f'data-reaction-url="{reverse("movies-reaction", args=[movies[1].id])}"'
+        in content
+    )
+    assert 'data-user-reaction="like"' in content
+    assert reverse("movies-reaction", args=[movies[0].id]) not in content
+
+
+@pytest.mark.django_db
+def test_home_page_not_modified(client, fake_users_with_movies):
+    """
+    Given a user who has visited the `home` page
+    When the user visits the `home` page again with its `ETag`
+    Then we expect a `304`
+    """
+    # Given
+    users, _ = fake_users_with_movies
+    login_user(client=client, user=users[0])
+    etag = client.get(reverse("home")).headers["ETag"]
+    # When
+    response = client.get(reverse("home"), HTTP_IF_NONE_MATCH=etag)
+    # Then
+    assert response.status_code == http.HTTPStatus.NOT_MODIFIED
+
+
+@pytest.mark.django_db
+def test_home_page_etag_per_user(client, fake_users_with_movies):
+    """
+    Given the `ETag` of the `home` page of a user
+    When another user visits the `home` page with it
+    Then we expect the page of the other user
+    """
+    # Given
+    users, _ = fake_users_with_movies
+    login_user(client=client, user=users[0])
+    etag = client.get(reverse("home")).headers["ETag"]
+    client.logout()
+    # When
+    login_user(client=client, user=users[1])
+    response = client.get(reverse("home"), HTTP_IF_NONE_MATCH=etag)
+    # Then
+    assert response.status_code == http.HTTPStatus.OK
+    assert response.headers["ETag"] != etag
+
+
+@pytest.mark.django_db
+def test_home_page_search(client, fake_users_with_movies):
+    """
+    Given two movies
+    When we search the `home` page for words of one of them
+    Then we expect only that movie
+    """
+    # Given
+    _, movies = fake_users_with_movies
+    # When
+    response = client.get(reverse("home") + "?q=soap salesman")
+    # Then
+    assert response.status_code == http.HTTPStatus.OK
+    assert movies[1].title in response.content.decode()
+    assert movies[0].title not in response.content.decode()
+
+
+@pytest.mark.django_db
+def test_home_page_by_genre(client, fake_user):
+    """
+    Given movies of different genres
+    When we call the `home` page with `genre=sci-fi`
+    Then we expect only the movies of that genre, and the genre facets
+    """
+    # Given
+    Movie.objects.create(author=fake_user, title="Alien", genre="Sci-fi", year=1979)
+    Movie.objects.create(author=fake_user, title="Heat", genre="Crime", year=1995)
+    # When
+    response = client.get(reverse("home") + "?genre=sci-fi")
+    # Then
+    content = response.content.decode()
+    assert response.status_code == http.HTTPStatus.OK
+    assert "Alien" in content
+    assert "Heat" not in content
+    assert "?genre=crime" in content
+    assert [genre.slug for genre in response.context["genres"]] == ["crime", "sci-fi"]
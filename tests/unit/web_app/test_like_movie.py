@@ -5,6 +5,7 @@ import pytest
 from django.urls import reverse
 
 from movies.models import Movie
+from movies.reactions import DISLIKE, LIKE, set_reaction
 from tests.utils import login_user
 
 
@@ -29,6 +30,7 @@ def test_like_movie_endpoint_first_time(client, fake_users_with_movies, caplog):
     response = client.post(like_movie_url)
     # Then
     assert response.status_code == http.HTTPStatus.FOUND
+    second_movie.refresh_from_db()
     assert second_movie.total_likes == 1
     assert second_movie.total_dislikes == 0
     assert "Added a like from user" in caplog.text
@@ -49,7 +51,8 @@ def test_like_movie_endpoint_second_time(client, fake_users_with_movies, caplog)
     first_user, _ = users
     _, second_movie = movies
     # User has already liked the movie
-    second_movie.likes.add(first_user)
+    set_reaction(second_movie.id, first_user.id, LIKE)
+    second_movie.refresh_from_db()
     assert second_movie.total_likes == 1
     assert second_movie.total_dislikes == 0
     login_user(client=client, user=first_user)
@@ -58,6 +61,7 @@ def test_like_movie_endpoint_second_time(client, fake_users_with_movies, caplog)
     response = client.post(like_movie_url)
     assert response.status_code == http.HTTPStatus.FOUND
     # Then
+    second_movie.refresh_from_db()
     assert second_movie.total_likes == 0
     assert second_movie.total_dislikes == 0
     assert "Revert like from user" in caplog.text
@@ -78,7 +82,8 @@ def test_like_movie_endpoint_with_a_dislike(client, fake_users_with_movies, capl
     first_user, _ = users
     _, second_movie = movies
     # User has already liked the movie
-    second_movie.dislikes.add(first_user)
+    set_reaction(second_movie.id, first_user.id, DISLIKE)
+    second_movie.refresh_from_db()
     assert second_movie.total_likes == 0
     assert second_movie.total_dislikes == 1
     login_user(client=client, user=first_user)
@@ -87,6 +92,7 @@ def test_like_movie_endpoint_with_a_dislike(client, fake_users_with_movies, capl
     response = client.post(like_movie_url)
     assert response.status_code == http.HTTPStatus.FOUND
     # Then
+    second_movie.refresh_from_db()
     assert second_movie.total_likes == 1
     assert second_movie.total_dislikes == 0
     assert "deleted the dislike" in caplog.text
@@ -107,6 +113,7 @@ def test_like_movie_non_authenticated_user(client, fake_user_with_one_movie):
     response = client.post(like_movie_url)
     # Then
     assert response.status_code == http.HTTPStatus.FOUND
+    movie.refresh_from_db()
     assert movie.total_likes == 0
 
 
@@ -131,6 +138,7 @@ def test_like_movie_users_cannot_like_their_own_movies(
     response = client.post(like_movie_url)
     # Then
     assert response.status_code == http.HTTPStatus.UNAUTHORIZED
+    movie.refresh_from_db()
     assert movie.total_likes == 0
 
 
@@ -152,4 +160,5 @@ def test_like_movie_with_wrong_movie_id(client, fake_user_with_one_movie):
     response = client.post(like_movie_url)
     # Then
     assert response.status_code == http.HTTPStatus.NOT_FOUND
+    movie.refresh_from_db()
     assert movie.total_likes == 0
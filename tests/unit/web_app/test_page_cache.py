@@ -0,0 +1,123 @@
+"""Test cases for the anonymous home page cache"""
+import http
+import time
+from unittest.mock import Mock
+
+import pytest
+from django.core.cache import cache
+from django.test.client import RequestFactory
+from django.urls import reverse
+
+from movies.models import Movie
+from movies.reactions import LIKE, set_reaction
+from tests.utils import login_user
+from web_app.cache import get_or_render_page, get_page_cache_key
+
+
+@pytest.mark.django_db
+def test_anonymous_home_page_from_cache(
+    client, fake_user_with_one_movie, django_assert_num_queries
+):
+    """
+    Given one movie and an anonymous user who has visited the `home` page
+    When the user visits the `home` page again
+    Then we expect the same page without any query
+    """
+    # Given
+    _, movie = fake_user_with_one_movie
+    first_response = client.get(reverse("home"))
+    assert movie.title in str(first_response.content)
+    # When
+    with django_assert_num_queries(0):
+        response = client.get(reverse("home"))
+    # Then
+    assert response.status_code == http.HTTPStatus.OK
+    assert response.content == first_response.content
+
+
+@pytest.mark.django_db
+def test_anonymous_home_page_after_changes(
+    client, fake_users_with_movies, django_capture_on_commit_callbacks
+):
+    """
+    Given two movies and a cached anonymous `home` page
+    When a movie is created and another one gets a like
+    Then we expect the anonymous `home` page with the changes
+    """
+    # Given
+    users, movies = fake_users_with_movies
+    client.get(reverse("home"))
+    # When
+    with django_capture_on_commit_callbacks(execute=True):
+        Movie.objects.create(author=users[0], title="Brand new movie", year=2023)
+    with django_capture_on_commit_callbacks(execute=True):
+        set_reaction(movies[1].id, users[0].id, LIKE)
+    response = client.get(reverse("home"))
+    # Then
+    assert "Brand new movie" in str(response.content)
+    assert "<strong>Likes:</strong> 1</p>" in str(response.content)
+
+
+@pytest.mark.django_db
+def test_logged_in_home_page_is_not_cached(client, fake_user_with_one_movie):
+    """
+    Given a cached anonymous `home` page
+    When a user logs in and visits the `home` page
+    Then we expect the page of the logged-in user
+    """
+    # Given
+    user, _ = fake_user_with_one_movie
+    client.get(reverse("home"))
+    # When
+    login_user(client=client, user=user)
+    response = client.get(reverse("home"))
+    # Then
+    assert "Logout" in str(response.content)
+
+
+def test_page_cache_key_normalizes_the_query():
+    """
+    Given two requests with the same parameters in a different order
+    When we compute their page cache keys
+    Then we expect the same key, but a different one for other parameters
+    """
+    factory = RequestFactory()
+    key = get_page_cache_key(factory.get("/?filter=likes&author=1&cursor="))
+    assert key == get_page_cache_key(factory.get("/?author=1&filter=likes"))
+    assert key != get_page_cache_key(factory.get("/?author=2&filter=likes"))
+
+
+def test_expired_page_is_served_stale_while_locked(settings):
+    """
+    Given an expired cached page and another worker regenerating it
+    When we ask for the page
+    Then we expect the stale page without rendering it again
+    """
+    # Given
+    settings.HOME_PAGE_CACHE_TIMEOUT = 60
+    cache.set("page", {"expires": time.time() - 1, "content": b"stale"})
+    cache.add("page:lock", 1)
+    render = Mock(return_value=b"fresh")
+    # When
+    content = get_or_render_page("page", render)
+    # Then
+    assert content == b"stale"
+    render.assert_not_called()
+
+
+def test_expired_page_is_regenerated_once(settings):
+    """
+    Given an expired cached page
+    When we ask for the page twice
+    Then we expect the page to be rendered only once
+    """
+    # Given
+    settings.HOME_PAGE_CACHE_TIMEOUT = 60
+    cache.set("page", {"expires": time.time() - 1, "content": b"stale"})
+    render = Mock(return_value=b"fresh")
+    # When
+    contents = [get_or_render_page("page", render) for _ in range(2)]
+    # Then
+    assert contents == [b"fresh", b"fresh"]
+    render.assert_called_once()
+    assert cache.get("page:lock") is None
@@ -1,9 +1,16 @@
 """Test cases for web/app utils helper functions"""
+from unittest.mock import patch
+
 import pytest
 from django.test.client import RequestFactory
 
 from movies.models import Movie
-from web_app.utils import apply_queryset_filtering
+from movies.reactions import DISLIKE, LIKE, set_reaction
+from web_app.utils import (
+    apply_queryset_filtering,
+    get_template_data,
+    render_movie_cards,
+)
 
 
 @pytest.mark.django_db
@@ -37,16 +44,16 @@ def test_apply_queryset_filtering_by_date(fake_users_with_movies, caplog):
     caplog.clear()
     _, movies = fake_users_with_movies
     factory = RequestFactory()
-    assert movies[0].year == "2011"
-    assert movies[1].year == "1999"
+    assert movies[0].year == 2011
+    assert movies[1].year == 1999
     # When
     fake_request = factory.get("/?filter=released_date")
     movies_qs = apply_queryset_filtering(
         request=fake_request, queryset=Movie.objects.get_queryset()
     )
     # Then
-    assert movies_qs[0].year == "1999"
-    assert movies_qs[1].year == "2011"
+    assert movies_qs[0].year == 1999
+    assert movies_qs[1].year == 2011
     assert "released_date" in caplog.text
 
 
@@ -61,8 +68,10 @@ def test_apply_queryset_filtering_by_likes(fake_users_with_movies, caplog):
     caplog.clear()
     users, movies = fake_users_with_movies
     factory = RequestFactory()
-    movies[1].likes.add(users[0])
+    set_reaction(movies[1].id, users[0].id, LIKE)
     movies[1].save()
+    movies[0].refresh_from_db()
+    movies[1].refresh_from_db()
     assert movies[0].total_likes == 0
     assert movies[1].total_likes == 1
     # When
@@ -87,8 +96,10 @@ def test_apply_queryset_filtering_by_dislikes(fake_users_with_movies, caplog):
     caplog.clear()
     users, movies = fake_users_with_movies
     factory = RequestFactory()
-    movies[1].dislikes.add(users[0])
+    set_reaction(movies[1].id, users[0].id, DISLIKE)
     movies[1].save()
+    movies[0].refresh_from_db()
+    movies[1].refresh_from_db()
     assert movies[0].total_dislikes == 0
     assert movies[1].total_dislikes == 1
     # When
@@ -144,3 +155,137 @@ def test_apply_queryset_filtering_by_author(fake_users_with_movies, caplog):
     )
     assert movie_qs.count() == 1
     assert "author" in caplog.text
+
+
+@pytest.mark.django_db
+def test_get_template_data_reaction_state(fake_users_with_movies):
+    """
+    Given two users with one movie each
+    When the first user has liked the movie of the second user
+    Then we expect the right `like/dislike` and `edit/delete` permissions
+    """
+    # Given
+    users, movies = fake_users_with_movies
+    first_user, _ = users
+    first_movie, second_movie = movies
+    set_reaction(second_movie.id, first_user.id, LIKE)
+    # When
+    data = get_template_data(movies=Movie.objects.order_by("id"), user=first_user)
+    # Then
+    assert data[0].movie == first_movie
+    assert data[0].allow_edit and data[0].allow_delete
+    assert data[1].movie == second_movie
+    assert not data[1].allow_edit
+    assert data[1].allow_like is False
+    assert data[1].allow_dislike is True
+
+
+@pytest.mark.django_db
+def test_get_template_data_constant_queries(
+    fake_users_with_movies, django_assert_num_queries
+):
+    """
+    Given two users and many movies with reactions
+    When we build the template data for the first user
+    Then we expect a constant number of queries:
+        movies with their authors and the reactions of the user
+    """
+    # Given
+    users, movies = fake_users_with_movies
+    first_user, second_user = users
+    for index in range(10):
+        movie = Movie.objects.create(
+            author=second_user, title=f"movie {index}", year=2000
+        )
+        if index % 2:
+            set_reaction(movie.id, first_user.id, LIKE)
+        else:
+            set_reaction(movie.id, first_user.id, DISLIKE)
+    # When/Then
+    with django_assert_num_queries(2):
+        data = get_template_data(movies=Movie.objects.all(), user=first_user)
+        authors = [template_data.movie.author.username for template_data in data]
+    assert len(authors) == len(movies) + 10
+
+
+@pytest.mark.django_db
+def test_render_movie_cards_from_cache(fake_users_with_movies):
+    """
+    Given two movies whose cards are already rendered
+    When we render the cards again
+    Then we expect the cards from the cache without any template rendering
+    """
+    # Given
+    users, _ = fake_users_with_movies
+    movies = Movie.objects.select_related("author").order_by("id")
+    first_cards = [
+        template_data.card
+        for template_data in render_movie_cards(get_template_data(movies, users[0]))
+    ]
+    # When
+    with patch("web_app.utils.render_to_string") as render:
+        data = render_movie_cards(get_template_data(movies, users[1]))
+    # Then
+    render.assert_not_called()
+    assert [template_data.card for template_data in data] == first_cards
+
+
+@pytest.mark.django_db
+def test_render_movie_cards_after_a_change(fake_users_with_movies):
+    """
+    Given two movies whose cards are already rendered
+    When the second movie gets a like and the first one a new title
+    Then we expect both cards to be rendered again with the new content
+    """
+    # Given
+    users, movies = fake_users_with_movies
+    first_movie, second_movie = movies
+    queryset = Movie.objects.select_related("author").order_by("id")
+    render_movie_cards(get_template_data(queryset, users[0]))
+    # When
+    set_reaction(second_movie.id, users[0].id, LIKE)
+    first_movie.title = "New title"
+    first_movie.save()
+    data = render_movie_cards(get_template_data(queryset, users[0]))
+    # Then
+    assert "New title" in data[0].card
+    assert "<strong>Likes:</strong> 1</p>" in data[1].card
+
+
+@pytest.mark.django_db
+def test_apply_queryset_filtering_by_decade(fake_users_with_movies, caplog):
+    """
+    Given two movies released in 2011 and 1999
+    When the user requests the movies of the 90s ordered by `released_date`
+    Then we're expecting only the movie released in 1999
+    """
+    # Given
+    caplog.clear()
+    _, movies = fake_users_with_movies
+    fake_request = RequestFactory().get("/?filter=released_date&decade=1990")
+    # When
+    movie_qs = apply_queryset_filtering(
+        request=fake_request, queryset=Movie.objects.get_queryset()
+    )
+    # Then
+    assert list(movie_qs) == [movies[1]]
+    assert "released year 1990-1999" in caplog.text
+
+
+@pytest.mark.django_db
+def test_apply_queryset_filtering_invalid_year(fake_users_with_movies, caplog):
+    """
+    Given two movies
+    When the user requests an invalid `year_min`
+    Then we're expecting all the movies
+    """
+    # Given
+    caplog.clear()
+    fake_request = RequestFactory().get("/?year_min=abc")
+    # When
+    movie_qs = apply_queryset_filtering(
+        request=fake_request, queryset=Movie.objects.get_queryset()
+    )
+    # Then
+    assert movie_qs.count() == 2
+    assert "Ignoring the release year filtering" in caplog.text
@@ -0,0 +1,83 @@
+"""
+Whole-page cache for the anonymous home page traffic.
+
+Every anonymous visitor gets the same page for the same query string,
+so the rendered page is cached under the catalog generation
+(see `movies.cache`) and the normalized query string. Expired entries
+are kept for a while and served to the other workers, while only the
+one holding the regeneration lock renders the page again.
+"""
+import hashlib
+import logging
+import time
+from typing import Callable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpRequest
+
+from movies.cache import get_catalog_generation
+
+logger = logging.getLogger(__name__)
+
+# seconds to wait for another worker rendering a page, before rendering it too
+LOCK_WAIT_TIMEOUT = 2
+LOCK_POLL_INTERVAL = 0.05
+
+
+def get_page_cache_key(request: HttpRequest) -> str:
+    """
+    Returns the cache key of the page for the `request`, made of the current
+    catalog generation and the query string without any ordering/blank
+    values differences
+    """
+    query = sorted(
+        (key, value)
+        for key, values in request.GET.lists()
+        for value in values
+        if value != ""
+    )
+    digest = hashlib.blake2b(repr(query).encode(), digest_size=16).hexdigest()
+    return f"home-page:{get_catalog_generation()}:{request.path}:{digest}"
+
+
+def get_or_render_page(key: str, render: Callable[[], bytes]) -> bytes:
+    """
+    Returns the cached page content under `key` or the content returned
+    from `render`, allowing only one worker at a time to regenerate
+    an expired or missing page
+    """
+    entry = cache.get(key)
+    if entry is not None and entry["expires"] > time.time():
+        return entry["content"]
+
+    lock_key = f"{key}:lock"
+    if cache.add(lock_key, 1, timeout=settings.HOME_PAGE_CACHE_LOCK_TIMEOUT):
+        try:
+            content = render()
+            cache.set(
+                key,
+                {
+                    "expires": time.time() + settings.HOME_PAGE_CACHE_TIMEOUT,
+                    "content": content,
+                },
+                # keep the expired page around for the other workers
+                timeout=settings.HOME_PAGE_CACHE_TIMEOUT * 2,
+            )
+        finally:
+            cache.delete(lock_key)
+        return content
+
+    if entry is not None:
+        logger.debug("Serving a stale page while %s is regenerated", key)
+        return entry["content"]
+
+    # the page of a new generation is being rendered from another worker
+    deadline = time.time() + LOCK_WAIT_TIMEOUT
+    while time.time() < deadline:
+        time.sleep(LOCK_POLL_INTERVAL)
+        entry = cache.get(key)
+        if entry is not None:
+            return entry["content"]
+    logger.debug("Gave up waiting for %s", key)
+    return render()
@@ -15,6 +15,4 @@ class MovieForm(ModelForm):  # pylint: disable=missing-class-docstring
         model = Movie
         exclude = [  # pylint: disable=modelform-uses-exclude
             "author",
-            "likes",
-            "dislikes",
         ]
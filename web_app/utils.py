@@ -1,12 +1,20 @@
 """Helper function for the web-app endpoints"""
+import hashlib
 import logging
 from dataclasses import dataclass
-from typing import List
+from typing import Iterable, List, Set, Tuple
 
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import QuerySet
 from django.http import HttpRequest
+from django.template.loader import render_to_string
+from django.utils.safestring import mark_safe
+from django.utils.timesince import timesince
 
 from accounts.models import CustomUser
-from movies.models import Movie
+from movies.filters import get_release_year_range
+from movies.models import Movie, Reaction
 from movies.movie_manager import MovieQuerySet
 
 logger = logging.getLogger(__name__)
@@ -19,6 +27,8 @@ class TemplateData:  # pylint: disable=missing-class-docstring
     allow_delete: bool = False
     allow_like: bool = False
     allow_dislike: bool = False
+    # the rendered user-independent part of the movie card
+    card: str = ""
 
 
 def apply_queryset_filtering(
@@ -27,7 +37,7 @@ def apply_queryset_filtering(
     """Apply user filtering based on the user requests"""
     movies = queryset.all().order_by("id")
     if request.GET.get("filter") == "date":
-        movies = queryset.all().order_by("created_date")
+        movies = queryset.all().order_by("created_date", "id")
 
     if request.GET.get("filter") == "released_date":
         movies = queryset.by_published_date()
@@ -49,21 +59,71 @@ def apply_queryset_filtering(
         author_id = request.GET.get("author")
         movies = queryset.by_author(author=CustomUser.objects.get(id=author_id))
         logger.debug("Filter by `author` with id: %s movies %s", author_id, movies)
+
+    try:
+        year_min, year_max = get_release_year_range(request.GET)
+    except ValueError as error:
+        logger.info("Ignoring the release year filtering due to: %s", error)
+    else:
+        if year_min is not None or year_max is not None:
+            movies = movies.released_between(year_min, year_max)
+            logger.debug("Filter by released year %s-%s", year_min, year_max)
+
+    genre = request.GET.get("genre")
+    if genre:
+        movies = movies.by_genre(genre)
+        logger.debug("Filter by `genre` %s", genre)
+
+    query = request.GET.get("q", "").strip()
+    if query:
+        # the most relevant movies first
+        movies = movies.search(query)
+        logger.debug("Search for %s", query)
     return movies
 
 
-def get_template_data(movies: MovieQuerySet, user: CustomUser) -> List[TemplateData]:
+def get_reaction_state(
+    movie_ids: Iterable[int], user: CustomUser
+) -> Tuple[Set[int], Set[int]]:
+    """
+    Returns the ids of the movies (from `movie_ids`) that the `user`
+    has liked and disliked, using one query
+    """
+    movie_ids = list(movie_ids)
+    liked_ids, disliked_ids = set(), set()
+    if not user.is_authenticated or not movie_ids:
+        return liked_ids, disliked_ids
+    reactions = Reaction.objects.filter(
+        user_id=user.id, movie_id__in=movie_ids
+    ).values_list("movie_id", "value")
+    for movie_id, value in reactions:
+        if value == Reaction.LIKE:
+            liked_ids.add(movie_id)
+        else:
+            disliked_ids.add(movie_id)
+    return liked_ids, disliked_ids
+
+
+def get_template_data(movies: Iterable[Movie], user: CustomUser) -> List[TemplateData]:
     """
     Helper function for determining if a user can `like/dislike` or
-    `edit/delete` a movie
+    `edit/delete` a movie.
+    The reaction state of the `user` is resolved for all the movies at once,
+    so the number of queries doesn't depend on the number of movies.
     """
+    if isinstance(movies, QuerySet):
+        movies = movies.select_related("author")
+    movies = list(movies)
+    liked_ids, disliked_ids = get_reaction_state(
+        movie_ids=[movie.id for movie in movies], user=user
+    )
     data = []
     for movie in movies:
         temp_data = TemplateData()
         temp_data.movie = movie
         data.append(temp_data)
         # author users can't like their own movie reviews
-        if movie.author.id == user.id:
+        if movie.author_id == user.id:
             # users can't add reaction on their movie reviews
             temp_data.allow_edit = True
             temp_data.allow_delete = True
@@ -71,11 +131,11 @@ def get_template_data(movies: MovieQuerySet, user: CustomUser) -> List[TemplateD
             temp_data.allow_like = None
             temp_data.allow_dislike = None
         # user has already liked the movie
-        elif user in movie.likes.all():
+        elif movie.id in liked_ids:
             temp_data.allow_like = False
             temp_data.allow_dislike = True
         # user has already dis-liked the movie
-        elif user in movie.dislikes.all():
+        elif movie.id in disliked_ids:
             temp_data.allow_like = True
             temp_data.allow_dislike = False
         else:
@@ -83,3 +143,43 @@ def get_template_data(movies: MovieQuerySet, user: CustomUser) -> List[TemplateD
             temp_data.allow_like = True
             temp_data.allow_dislike = True
     return data
+
+
+def get_card_cache_key(movie: Movie, age: str) -> str:
+    """
+    Returns the cache key of the rendered card of the `movie`.
+    The version changes whenever the movie is edited, gets a reaction
+    or the displayed `age` changes, so stale cards are never served.
+    """
+    version = hashlib.blake2b(
+        f"{movie.updated_date.isoformat()}:{movie.likes_count}:"
+        f"{movie.dislikes_count}:{movie.author.username}:{age}".encode(),
+        digest_size=16,
+    ).hexdigest()
+    return f"movie-card:{movie.id}:{version}"
+
+
+def render_movie_cards(data: List[TemplateData]) -> List[TemplateData]:
+    """
+    Helper function for filling in the user-independent part of every
+    movie card from the fragment cache, rendering (and caching) only
+    the missing ones
+    """
+    keys = {}
+    for template_data in data:
+        age = timesince(template_data.movie.created_date)
+        keys[get_card_cache_key(template_data.movie, age)] = (template_data, age)
+    cached_cards = cache.get_many(keys.keys())
+    missing_cards = {}
+    for key, (template_data, age) in keys.items():
+        card = cached_cards.get(key)
+        if card is None:
+            card = render_to_string(
+                "movies/card.html", {"movie": template_data.movie, "age": age}
+            )
+            missing_cards[key] = card
+        template_data.card = mark_safe(card)  # nosec: rendered by our template
+    if missing_cards:
+        logger.debug("Rendered %d movie cards", len(missing_cards))
+        cache.set_many(missing_cards, timeout=settings.MOVIE_CARD_CACHE_TIMEOUT)
+    return data
@@ -7,26 +7,65 @@ Web-app views using the `Movie` model for:
 5) add likes to a movie review: `like_movie`
 6) add dislikes to a movie review: `dislike_movie`
 """
+import datetime
 import logging
+from typing import Optional
 
+from django.conf import settings
 from django.contrib.auth.decorators import login_required
-from django.http import HttpRequest, HttpResponse
+from django.core.exceptions import PermissionDenied
+from django.http import Http404, HttpRequest, HttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
+from django.utils import timezone
+from django.utils.decorators import method_decorator
 from django.views import generic
+from django.views.decorators.http import condition
 
-from accounts.models import CustomUser
+from movies.cache import invalidate_catalog
+from movies.conditional import catalog_last_modified, make_etag
+from movies.genres import get_genre_facets, sync_movie_genres
 from movies.models import Movie
+from movies.pagination import InvalidCursor, paginate_keyset
+from movies.reactions import DISLIKE, LIKE, ReactionChange, toggle_reaction
 
+from .cache import get_or_render_page, get_page_cache_key
 from .forms import MovieForm
-from .utils import apply_queryset_filtering, get_template_data
+from .utils import apply_queryset_filtering, get_template_data, render_movie_cards
 
 # Get an instance of a logger
 logger = logging.getLogger(__name__)
 
 
+def home_page_etag(request: HttpRequest, *args, **kwargs) -> str:
+    """
+    The `ETag` of the home page: the pages of the users show their
+    reactions and embed their CSRF token, so these are part of it
+    """
+    identity = ["anonymous"]
+    if request.user.is_authenticated:
+        identity = [request.user.pk, request.COOKIES.get(settings.CSRF_COOKIE_NAME)]
+    return make_etag(catalog_last_modified(request), request.get_full_path(), *identity)
+
+
+def home_page_last_modified(
+    request: HttpRequest, *args, **kwargs
+) -> Optional[datetime.datetime]:
+    """Only the pages of the anonymous users are validated by date"""
+    if request.user.is_authenticated:
+        return None
+    return catalog_last_modified(request)
+
+
+@method_decorator(
+    condition(etag_func=home_page_etag, last_modified_func=home_page_last_modified),
+    name="get",
+)
 class HomePageView(generic.ListView):
     """
-    Class based view for listing all movie reviews.
+    Class based view for listing all movie reviews,
+    one keyset page (`?cursor=`) at a time.
+    The pages of the anonymous users are served from the page cache
+    and every page answers the conditional requests with a `304`.
     """
 
     template_name = "movies/home.html"
@@ -34,6 +73,21 @@ class HomePageView(generic.ListView):
     # context_object_name = "movies-list"
     queryset = Movie.objects.all()
 
+    def get(self, request, *args, **kwargs):
+        if request.user.is_authenticated:
+            return super().get(request, *args, **kwargs)
+
+        response = None
+
+        def render() -> bytes:
+            nonlocal response
+            response = super(HomePageView, self).get(request, *args, **kwargs)
+            return response.render().content
+
+        content = get_or_render_page(get_page_cache_key(request), render)
+        # a cache miss returns the rendered response itself
+        return response if response is not None else HttpResponse(content)
+
     def get_context_data(self, **kwargs):
         """
         Specify the `context/template` data based on
@@ -43,7 +97,22 @@ class HomePageView(generic.ListView):
         context = super().get_context_data(**kwargs)
         # First, specify the movies query set
         movies = apply_queryset_filtering(request=self.request, queryset=self.queryset)
-        context["data"] = get_template_data(movies, self.request.user)
+        try:
+            page = paginate_keyset(
+                movies.select_related("author"),
+                cursor=self.request.GET.get("cursor"),
+                page_size=settings.MOVIES_PAGE_SIZE,
+            )
+        except InvalidCursor as error:
+            raise Http404("Invalid cursor") from error
+        context["genres"] = get_genre_facets(limit=settings.GENRE_FACETS_SIZE)
+        context["data"] = render_movie_cards(
+            get_template_data(page.items, self.request.user)
+        )
+        if page.next_cursor:
+            query = self.request.GET.copy()
+            query["cursor"] = page.next_cursor
+            context["next_page_query"] = query.urlencode()
         return context
 
 
@@ -90,13 +159,20 @@ def update_movie(request: HttpRequest, id: int) -> HttpResponse:
             request.POST, request.FILES, author=request.user, instance=movie
         )
         if form.is_valid():
+            now = timezone.now()
             Movie.objects.filter(id=movie.id).update(
                 author=form.author,
                 title=form.cleaned_data["title"],
                 desc=form.cleaned_data["desc"],
                 genre=form.cleaned_data["genre"],
                 year=form.cleaned_data["year"],
+                # `update` doesn't apply `auto_now`
+                updated_date=now,
+                changed_at=now,
             )
+            # neither sends the `post_save` signal
+            sync_movie_genres({movie.id: form.cleaned_data["genre"]})
+            invalidate_catalog()
             if request.FILES.get("cover"):
                 movie = Movie.objects.get(id=movie.id)
                 movie.cover = request.FILES["cover"]
@@ -133,47 +209,34 @@ def delete_movie(request: HttpRequest, id: int) -> HttpResponse:
     return render(request, "movies/delete.html", context)
 
 
+def _react(request: HttpRequest, id: int, value: int) -> ReactionChange:
+    """
+    Helper function for toggling the `value` reaction of the user on the movie
+    """
+    try:
+        return toggle_reaction(movie_id=id, user_id=request.user.id, value=value)
+    except Movie.DoesNotExist as error:
+        raise Http404("No Movie matches the given query.") from error
+
+
 @login_required(login_url="/accounts/login/")
 def like_movie(request: HttpRequest, id: int) -> HttpResponse:
     """
     Like function view for handling likes from users for one movie.
     """
-    movie = get_object_or_404(Movie, id=id)
-
-    if request.user == movie.author:
-        return HttpResponse("Unauthorized", status=401)
-
     if request.method == "POST":
-        user = CustomUser.objects.filter(pk=request.user.id)
-        if user.exists():
-            user = user.first()
-            # Many-to-Many it's a set
-            # user liked this movie review
-            # revert it
-            if user in movie.likes.all():
-                movie.likes.remove(user)
-                logger.info(
-                    "Revert like from user: %s for movie %s",
-                    request.user.id,
-                    movie.id,
-                )
-                return redirect("home")
-
-            if user not in movie.likes.all():
-                movie.likes.add(user)
-                logger.info(
-                    "Added a like from user: %s to movie %s",
-                    request.user.id,
-                    movie.id,
-                )
-            if user in movie.dislikes.all():
-                movie.dislikes.remove(user)
-                logger.info(
-                    "User %s likes movie %s, deleted the dislike",
-                    request.user.id,
-                    movie.id,
-                )
-            movie.save()
+        try:
+            toggle = _react(request, id, LIKE)
+        except PermissionDenied:
+            return HttpResponse("Unauthorized", status=401)
+        if not toggle.added:
+            logger.info("Revert like from user: %s for movie %s", request.user.id, id)
+        else:
+            logger.info("Added a like from user: %s to movie %s", request.user.id, id)
+        if toggle.replaced:
+            logger.info(
+                "User %s likes movie %s, deleted the dislike", request.user.id, id
+            )
     # go to home page in any case
     return redirect("home")
 
@@ -183,39 +246,22 @@ def dislike_movie(request: HttpRequest, id: int) -> HttpResponse:
     """
     Dislike function view for handling dislikes from users for one movie.
     """
-    movie = get_object_or_404(Movie, id=id)
-
-    if request.user == movie.author:
-        return HttpResponse("Unauthorized", status=401)
-
     if request.method == "POST":
-        user = CustomUser.objects.filter(pk=request.user.id)
-        if user.exists():
-            user = user.first()
-            if user in movie.dislikes.all():
-                logger.info(
-                    "Reverted dislike from user: %s for movie %s",
-                    request.user.id,
-                    movie.id,
-                )
-                movie.dislikes.remove(user)
-                return redirect("home")
-
-            if user not in movie.dislikes.all():
-                logger.info(
-                    "Added a dislike from user: %s to movie %s",
-                    request.user.id,
-                    movie.id,
-                )
-                movie.dislikes.add(user)
-
-            if user in movie.likes.all():
-                movie.likes.remove(user)
-                logger.info(
-                    "User %s dislike movie %s, deleted the like",
-                    request.user.id,
-                    movie.id,
-                )
-            movie.save()
+        try:
+            toggle = _react(request, id, DISLIKE)
+        except PermissionDenied:
+            return HttpResponse("Unauthorized", status=401)
+        if not toggle.added:
+            logger.info(
+                "Reverted dislike from user: %s for movie %s", request.user.id, id
+            )
+        else:
+            logger.info(
+                "Added a dislike from user: %s to movie %s", request.user.id, id
+            )
+        if toggle.replaced:
+            logger.info(
+                "User %s dislike movie %s, deleted the like", request.user.id, id
+            )
     # go to home page in any case
     return redirect("home")